@@ -0,0 +1,215 @@
+# -*- coding: utf-8 -*-
+
+"""
+Python "Batch Rank" file.
+
+This file will facilitate a command-line application that will calculate the ranking tables for many soccer league
+results files in one go.
+
+
+Input/output
+------------
+Input is any mix of results files, directories (every file matching the given pattern is used) and glob patterns.
+Each results file goes through the exact same pipeline as "calculate_rank.py" and the ranking is written next to its
+input file.
+
+Files are spread over a pool of worker processes. Interpreter and argument parsing start-up costs are thus paid once
+per batch rather than once per file. A file that fails (empty, unreadable, badly formed...) is reported in the summary
+at the end but does not stop the rest of the batch.
+
+"""
+
+import argparse
+import glob
+import multiprocessing
+import os
+import sys
+import time
+
+import calculate_rank
+from calculate_rank import InputPath
+
+
+# Same default output name as the single file command.
+DEFAULT_RESULT_NAME = "rank_results.txt"
+DEFAULT_PATTERN = "*.txt"
+
+
+def _output_name(template, full_path):
+    """
+    Resolve the output file name for a given input file.
+
+    :param template:    Output name. May contain a "{stem}" token which is replaced with the input file's name,
+                        without extension. Useful when several results files share a directory.
+    :param full_path:   Full file path of the results file.
+
+    :return: Output file name (no directory).
+    """
+
+    stem = os.path.splitext(os.path.basename(full_path))[0]
+    return template.replace("{stem}", stem)
+
+
+def _find_files(paths, pattern, final_name):
+    """
+    Expand the given files, directories and glob patterns into a sorted list of full results file paths.
+
+    :param paths:       Iterable of files, directories or glob patterns.
+    :param pattern:     Glob pattern used to select files within given directories.
+    :param final_name:  Output name template. Earlier ranking outputs found in directories are skipped.
+
+    :return: List of unique full file paths.
+    """
+
+    found = set()
+    explicit = set()
+    for path in paths:
+        if os.path.isdir(path):
+            candidates = glob.glob(os.path.join(path, pattern))
+        elif os.path.isfile(path):
+            explicit.add(os.path.abspath(path))
+            continue
+        else:
+            candidates = glob.glob(path)
+
+        for candidate in candidates:
+            if os.path.isfile(candidate):
+                found.add(os.path.abspath(candidate))
+
+    # Do not rank our own previous outputs when a directory is scanned a second time...
+    outputs = set(
+        os.path.join(os.path.dirname(full_path), _output_name(final_name, full_path)) for full_path in found
+    )
+
+    return sorted((found - outputs) | explicit)
+
+
+def _rank_one(job):
+    """
+    Worker function: rank a single results file, never raising.
+
+    :param job: Tuple of (full file path, output file name, pipeline options dictionary).
+
+    :return: Tuple of (full file path, seconds taken, error message or None).
+    """
+
+    full_path, final_name, options = job
+    start = time.time()
+    try:
+        calculate_rank.rank_file(full_path, final_name, **options)
+        error = None
+    except Exception as exception:
+        # One bad file must not take the batch down with it. Report and move along.
+        error = "{}: {}".format(type(exception).__name__, exception)
+
+    return full_path, time.time() - start, error
+
+
+def calculate_batch(paths, final_name=DEFAULT_RESULT_NAME, workers=None, pattern=DEFAULT_PATTERN, **options):
+    """
+    Rank every results file found in the given paths, spreading the work over a pool of processes.
+
+    :param paths:       Iterable of files, directories or glob patterns.
+    :param final_name:  Output name template (see "_output_name"). Written next to each input file.
+    :param workers:     Number of worker processes. Defaults to the number of CPUs. A single worker runs in-process.
+    :param pattern:     Glob pattern used to select files within given directories.
+    :param options:     Pipeline options handed to "calculate_rank.rank_file" for each file.
+
+    :return: List of (full file path, seconds taken, error message or None) tuples, sorted by file path.
+    """
+
+    files = _find_files(paths, pattern, final_name)
+
+    # Two inputs writing the same output file would silently clobber each other. Rather stop before we start.
+    outputs = {}
+    for full_path in files:
+        output = os.path.join(os.path.dirname(full_path), _output_name(final_name, full_path))
+        if output in outputs:
+            raise InputPath("Both {} and {} would write to {}. Perhaps use a '{{stem}}' output name?".format(
+                outputs[output], full_path, output))
+        outputs[output] = full_path
+
+    jobs = [(full_path, _output_name(final_name, full_path), options) for full_path in files]
+
+    if workers == 1 or len(jobs) <= 1:
+        return [_rank_one(job) for job in jobs]
+
+    pool = multiprocessing.Pool(workers)
+    try:
+        # Small chunks keep the workers evenly loaded when file sizes vary a lot.
+        results = pool.map(_rank_one, jobs, chunksize=1)
+    finally:
+        pool.close()
+        pool.join()
+
+    return results
+
+
+def _summarise(results, total_time, stream=sys.stdout):
+    """
+    Write a per-file timing and error summary for a batch run.
+
+    :param results:     List of (full file path, seconds taken, error message or None) tuples.
+    :param total_time:  Wall clock seconds for the whole batch.
+    :param stream:      File-like object to write the summary to.
+
+    :return: Number of files that failed.
+    """
+
+    failures = 0
+    for full_path, seconds, error in results:
+        if error is None:
+            stream.write("OK     {:8.3f}s  {}\n".format(seconds, full_path))
+        else:
+            failures += 1
+            stream.write("FAILED {:8.3f}s  {} ({})\n".format(seconds, full_path, error))
+
+    stream.write("{} file(s) ranked, {} failed, {:.3f}s total\n".format(
+        len(results) - failures, failures, total_time))
+
+    return failures
+
+
+def _get_batch_params(argv=None):
+    """
+    Get the batch parameters from the command line.
+
+    :param argv: Optional argument list. Defaults to the process arguments.
+
+    :return: argparse namespace with all batch options.
+    """
+
+    parser = argparse.ArgumentParser(
+        description='This script will calculate rank results for many match results files in one go.')
+
+    parser.add_argument(
+        'paths', nargs='+', help='Results files, directories or (quoted) glob patterns')
+    parser.add_argument(
+        '-w', '--workers', type=int, default=None, help='Number of worker processes (default: number of CPUs)')
+    parser.add_argument(
+        '-p', '--pattern', type=str, default=DEFAULT_PATTERN,
+        help='File pattern used within directories (default: {})'.format(DEFAULT_PATTERN))
+    parser.add_argument(
+        '-o', '--output-name', type=str, default=DEFAULT_RESULT_NAME,
+        help='Output file name, written next to each input. "{stem}" is replaced with the input file name.')
+    parser.add_argument(
+        '-s', '--stream', action='store_true',
+        help='Stream results from file in chunks instead of reading the whole file into memory first')
+    parser.add_argument(
+        '-t', '--top-n', type=int, default=None,
+        help='Only write the top N positions of each table (teams tied at position N are all included)')
+
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    args = _get_batch_params()
+
+    batch_start = time.time()
+    batch_results = calculate_batch(
+        args.paths, final_name=args.output_name, workers=args.workers, pattern=args.pattern,
+        stream=args.stream, top_n=args.top_n)
+
+    failed = _summarise(batch_results, time.time() - batch_start)
+
+    sys.exit(1 if failed else 0)
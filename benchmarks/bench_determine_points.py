@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+
+"""
+Micro-benchmark for the "_determine_points" line parser.
+
+Compares the original "split / join" based implementation (kept here, verbatim in behaviour, purely as a reference)
+with the current "partition" based parser in calculate_rank.py and reports lines per second for both.
+
+Usage:
+    python benchmarks/bench_determine_points.py [-n LINES] [-r REPEATS]
+"""
+
+import argparse
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import calculate_rank  # noqa: E402
+from generate_fixture import generate_lines  # noqa: E402
+
+
+def _legacy_determine_points(results):
+    """
+    The original implementation of "_determine_points". Used as the "before" number only.
+    Note that it compares scores as strings.
+    """
+    match_points = {}
+
+    for result in results:
+        split_results = result.split(", ")
+        team_1_split = split_results[0].split(" ")
+        team_2_split = split_results[1].split(" ")
+
+        team_1_data = [" ".join(team_1_split[0:-1]), team_1_split[-1]]
+        team_2_data = [" ".join(team_2_split[0:-1]), team_2_split[-1]]
+
+        if team_1_data[-1] > team_2_data[-1]:
+            if team_1_data[0] not in match_points:
+                match_points[team_1_data[0]] = 3
+            else:
+                match_points[team_1_data[0]] += 3
+            if team_2_data[0] not in match_points:
+                match_points[team_2_data[0]] = 0
+
+        elif team_2_data[-1] > team_1_data[-1]:
+            if team_2_data[0] not in match_points:
+                match_points[team_2_data[0]] = 3
+            else:
+                match_points[team_2_data[0]] += 3
+            if team_1_data[0] not in match_points:
+                match_points[team_1_data[0]] = 0
+
+        else:
+            if team_1_data[0] not in match_points:
+                match_points[team_1_data[0]] = 1
+            else:
+                match_points[team_1_data[0]] += 1
+
+            if team_2_data[0] not in match_points:
+                match_points[team_2_data[0]] = 1
+            else:
+                match_points[team_2_data[0]] += 1
+
+    return match_points
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the match result parser, before and after.')
+    parser.add_argument('-n', '--lines', type=int, default=200000, help='Number of match lines to parse')
+    parser.add_argument('-r', '--repeats', type=int, default=5, help='Number of timing repeats (best is reported)')
+    args = parser.parse_args()
+
+    lines = list(generate_lines(args.lines))
+
+    for label, function in (('before (split/join)', _legacy_determine_points),
+                            ('after (partition)', calculate_rank._determine_points)):
+        best = min(timeit.repeat(lambda: function(lines), number=1, repeat=args.repeats))
+        print("{:<22} {:>12,.0f} lines/sec".format(label, args.lines / best))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark harness for the ranking pipeline.
+
+Generates a synthetic league (see generate_fixture.py), then times every pipeline stage - "_read_file",
+"_determine_points", "_sort_results" and "_write_file" - and the end-to-end "rank_file" for each engine asked for.
+Results are reported as JSON, so runs can be stored and compared to catch regressions.
+
+Reported per engine:
+- Per stage: best wall time over the repeats (seconds) and lines/sec where lines are involved.
+- End-to-end: best wall time and lines/sec.
+- Peak RSS of the benchmark process (KB) after each stage. The peak only ever grows, so the stage where it jumps is
+  the one that needed the memory.
+
+Usage:
+    python benchmarks/bench_pipeline.py [-m MATCHES] [-t TEAMS] [-r REPEATS] [-e ENGINE ...] [-o results.json]
+"""
+
+import argparse
+import json
+import os
+import platform
+import resource
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import calculate_rank  # noqa: E402
+from generate_fixture import write_fixture  # noqa: E402
+
+
+def _peak_rss_kb():
+    # Linux reports kilobytes, macOS bytes.
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+
+def _best_time(function, repeats):
+    """
+    Run "function" "repeats" times.
+
+    :return: Tuple of (best wall time in seconds, return value of the last run).
+    """
+
+    best = None
+    result = None
+    for _ in range(repeats):
+        start = time.time()
+        result = function()
+        elapsed = time.time() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def _engine_functions(engine):
+    # Points and sort functions of an engine, as "rank_file" uses them.
+    if engine == 'numpy':
+        import numpy_engine
+        return numpy_engine.determine_points, numpy_engine.sort_results
+    if engine == 'compact':
+        return calculate_rank._determine_team_points, calculate_rank._sort_results
+    return calculate_rank._determine_points, calculate_rank._sort_results
+
+
+def benchmark(filename, matches, engine, repeats, work_dir):
+    """
+    Benchmark all stages, and the whole pipeline, for one engine.
+
+    :return: Dictionary of measurements.
+    """
+
+    determine_points, sort_results = _engine_functions(engine)
+    output = os.path.join(work_dir, "rank_results.txt")
+    stages = {}
+
+    read_time, results = _best_time(lambda: calculate_rank._read_file(filename), repeats)
+    stages['read_file'] = {'seconds': read_time, 'lines_per_sec': matches / read_time,
+                           'peak_rss_kb': _peak_rss_kb()}
+
+    points_time, points = _best_time(lambda: determine_points(results), repeats)
+    stages['determine_points'] = {'seconds': points_time, 'lines_per_sec': matches / points_time,
+                                  'peak_rss_kb': _peak_rss_kb()}
+
+    sort_time, ranking = _best_time(lambda: sort_results(points), repeats)
+    stages['sort_results'] = {'seconds': sort_time, 'teams': len(ranking), 'peak_rss_kb': _peak_rss_kb()}
+
+    write_time, _ = _best_time(lambda: calculate_rank._write_file(output, ranking), repeats)
+    stages['write_file'] = {'seconds': write_time, 'bytes': os.path.getsize(output), 'peak_rss_kb': _peak_rss_kb()}
+
+    total_time, _ = _best_time(
+        lambda: calculate_rank.rank_file(filename, "rank_results.txt", engine=engine), repeats)
+
+    return {
+        'engine': engine,
+        'stages': stages,
+        'end_to_end': {'seconds': total_time, 'lines_per_sec': matches / total_time, 'peak_rss_kb': _peak_rss_kb()}
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the ranking pipeline stages on a synthetic league.')
+    parser.add_argument('-m', '--matches', type=int, default=200000, help='Number of match results')
+    parser.add_argument('-t', '--teams', type=int, default=2000, help='Number of teams')
+    parser.add_argument('-r', '--repeats', type=int, default=3, help='Timing repeats per stage (best is reported)')
+    parser.add_argument('-e', '--engine', action='append', choices=calculate_rank.ENGINES,
+                        help='Engine to benchmark. Can be given more than once (default: python)')
+    parser.add_argument('-o', '--output', type=str, default=None, help='Write the JSON report here, not to stdout')
+    args = parser.parse_args()
+
+    work_dir = tempfile.mkdtemp()
+    try:
+        filename = os.path.join(work_dir, "league.txt")
+        size = write_fixture(filename, args.matches, args.teams)
+
+        report = {
+            'python': platform.python_version(),
+            'implementation': platform.python_implementation(),
+            'matches': args.matches,
+            'teams': args.teams,
+            'input_bytes': size,
+            'repeats': args.repeats,
+            'engines': [
+                benchmark(filename, args.matches, engine, args.repeats, work_dir)
+                for engine in (args.engine or ['python'])
+            ]
+        }
+    finally:
+        shutil.rmtree(work_dir)
+
+    text = json.dumps(report, indent=2, sort_keys=True)
+    if args.output:
+        with open(args.output, 'w') as output_file:
+            output_file.write(text + "\n")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+
+"""
+Start-up benchmark for the command-line entry point.
+
+Ranks a small league file with a fresh interpreter many times and reports the best and median wall time per run - on
+small files that is almost all interpreter start-up and imports. Compares:
+
+- "fast path":     "calculate_rank.py -f <file>", which skips argparse.
+- "argparse path": the same run with an (default valued) extra option, which needs argparse.
+- "before":        optionally, the plain "-f <file>" run of an older git revision (for example the one before lazy
+                   imports), extracted to a temporary directory with "git archive".
+
+On Python 3.7+ the heaviest imports of the fast path are listed too, as measured by "-X importtime".
+
+Usage:
+    python benchmarks/bench_startup.py [-n RUNS] [--before REVISION] [--top MODULES]
+"""
+
+import argparse
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _time_runs(command, runs, cwd):
+    """
+    :return: Tuple of (best, median) wall time in milliseconds over "runs" runs of "command".
+    """
+
+    timings = []
+    with open(os.devnull, 'w') as devnull:
+        for _ in range(runs):
+            start = time.time()
+            subprocess.check_call(command, cwd=cwd, stdout=devnull, stderr=devnull)
+            timings.append((time.time() - start) * 1000)
+    timings.sort()
+    return timings[0], timings[len(timings) // 2]
+
+
+def _import_times(script, results_file, top):
+    """
+    :return: List of (cumulative microseconds, module) of the "top" heaviest imports. Empty before Python 3.7.
+    """
+
+    if sys.version_info < (3, 7):
+        return []
+
+    process = subprocess.Popen(
+        [sys.executable, '-X', 'importtime', script, '-f', results_file],
+        stdout=subprocess.PIPE, stderr=subprocess.PIPE, cwd=os.path.dirname(script))
+    _, errors = process.communicate()
+
+    imports = []
+    for line in errors.decode('utf-8').splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, module = line.split('|')
+        imports.append((int(cumulative), module.strip()))
+
+    imports.sort(reverse=True)
+    return imports[:top]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark cold start time of calculate_rank.py on a small file.')
+    parser.add_argument('-n', '--runs', type=int, default=30, help='Runs per variant (best and median are reported)')
+    parser.add_argument('--before', type=str, default=None, help='Git revision to compare against, e.g. HEAD~1')
+    parser.add_argument('--top', type=int, default=10, help='Number of heaviest imports to list')
+    args = parser.parse_args()
+
+    work_dir = tempfile.mkdtemp()
+    try:
+        results_file = os.path.join(work_dir, "league.txt")
+        with open(results_file, 'w') as output_file:
+            output_file.write('Lions 3, Snakes 3\nTarantulas 1, FC Awesome 0\nLions 1, FC Awesome 1\n'
+                              'Tarantulas 3, Snakes 1\nLions 4, Grouches 0\n')
+
+        script = os.path.join(ROOT, 'calculate_rank.py')
+        variants = [
+            ('fast path', [sys.executable, script, '-f', results_file], ROOT),
+            ('argparse path', [sys.executable, script, '-f', results_file, '--engine', 'python'], ROOT),
+        ]
+
+        if args.before:
+            before_dir = os.path.join(work_dir, 'before')
+            os.mkdir(before_dir)
+            archive = subprocess.Popen(['git', 'archive', args.before], cwd=ROOT, stdout=subprocess.PIPE)
+            subprocess.check_call(['tar', '-x', '-C', before_dir], stdin=archive.stdout)
+            archive.wait()
+            variants.append(('before ({})'.format(args.before),
+                             [sys.executable, os.path.join(before_dir, 'calculate_rank.py'), '-f', results_file],
+                             before_dir))
+
+        print("Python {}, {} runs per variant".format(sys.version.split()[0], args.runs))
+        for label, command, cwd in variants:
+            best, median = _time_runs(command, args.runs, cwd)
+            print("{:<24} best {:8.2f} ms   median {:8.2f} ms".format(label, best, median))
+
+        imports = _import_times(script, results_file, args.top)
+        if imports:
+            print("\nHeaviest imports (fast path, cumulative):")
+            for cumulative, module in imports:
+                print("{:>10.2f} ms  {}".format(cumulative / 1000.0, module))
+    finally:
+        shutil.rmtree(work_dir)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+
+"""
+Synthetic league generator for benchmarks.
+
+Writes a results file in the input format of calculate_rank.py. Team names contain spaces (and digits), and scores go
+into double figures, so the parser's harder paths are exercised too.
+
+Usage:
+    python benchmarks/generate_fixture.py -o /tmp/league.txt [-t TEAMS] [-m MATCHES] [--max-goals GOALS] [--seed SEED]
+"""
+
+import argparse
+import random
+
+
+# A few building blocks, so that generated names look (a bit) like real club names, spaces and all.
+_PREFIXES = ("FC", "AC", "Real", "Sporting", "United", "Athletic", "Racing", "Dynamo")
+_PLACES = ("North", "South", "East", "West", "Harbour", "Valley", "Hill", "River", "Lake", "Park")
+
+
+def team_names(teams, seed=42):
+    """
+    Build "teams" unique team names.
+
+    :param teams:   Number of teams.
+    :param seed:    Random seed, so the same arguments always give the same names.
+
+    :return: List of team names.
+    """
+
+    generator = random.Random(seed)
+    return [
+        "{} {} {}".format(generator.choice(_PREFIXES), generator.choice(_PLACES), number)
+        for number in range(teams)
+    ]
+
+
+def generate_lines(matches, teams=200, max_goals=12, seed=42):
+    """
+    Generate match result lines.
+
+    :param matches:     Number of match results.
+    :param teams:       Number of teams in the league.
+    :param max_goals:   Highest score a team can have in a match.
+    :param seed:        Random seed, so the same arguments always give the same results.
+
+    :return: Generator of match result strings.
+    """
+
+    generator = random.Random(seed)
+    names = team_names(teams, seed)
+    randint = generator.randint
+    for _ in range(matches):
+        home, away = generator.sample(names, 2)
+        yield "{} {}, {} {}".format(home, randint(0, max_goals), away, randint(0, max_goals))
+
+
+def write_fixture(filename, matches, teams=200, max_goals=12, seed=42):
+    """
+    Write a synthetic results file.
+
+    :param filename:    Full file path to write.
+    :param matches:     Number of match results.
+    :param teams:       Number of teams in the league.
+    :param max_goals:   Highest score a team can have in a match.
+    :param seed:        Random seed.
+
+    :return: Number of bytes written.
+    """
+
+    written = 0
+    with open(filename, 'w') as output_file:
+        for line in generate_lines(matches, teams, max_goals, seed):
+            output_file.write(line + "\n")
+            written += len(line) + 1
+    return written
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Generate a synthetic league results file.')
+    parser.add_argument('-o', '--output', type=str, required=True, help='Results file to write')
+    parser.add_argument('-t', '--teams', type=int, default=200, help='Number of teams')
+    parser.add_argument('-m', '--matches', type=int, default=100000, help='Number of match results')
+    parser.add_argument('--max-goals', type=int, default=12, help='Highest score per team per match')
+    parser.add_argument('--seed', type=int, default=42, help='Random seed')
+    args = parser.parse_args()
+
+    write_fixture(args.output, args.matches, args.teams, args.max_goals, args.seed)
+
+
+if __name__ == "__main__":
+    main()
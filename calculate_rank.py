@@ -28,9 +28,65 @@ order. It does not donate a "better" performance in a tie event.
 
 # We want to use a good sorting algorithm (for insertions) so make use of Python's "heapq" library. Don't reinvent
 # the wheel....
+#
+# Start-up time matters for the many small, one file runs. Modules only some paths need ("argparse",
+# "multiprocessing", "hashlib", the compression modules, the cache and the stats) are therefore imported where they
+# are used, not here.
 import heapq
 import os
-import argparse
+import sys
+from array import array
+from itertools import chain, islice
+
+
+# Approximate number of bytes worth of lines pulled from disk at a time when streaming results.
+STREAM_CHUNK_SIZE = 1024 * 1024
+
+# Sharded (parallel) aggregation: never bother a worker with less than this many bytes, and hand each worker a few
+# shards so that an unlucky slow shard does not leave the other workers idle.
+MIN_SHARD_SIZE = 4 * 1024 * 1024
+SHARDS_PER_WORKER = 4
+
+# Incremental ranking: the state file lives next to the results file, with this suffix. The fingerprint covers this
+# many bytes at the start and at the end of the consumed input.
+STATE_SUFFIX = ".state"
+STATE_HEADER = "ranker-state 1"
+FINGERPRINT_SIZE = 4096
+
+# Output is written in batches of this many lines, through a file buffer of this many bytes.
+WRITE_BATCH_LINES = 4096
+WRITE_BUFFER_SIZE = 1024 * 1024
+
+# Results files are read and rankings written as UTF-8, whatever the locale of the machine says.
+ENCODING = 'utf-8'
+
+# Binary results files (see "rank_binary") start with these bytes. No UTF-8 text can start with the first one.
+BINARY_MAGIC = b"\x89RNK"
+
+# Compressed results files are recognised by their first bytes. Compression name (also the file suffix) to magic bytes
+# and the module that reads and writes it.
+COMPRESSIONS = {
+    'gz': (b"\x1f\x8b", 'gzip'),
+    'bz2': (b"BZh", 'bz2'),
+    'xz': (b"\xfd7zXZ\x00", 'lzma')
+}
+
+# Keys "_rank_results" can rank teams by, most important first. The default is points, then alphabetical.
+TIEBREAKERS = ('points', 'goal_difference', 'goals_for', 'name')
+DEFAULT_TIEBREAKERS = ('points', 'name')
+
+# Output formats "rank_file" can write, see "RENDERERS". CSV and JSON lines name their fields as below.
+OUTPUT_FORMATS = ('text', 'csv', 'jsonl')
+RANKING_FIELDS = ('rank', 'team', 'points')
+RECORD_FIELDS = ('won', 'drawn', 'lost', 'goals_for', 'goals_against', 'goal_difference')
+
+# Follow mode (see "rank_follow"): seconds between polls of the results file, and seconds it must be quiet for before
+# appended lines are ranked.
+FOLLOW_POLL_INTERVAL = 1.0
+FOLLOW_DEBOUNCE = 2.0
+
+# Points engines available to "rank_file". See "_determine_points", "_determine_team_points" and "numpy_engine".
+ENGINES = ('python', 'compact', 'numpy')
 
 
 class InputPath(Exception):
@@ -45,76 +101,642 @@ class EmptyResults(Exception):
     """
 
 
-def _determine_points(results):
+class MatchdayRange(ValueError):
+    """
+    Exception that is raised if the matchdays asked for are not in the results file.
+    """
+
+
+class MatchResult(object):
+    """
+    A single parsed match result, see "_parse_match". Goals are integers.
+
+    The points engines do not build one of these per line. On large files creating the record alone costs more than
+    scoring the match, so they unpack the plain tuple of "_parse_result" instead. Records are for code that handles
+    results one at a time, like the ranking server. (Not a "dataclass" - importing that module alone would double the
+    start-up time of a small run.)
+    """
+
+    __slots__ = ('home_team', 'home_goals', 'away_team', 'away_goals')
+
+    def __init__(self, home_team, home_goals, away_team, away_goals):
+        self.home_team = home_team
+        self.home_goals = home_goals
+        self.away_team = away_team
+        self.away_goals = away_goals
+
+    def __eq__(self, other):
+        if not isinstance(other, MatchResult):
+            return NotImplemented
+        return (self.home_team, self.home_goals, self.away_team, self.away_goals) == \
+            (other.home_team, other.home_goals, other.away_team, other.away_goals)
+
+    def __repr__(self):
+        return "MatchResult({!r}, {}, {!r}, {})".format(
+            self.home_team, self.home_goals, self.away_team, self.away_goals)
+
+
+class TeamRegistry(object):
+    """
+    Compact points table. Every team name is interned once and given a dense integer ID. Points are kept in an
+    array indexed by that ID rather than in a dictionary of names, which keeps both the memory use and the hashing
+    down on huge files.
+
+    Names are only resolved again when the table is iterated, for example by "_sort_results". Iteration is
+    dictionary like ("items") so the registry can be used wherever a points dictionary is expected.
+    """
+
+    __slots__ = ('ids', 'names', 'points')
+
+    def __init__(self):
+        self.ids = {}
+        self.names = []
+        self.points = array('l')
+
+    def team_id(self, name):
+        """
+        Get the ID of a team, registering the team (with 0 points) if it is new.
+
+        :param name: Team name.
+
+        :return: Integer team ID.
+        """
+
+        team_id = self.ids.get(name)
+        if team_id is None:
+            name = sys.intern(name)
+            team_id = self.ids[name] = len(self.names)
+            self.names.append(name)
+            self.points.append(0)
+        return team_id
+
+    def items(self):
+        """
+        :return: Iterator of (team name, points) tuples.
+        """
+        return zip(self.names, self.points)
+
+    def __len__(self):
+        return len(self.names)
+
+    def __contains__(self, name):
+        return name in self.ids
+
+    def __getitem__(self, name):
+        return self.points[self.ids[name]]
+
+
+class TeamRecord(object):
+    """
+    Standings of a single team: wins, draws, losses and goals, see "_determine_standings". Points and goal difference
+    are derived from those, so they can never disagree.
+    """
+
+    __slots__ = ('won', 'drawn', 'lost', 'goals_for', 'goals_against')
+
+    def __init__(self, won=0, drawn=0, lost=0, goals_for=0, goals_against=0):
+        self.won = won
+        self.drawn = drawn
+        self.lost = lost
+        self.goals_for = goals_for
+        self.goals_against = goals_against
+
+    @property
+    def points(self):
+        return 3 * self.won + self.drawn
+
+    @property
+    def goal_difference(self):
+        return self.goals_for - self.goals_against
+
+    def __eq__(self, other):
+        if not isinstance(other, TeamRecord):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+    def __repr__(self):
+        return "TeamRecord({})".format(", ".join("{}={}".format(name, getattr(self, name)) for name in self.__slots__))
+
+
+class _NoStage(object):
+    """
+    Do-nothing stand-in for "rank_stats.PipelineStats.stage" when no stats are wanted.
+    """
+
+    def __enter__(self):
+        return None
+
+    def __exit__(self, *exception):
+        return False
+
+
+_NO_STAGE = _NoStage()
+
+
+def _no_stage(name):
+    """
+    Same signature as "rank_stats.PipelineStats.stage", measures nothing.
+    """
+    return _NO_STAGE
+
+
+def _parse_result(result):
+    """
+    Parse a single match result line into its teams and (integer) scores.
+
+    :param result: A single match result string, for example "Tarantulas 1, FC Awesome 0".
+
+    :return: Tuple in the format of (home team, home goals, away team, away goals). Goals are integers.
+    """
+
+    # We assume the results are in string format, and well parsed. No checks will be done for that.
+    # Typical format has teams and their score total separated by a comma, with a space between the team and
+    # it's score. Team names may contain spaces themselves, so the score is always the last "word" - hence the
+    # "rpartition". This does it all in one go without building any temporary lists.
+    home, _, away = result.partition(", ")
+    home_team, _, home_goals = home.rpartition(" ")
+    away_team, _, away_goals = away.rpartition(" ")
+
+    # Scores must be compared as numbers. As strings "10" would lose to "9"...
+    return home_team, int(home_goals), away_team, int(away_goals)
+
+
+def _parse_match(result):
+    """
+    Parse a single match result line into a match record.
+
+    :param result: A single match result string, for example "Tarantulas 1, FC Awesome 0".
+
+    :return: MatchResult object.
+    """
+
+    return MatchResult(*_parse_result(result))
+
+
+def _determine_points(results, match_points=None):
     """
     Function will read in match results and proceed to determine points and results as stipulated by the rules
     (see file commentary above)
 
-    :param results: An array containing all team results, as read from file.
+    :param results:         An iterable containing all team results, as read from file. This can be the array
+                            returned by "_read_file" or the lazy generator returned by "_stream_file".
+    :param match_points:    Optional dictionary to add the points to. A new one is created if not given.
 
     :return: Dictionary object containing available teams and points scored in league.
     """
 
-    # Establish a new dictionary.
-    match_points = {}
+    # Establish a new dictionary. Local references save an attribute lookup per line on large files.
+    if match_points is None:
+        match_points = {}
+    get_points = match_points.get
+    parse_result = _parse_result
 
     for result in results:
-        # We assume the results are in string format, and well parsed. No checks will be done for that.
-        # Typical format has teams and their score total separated by a command, with spaced between
-        # the team and it's score. Time to parse...
+        home_team, home_goals, away_team, away_goals = parse_result(result)
 
-        split_results = result.split(", ")          # Include the space after that comma for simpler code....
-        team_1_split = split_results[0].split(" ")
-        team_2_split = split_results[1].split(" ")
+        # Now compare the two and assign valid points. Team results are stored against their team names.
+        # Winning team takes 3. Losing team takes 0 - but be sure the loser is at least in our list. Draws take 1 each
+        if home_goals > away_goals:
+            match_points[home_team] = get_points(home_team, 0) + 3
+            match_points[away_team] = get_points(away_team, 0)
 
-        # Reconstruct... since our team names may have spaces and thus be split above as well...
-        team_1_data = [" ".join(team_1_split[0:-1]), team_1_split[-1]]
-        team_2_data = [" ".join(team_2_split[0:-1]), team_2_split[-1]]
+        elif away_goals > home_goals:
+            match_points[away_team] = get_points(away_team, 0) + 3
+            match_points[home_team] = get_points(home_team, 0)
 
-        # Now compare the two and assign valid points. Team results are stored against their team names.
-        # Winning team takes 3. Losing team takes 0. Draws take 1 each
-        if team_1_data[-1] > team_2_data[-1]:
-            if team_1_data[0] not in match_points:
-                match_points[team_1_data[0]] = 3
-            else:
-                match_points[team_1_data[0]] += 3
-            # Be sure the loser team is at least in our list... if not there...
-            if team_2_data[0] not in match_points:
-                match_points[team_2_data[0]] = 0
-
-        elif team_2_data[-1] > team_1_data[-1]:
-            if team_2_data[0] not in match_points:
-                match_points[team_2_data[0]] = 3
-            else:
-                match_points[team_2_data[0]] += 3
-            # Be sure the loser team is at least in our list... if not there...
-            if team_1_data[0] not in match_points:
-                match_points[team_1_data[0]] = 0
+        else:
+            match_points[home_team] = get_points(home_team, 0) + 1
+            match_points[away_team] = get_points(away_team, 0) + 1
+
+    # At this point in time our points are matched against the teams...
+    return match_points
+
+
+def _determine_team_points(results, registry=None):
+    """
+    Same as "_determine_points", only the points are accumulated in a compact "TeamRegistry" instead of a dictionary.
+
+    :param results:     An iterable containing all team results, as read from file.
+    :param registry:    Optional registry to add the points to. A new one is created if not given.
+
+    :return: TeamRegistry object containing available teams and points scored in league.
+    """
+
+    if registry is None:
+        registry = TeamRegistry()
 
+    ids = registry.ids
+    team_id = registry.team_id
+    points = registry.points
+    parse_result = _parse_result
+
+    for result in results:
+        home_team, home_goals, away_team, away_goals = parse_result(result)
+
+        # Known teams are a single dictionary lookup away. Only new teams go through the registration.
+        home_id = ids.get(home_team)
+        if home_id is None:
+            home_id = team_id(home_team)
+        away_id = ids.get(away_team)
+        if away_id is None:
+            away_id = team_id(away_team)
+
+        # Winning team takes 3. Losing team takes 0 (and is already registered). Draws take 1 each
+        if home_goals > away_goals:
+            points[home_id] += 3
+        elif away_goals > home_goals:
+            points[away_id] += 3
         else:
-            # Gotta assume the draw here...
-            if team_1_data[0] not in match_points:
-                match_points[team_1_data[0]] = 1
-            else:
-                match_points[team_1_data[0]] += 1
+            points[home_id] += 1
+            points[away_id] += 1
 
-            if team_2_data[0] not in match_points:
-                match_points[team_2_data[0]] = 1
-            else:
-                match_points[team_2_data[0]] += 1
+    return registry
+
+
+def _determine_standings(results, standings=None):
+    """
+    Same as "_determine_points", only every team's wins, draws, losses and goals are kept as well - all in the same
+    single pass, in one "TeamRecord" per team.
+
+    :param results:     An iterable containing all team results, as read from file.
+    :param standings:   Optional dictionary to add the standings to. A new one is created if not given.
+
+    :return: Dictionary of team names and their TeamRecord.
+    """
+
+    if standings is None:
+        standings = {}
+    get_record = standings.get
+    parse_result = _parse_result
+
+    for result in results:
+        home_team, home_goals, away_team, away_goals = parse_result(result)
+
+        home = get_record(home_team)
+        if home is None:
+            home = standings[home_team] = TeamRecord()
+        away = get_record(away_team)
+        if away is None:
+            away = standings[away_team] = TeamRecord()
+
+        home.goals_for += home_goals
+        home.goals_against += away_goals
+        away.goals_for += away_goals
+        away.goals_against += home_goals
+
+        if home_goals > away_goals:
+            home.won += 1
+            away.lost += 1
+        elif away_goals > home_goals:
+            away.won += 1
+            home.lost += 1
+        else:
+            home.drawn += 1
+            away.drawn += 1
+
+    return standings
+
+
+def _shard_offsets(filename, shards):
+    """
+    Split a results file into byte ranges that each start at the beginning of a line.
+
+    :param filename:    Full file path that contains match results.
+    :param shards:      Number of byte ranges wanted. Fewer may be returned for small files.
+
+    :return: List of (start, end) byte offset tuples covering the whole file.
+    """
+
+    size = os.path.getsize(filename)
+    boundaries = [0]
+
+    with open(filename, 'rb') as input_file:
+        for shard in range(1, shards):
+            # Jump to the rough boundary and move forward to the start of the next line. Starting one byte early
+            # means a boundary that already sits at the start of a line stays put.
+            input_file.seek(max(size * shard // shards - 1, boundaries[-1]))
+            input_file.readline()
+            boundary = input_file.tell()
+            if boundary > boundaries[-1] and boundary < size:
+                boundaries.append(boundary)
+
+    boundaries.append(size)
+    return list(zip(boundaries[:-1], boundaries[1:]))
+
+
+def _read_shard(filename, start, end):
+    """
+    Lazily read the match results in a byte range of our given filename.
+
+    :param filename:    Full file path that contains match results.
+    :param start:       Byte offset of the first line in the shard.
+    :param end:         Byte offset just after the last line in the shard.
+
+    :return: A generator yielding team results, as read from file.
+    """
+
+    with open(filename, 'rb') as input_file:
+        input_file.seek(start)
+        position = start
+        for line in input_file:
+            if position >= end:
+                break
+            position += len(line)
+            yield line.rstrip(b'\n').decode(ENCODING)
+
+
+def _determine_shard_points(shard):
+    """
+    Worker function: determine the points for a single shard of a results file.
+
+    :param shard: Tuple of (full file path, start byte offset, end byte offset).
+
+    :return: Dictionary object containing the teams and points scored in this shard only.
+    """
+
+    return _determine_points(_read_shard(*shard))
+
+
+def _determine_points_sharded(filename, workers, min_shard_size=MIN_SHARD_SIZE):
+    """
+    Determine points for a (huge) results file by splitting it into line aligned byte ranges and having a pool of
+    worker processes determine the points of each range. Points are additive, so the partial results are simply summed
+    up. The outcome is identical to "_determine_points" over the whole file.
+
+    :param filename:        Full file path that contains match results.
+    :param workers:         Number of worker processes.
+    :param min_shard_size:  Smallest byte range handed to a worker.
+
+    :return: Dictionary object containing available teams and points scored in league.
+    """
+
+    size = os.path.getsize(filename)
+    if not size:
+        raise EmptyResults("Empty results file given. Exiting Program.")
+
+    shards = max(1, min(workers * SHARDS_PER_WORKER, size // min_shard_size))
+    jobs = [(filename, start, end) for start, end in _shard_offsets(filename, shards)]
+
+    # Small file? Not worth starting up any processes for.
+    if len(jobs) == 1:
+        return _determine_shard_points(jobs[0])
+
+    match_points = {}
+    get_points = match_points.get
+
+    import multiprocessing
+
+    pool = multiprocessing.Pool(workers)
+    try:
+        for shard_points in pool.imap_unordered(_determine_shard_points, jobs):
+            for team, points in shard_points.items():
+                match_points[team] = get_points(team, 0) + points
+    finally:
+        pool.close()
+        pool.join()
 
-    # At this point in time our points are matched against the teams...
     return match_points
 
 
+def _fingerprint(filename, offset):
+    """
+    Fingerprint the first "offset" bytes of a results file, without reading all of them. Only the start and the end
+    of that range are hashed - enough to notice a file that was truncated or rewritten rather than appended to.
+
+    :param filename:    Full file path that contains match results.
+    :param offset:      Number of bytes, from the start of the file, to fingerprint.
+
+    :return: Hex digest string.
+    """
+
+    import hashlib
+
+    fingerprint = hashlib.md5()
+    with open(filename, 'rb') as input_file:
+        fingerprint.update(input_file.read(min(offset, FINGERPRINT_SIZE)))
+        input_file.seek(max(offset - FINGERPRINT_SIZE, 0))
+        fingerprint.update(input_file.read(offset - input_file.tell()))
+
+    return fingerprint.hexdigest()
+
+
+def _load_state(state_name):
+    """
+    Load a previously saved incremental ranking state.
+
+    :param state_name: Full file path of the state file.
+
+    :return: Tuple of (consumed byte offset, fingerprint, points dictionary), or None if there is no usable state.
+    """
+
+    try:
+        with open(state_name, encoding=ENCODING) as state_file:
+            if state_file.readline().rstrip('\n') != STATE_HEADER:
+                return None
+
+            offset, fingerprint = state_file.readline().split()
+            points = {}
+            for line in state_file:
+                team_points, team = line.rstrip('\n').split('\t', 1)
+                points[team] = int(team_points)
+
+        return int(offset), fingerprint, points
+    except (OSError, ValueError):
+        # Missing, or not a state file we understand. Either way, a full rebuild sorts it out.
+        return None
+
+
+def _save_state(state_name, offset, fingerprint, points):
+    """
+    Save the incremental ranking state. The file is replaced atomically, so a crash never leaves a torn state behind.
+
+    :param state_name:  Full file path of the state file.
+    :param offset:      Number of bytes of the results file consumed so far.
+    :param fingerprint: Fingerprint of the consumed bytes, see "_fingerprint".
+    :param points:      Dictionary that contains team names and associated points
+    """
+
+    temp_name = state_name + ".tmp"
+    with open(temp_name, 'w', encoding=ENCODING) as state_file:
+        state_file.write("{}\n{} {}\n".format(STATE_HEADER, offset, fingerprint))
+        for team, team_points in points.items():
+            state_file.write("{}\t{}\n".format(team_points, team))
+
+    os.replace(temp_name, state_name)
+
+
+def _determine_points_incremental(filename, state_name):
+    """
+    Determine points for a results file that only ever gets appended to. Points from the previous run are loaded from
+    the state file and only the lines appended since are read. If the file was truncated or rewritten in the meantime,
+    all points are determined from scratch.
+
+    :param filename:    Full file path that contains match results.
+    :param state_name:  Full file path of the state file.
+
+    :return: Tuple of (dictionary of teams and points, number of bytes consumed, dictionary of teams and points up to
+             the bytes consumed). Hand the last two to "_save_state".
+    """
+
+    size = os.path.getsize(filename)
+    if not size:
+        raise EmptyResults("Empty results file given. Exiting Program.")
+
+    state = _load_state(state_name)
+    if state and state[0] <= size and _fingerprint(filename, state[0]) == state[1]:
+        offset, _, match_points = state
+    else:
+        offset, match_points = 0, {}
+
+    # Only complete lines are consumed. The last line may not have its newline (yet) - see below.
+    consumed = _last_line_end(filename, offset, size)
+    new_points = _determine_points(line for line in _read_shard(filename, offset, consumed) if line)
+
+    get_points = match_points.get
+    for team, points in new_points.items():
+        match_points[team] = get_points(team, 0) + points
+
+    # A last line without its newline is ranked, just like a full run would, but not consumed: it may still be being
+    # written, so the next run reads it again. One that does not parse (yet) is left out - unless there is nothing
+    # else, in which case it fails exactly like a full run.
+    ranked_points = match_points
+    last_line = "".join(_read_shard(filename, consumed, size))
+    if last_line.strip():
+        try:
+            last_points = _determine_points([last_line])
+        except ValueError:
+            if not consumed:
+                raise
+        else:
+            ranked_points = dict(match_points)
+            for team, points in last_points.items():
+                ranked_points[team] = ranked_points.get(team, 0) + points
+
+    if not ranked_points:
+        raise EmptyResults("Empty results file given. Exiting Program.")
+
+    return ranked_points, consumed, match_points
+
+
+def _last_line_end(filename, start, end):
+    """
+    Find where the last complete line in a byte range of our given filename ends.
+
+    :param filename:    Full file path that contains match results.
+    :param start:       Byte offset where the range starts.
+    :param end:         Byte offset just after the range.
+
+    :return: Byte offset just after the last newline in the range, or "start" if there is none.
+    """
+
+    with open(filename, 'rb') as input_file:
+        # Walk back from the end a block at a time. Usually the very first block ends on (or near) a newline.
+        position = end
+        while position > start:
+            block_start = max(position - FINGERPRINT_SIZE, start)
+            input_file.seek(block_start)
+            newline = input_file.read(position - block_start).rfind(b"\n")
+            if newline >= 0:
+                return block_start + newline + 1
+            position = block_start
+
+    return start
+
+
+def _default_options():
+    """
+    Pipeline options when nothing but the file is given on the command line. Must match the argparse defaults in
+    "_get_file_params".
+
+    :return: Dictionary of pipeline options.
+    """
+
+    from rank_cache import DEFAULT_CACHE_DIR, DEFAULT_CACHE_SIZE, RankCache
+
+    return {
+        'stream': False,
+        'top_n': None,
+        'workers': None,
+        'incremental': False,
+        'engine': ENGINES[0],
+        'cache': RankCache(DEFAULT_CACHE_DIR, DEFAULT_CACHE_SIZE),
+        'strong_hash': False,
+        'stats': None,
+        'compress': None,
+        'tiebreakers': DEFAULT_TIEBREAKERS,
+        'details': False,
+        'matchdays': None,
+        'matchday_size': None,
+        'output_format': OUTPUT_FORMATS[0],
+        'memory_limit': None,
+        'spill_dir': None,
+        'follow': False,
+        'poll_interval': FOLLOW_POLL_INTERVAL,
+        'debounce': FOLLOW_DEBOUNCE
+    }
+
+
+def _get_simple_params(argv):
+    """
+    Fast path for the command line: recognise a plain "-f <file>" (or "--filename <file>", "--filename=<file>") call
+    without loading argparse. Anything else - other options, help, bad input - is left to argparse.
+
+    :param argv: Command line arguments, without the program name.
+
+    :return: full file path input value, or None if the arguments are not that simple.
+    """
+
+    if len(argv) == 2 and argv[0] in ('-f', '--filename') and not argv[1].startswith('-'):
+        return argv[1]
+    if len(argv) == 1 and argv[0].startswith('--filename=') and len(argv[0]) > len('--filename='):
+        return argv[0][len('--filename='):]
+    return None
+
+
 def _get_file_params():
     """
     Get the file input parameter from the command line. Since this uses "argparse", it will facilitate the full
     CLI experience...
 
-    :return: full file path input value
+    :return: full file path input value, and a dictionary of the remaining pipeline options
     """
 
+    # The common "-f <file>" only call needs no parser at all.
+    full_path = _get_simple_params(sys.argv[1:])
+    if full_path is not None:
+        return full_path, _default_options()
+
+    import argparse
+
+    from rank_cache import DEFAULT_CACHE_DIR, DEFAULT_CACHE_SIZE, RankCache
+
+    def tiebreakers(text):
+        keys = tuple(key.strip() for key in text.split(','))
+        unknown = [key for key in keys if key not in TIEBREAKERS]
+        if unknown:
+            raise argparse.ArgumentTypeError("unknown tiebreaker(s) {}, choose from {}".format(
+                ", ".join(unknown), ",".join(TIEBREAKERS)))
+        return keys
+
+    def positive_int(text):
+        try:
+            value = int(text)
+        except ValueError:
+            value = 0
+        if value < 1:
+            raise argparse.ArgumentTypeError("expected a whole number of at least 1, not {!r}".format(text))
+        return value
+
+    def window(text):
+        first, found, last = text.partition(':')
+        try:
+            first, last = int(first), int(last)
+        except ValueError:
+            found = False
+        if not found or first < 1 or first > last:
+            raise argparse.ArgumentTypeError("expected FIRST:LAST matchdays, for example 13:17, not {!r}".format(text))
+        return first, last
+
     # Assign description to the help doc
     parser = argparse.ArgumentParser(
         description='This script will calculate your rank results given team match results in a file.')
@@ -122,6 +744,79 @@ def _get_file_params():
     # Add arguments
     parser.add_argument(
         '-f', '--filename', type=str, help='Full file location path', required=True)
+    parser.add_argument(
+        '-s', '--stream', action='store_true',
+        help='Stream results from file in chunks instead of reading the whole file into memory first')
+    parser.add_argument(
+        '-t', '--top-n', type=positive_int, default=None,
+        help='Only write the top N positions of the table (teams tied at position N are all included)')
+    parser.add_argument(
+        '-w', '--workers', type=positive_int, default=None,
+        help='Split the results file into shards and determine points using this many worker processes')
+    parser.add_argument(
+        '-e', '--engine', choices=ENGINES, default=ENGINES[0],
+        help='Points engine: "python" keeps a dictionary of team names, "compact" interns team names to integer '
+             'IDs and keeps points in an array, "numpy" determines points and sorts with vectorized NumPy operations')
+    parser.add_argument(
+        '-i', '--incremental', action='store_true',
+        help='Only read results appended since the previous incremental run (state is kept next to the output)')
+    parser.add_argument(
+        '--no-cache', action='store_true',
+        help='Always rank the results file, even when the ranking of an unchanged file is cached')
+    parser.add_argument(
+        '--cache-dir', type=str, default=DEFAULT_CACHE_DIR,
+        help='Directory for cached rankings (default: {})'.format(DEFAULT_CACHE_DIR))
+    parser.add_argument(
+        '--cache-size', type=positive_int, default=DEFAULT_CACHE_SIZE // (1024 * 1024),
+        help='Maximum size of the ranking cache in MB, least recently used rankings are removed first')
+    parser.add_argument(
+        '--strong-hash', action='store_true',
+        help='Identify cached results files by a hash of their content rather than by path, size and modified time')
+    parser.add_argument(
+        '--stats', nargs='?', const='text', default=None, choices=('text', 'json'),
+        help='Report per stage wall and CPU times plus counters on stderr, as a table (default) or as JSON')
+    parser.add_argument(
+        '-z', '--compress', choices=sorted(COMPRESSIONS), default=None,
+        help='Compress the written results. The compression name is added as a suffix, e.g. "rank_results.txt.gz"')
+    parser.add_argument(
+        '--tiebreak', type=tiebreakers, default=DEFAULT_TIEBREAKERS, metavar='KEY[,KEY...]',
+        help='Comma separated keys to rank by, most important first: {} (default: {})'.format(
+            ", ".join(TIEBREAKERS), ",".join(DEFAULT_TIEBREAKERS)))
+    parser.add_argument(
+        '--details', action='store_true',
+        help="Add every team's wins, draws, losses, goals for, goals against and goal difference to the ranking")
+    matchdays = parser.add_mutually_exclusive_group()
+    matchdays.add_argument(
+        '--as-of', type=positive_int, default=None, metavar='MATCHDAY',
+        help='Rank the table as it stood at the end of this matchday (counting from 1)')
+    matchdays.add_argument(
+        '--window', type=window, default=None, metavar='FIRST:LAST',
+        help='Rank only the points scored from matchday FIRST up to and including matchday LAST')
+    parser.add_argument(
+        '--format', choices=OUTPUT_FORMATS, default=OUTPUT_FORMATS[0], dest='output_format',
+        help='Output format: "text" ranking lines, "csv" with a header line, or "jsonl" with one JSON object per '
+             'team. CSV and JSON lines are written as "rank_results.csv" and "rank_results.jsonl"')
+    parser.add_argument(
+        '--memory-limit', type=positive_int, default=None, metavar='MB',
+        help='Keep the points aggregation under this many MB by spilling teams to disk buckets, for results with '
+             'more distinct teams than fit in memory')
+    parser.add_argument(
+        '--spill-dir', type=str, default=None,
+        help='Directory for the spill files of --memory-limit (default: the system temporary directory)')
+    parser.add_argument(
+        '--follow', action='store_true',
+        help='Keep following the results file: appended lines are folded into the points table and the ranking is '
+             'rewritten whenever it changes, until interrupted')
+    parser.add_argument(
+        '--poll-interval', type=float, default=FOLLOW_POLL_INTERVAL, metavar='SECONDS',
+        help='Seconds between checks of the followed results file (default: {})'.format(FOLLOW_POLL_INTERVAL))
+    parser.add_argument(
+        '--debounce', type=float, default=FOLLOW_DEBOUNCE, metavar='SECONDS',
+        help='Seconds the followed results file must be quiet before a burst of appended lines is ranked '
+             '(default: {})'.format(FOLLOW_DEBOUNCE))
+    parser.add_argument(
+        '--matchday-size', type=positive_int, default=None,
+        help='Number of matches per matchday, in file order (default: half the number of teams, one full round)')
 
     # Find our args array from the passed in parameters.
     args = parser.parse_args()
@@ -129,8 +824,72 @@ def _get_file_params():
     # Determine the file's name and the location.
     full_path = args.filename
 
+    # Everything else is handed to the pipeline as is.
+    options = {
+        'stream': args.stream,
+        'top_n': args.top_n,
+        'workers': args.workers,
+        'incremental': args.incremental,
+        'engine': args.engine,
+        'cache': None if args.no_cache else RankCache(args.cache_dir, args.cache_size * 1024 * 1024),
+        'strong_hash': args.strong_hash,
+        'stats': args.stats,
+        'compress': args.compress,
+        'tiebreakers': args.tiebreak,
+        'details': args.details,
+        'matchdays': (1, args.as_of) if args.as_of is not None else args.window,
+        'matchday_size': args.matchday_size,
+        'output_format': args.output_format,
+        'memory_limit': args.memory_limit * 1024 * 1024 if args.memory_limit is not None else None,
+        'spill_dir': args.spill_dir,
+        'follow': args.follow,
+        'poll_interval': args.poll_interval,
+        'debounce': args.debounce
+    }
+
     # Return all variable values
-    return full_path
+    return full_path, options
+
+
+def _compression(filename):
+    """
+    Detect a compressed results file from its first bytes, whatever its name.
+
+    :param filename: Full file path that contains match results.
+
+    :return: Compression name, one of "COMPRESSIONS", or None for an uncompressed (or unreadable) file.
+    """
+
+    try:
+        with open(filename, 'rb') as input_file:
+            head = input_file.read(max(len(magic) for magic, _ in COMPRESSIONS.values()))
+    except OSError:
+        # Unreadable either way. Leave it to the readers to report.
+        return None
+
+    for compression, (magic, _) in COMPRESSIONS.items():
+        if head.startswith(magic):
+            return compression
+    return None
+
+
+def _open_file(filename, mode='r', compression=None):
+    """
+    Open a plain or a compressed file. Compressed files are (de)compressed on the fly, a chunk at a time, so nothing
+    is ever unpacked to disk first.
+
+    :param filename:    Full file path.
+    :param mode:        File mode. Text modes read and write UTF-8.
+    :param compression: Compression name, one of "COMPRESSIONS", or None for a plain file.
+
+    :return: File object.
+    """
+
+    # The compression modules all have an "open" that works like the builtin one. Only load the one we need.
+    opener = open if compression is None else __import__(COMPRESSIONS[compression][1]).open
+    if 'b' in mode:
+        return opener(filename, mode)
+    return opener(filename, mode + 't' if compression else mode, encoding=ENCODING)
 
 
 def _read_file(filename):
@@ -142,7 +901,7 @@ def _read_file(filename):
     :return: An array containing all team results, as read from file.
     """
 
-    with open(filename) as input_file:
+    with open(filename, encoding=ENCODING) as input_file:
         # Read all entries, remove newline characters.
         match_results = [line.rstrip('\n') for line in input_file]
 
@@ -152,14 +911,155 @@ def _read_file(filename):
     return match_results
 
 
-def _sort_results(points):
+def _stream_file(filename, chunk_size=STREAM_CHUNK_SIZE, compression=None):
     """
-    Function will take in a point results set and proceed to sort the results via points.
+    Lazily read our given filename and yield results one at a time. Only roughly "chunk_size" bytes of lines are
+    held in memory at once, so memory use is bound by the number of teams and not by the number of matches.
 
-    :param points: Dictionary that contains team names and associated points
+    :param filename:    Full file path that contains match results.
+    :param chunk_size:  Approximate number of bytes to read from the file per chunk.
+    :param compression: Compression of the file, see "_compression". Decompressed as it is read.
 
-    :return:    Array containing strings in the format of "<Rank>. <Team name>: <Points> pt(s)".
-                Array is sorted where entry 0 is the highest scoring team.
+    :return: A generator yielding team results, as read from file.
+    """
+
+    with _open_file(filename, compression=compression) as input_file:
+        lines = input_file.readlines(chunk_size)
+
+        # Same check as "_read_file" - only we can already tell after the very first chunk.
+        if not lines:
+            raise EmptyResults("Empty results file given. Exiting Program.")
+
+        while lines:
+            for line in lines:
+                yield line.rstrip('\n')
+            lines = input_file.readlines(chunk_size)
+
+
+def _is_binary_file(filename, compression=None):
+    """
+    Check for a binary results file, see "rank_binary".
+
+    :param filename:    Full file path that contains match results.
+    :param compression: Compression of the file, see "_compression".
+
+    :return: True if the file is in the binary results format, False for a text results file.
+    """
+
+    try:
+        with _open_file(filename, 'rb', compression) as input_file:
+            return input_file.read(len(BINARY_MAGIC)) == BINARY_MAGIC
+    except OSError:
+        # Unreadable either way. Leave it to the text readers to report.
+        return False
+
+
+def _needs_standings(tiebreakers, details=False):
+    """
+    :param tiebreakers: Sequence of "TIEBREAKERS" keys, most important first.
+    :param details:     Whether every team's wins, draws, losses and goals are wanted.
+
+    :return: True if ranking needs "TeamRecord" standings rather than a plain points table.
+    """
+
+    keys = list(tiebreakers)
+    if 'name' in keys:
+        keys = keys[:keys.index('name')]
+    return details or any(key != 'points' for key in keys)
+
+
+def _ranking_entries(points, tiebreakers=DEFAULT_TIEBREAKERS):
+    """
+    Build the heap entries to rank teams by.
+
+    :param points:      Dictionary (or TeamRegistry) that contains team names and associated points, or a dictionary
+                        of team names and their "TeamRecord" standings.
+    :param tiebreakers: Sequence of "TIEBREAKERS" keys, most important first.
+
+    :return: List of (rank key, team name, points, TeamRecord or None) heap entries. The rank key is the tuple of
+             (negated) tiebreak values up to the name. Teams with the same rank key share their rank.
+    """
+
+    unknown = [key for key in tiebreakers if key not in TIEBREAKERS]
+    if unknown:
+        raise ValueError("Unknown tiebreaker(s): {}. Choose from: {}".format(
+            ", ".join(unknown), ", ".join(TIEBREAKERS)))
+
+    # Teams are unique by name, so nothing after the name can ever break a tie.
+    keys = list(tiebreakers)
+    if 'name' in keys:
+        keys = keys[:keys.index('name')]
+    needs_records = _needs_standings(keys)
+
+    entries = []
+    for team, value in points.items():
+        if isinstance(value, TeamRecord):
+            record = value
+            team_points = record.points
+            rank_key = tuple(-team_points if key == 'points' else -getattr(record, key) for key in keys)
+        elif needs_records:
+            raise ValueError("Tiebreakers {} need standings, see \"_determine_standings\"".format(", ".join(keys)))
+        else:
+            # A plain points table only knows about points.
+            record = None
+            team_points = value
+            rank_key = tuple(-team_points for _ in keys)
+        entries.append((rank_key, team, team_points, record))
+
+    return entries
+
+
+def _select_top_entries(entries, top_n):
+    """
+    Select only the heap entries needed to display the top "top_n" ranks of the table. Teams that share the rank key
+    of the team in position "top_n" share its rank, so they are all included as well.
+
+    :param entries: List of heap entries, see "_ranking_entries".
+    :param top_n:   Number of table positions wanted.
+
+    :return: List of heap entries, already heapified.
+    """
+
+    # Bounded selection keeps only "top_n" entries around while scanning - O(T log N) instead of O(T log T).
+    top_entries = heapq.nsmallest(top_n, entries)
+    if not top_entries:
+        return top_entries
+
+    # Second (linear) pass to pick up everybody tied at the cutoff.
+    cutoff = top_entries[-1][0]
+    selected = [entry for entry in entries if entry[0] <= cutoff]
+    heapq.heapify(selected)
+
+    return selected
+
+
+def _format_record(record):
+    """
+    :param record: TeamRecord of a team.
+
+    :return: String of the team's wins, draws, losses and goals, for example "(W 2, D 0, L 0, GF 4, GA 1, GD +3)".
+    """
+
+    return "(W {}, D {}, L {}, GF {}, GA {}, GD {:+d})".format(
+        record.won, record.drawn, record.lost, record.goals_for, record.goals_against, record.goal_difference)
+
+
+def _rank_results(points, top_n=None, tiebreakers=DEFAULT_TIEBREAKERS, details=False):
+    """
+    Function will take in a point results set and proceed to rank the teams via points. Nothing is rendered here, see
+    "RENDERERS" for that.
+
+    :param points:      Dictionary (or TeamRegistry) that contains team names and associated points. For tiebreakers
+                        other than points and name, or details, a dictionary of team names and their "TeamRecord"
+                        standings (see "_determine_standings").
+    :param top_n:       Optional number of table positions wanted. Only the top "top_n" teams are returned, plus any
+                        teams tied with the last of those. When not given, the full table is returned.
+    :param tiebreakers: Sequence of "TIEBREAKERS" keys to rank by, most important first. Teams that are equal on all
+                        of them (up to the name) share a rank. Defaults to points, then name.
+    :param details:     Add every team's "TeamRecord" to its tuple. Needs "TeamRecord" standings.
+
+    :return:    List of (rank, team name, points) tuples, or (rank, team name, points, TeamRecord) tuples with
+                "details". List is sorted where entry 0 is the highest scoring team.
     """
 
     # Let us at least assume that we want to do sorting efficiently....
@@ -182,57 +1082,414 @@ def _sort_results(points):
     #
     # Thus, at popping time we can once again invert the points and our entire sorting algorithm is done... by simply
     # using the heapq library and good 'ol "-1".
-    heap = []
-    for key, value in points.iteritems():
-        heapq.heappush(heap, (-1*value, key))
+    #
+    # Tiebreakers work the very same way: the rank key is a tuple of every (negated) tiebreak value, so a single heap
+    # still orders by all of them at once - and by name when all else is equal.
+    entries = _ranking_entries(points, tiebreakers)
+    if top_n is not None:
+        # Dashboards usually only want the top of the table. No use ordering every last team for that.
+        heap = _select_top_entries(entries, top_n)
+    else:
+        heap = entries
+        heapq.heapify(heap)
 
     # Now that we have it all pushed, proceed to pop it for the final array.
-    sorted_array = []
+    ranking = []
     current_position = 0
-    old_points = 0
+    old_rank_key = None
     for entry in range(len(heap)):
-        # Pop the items, and reconstruct the "String" that we need for our file storage.
-        heap_item = heapq.heappop(heap)
-
-        # For the whole "pts or pt" human readable part, we will need to check what the point is and act accordingly
-        # Remember we store the heap values as a negative...
-        current_points = heap_item[0]
-        suffix = "pts"
-        if current_points == -1:
-            suffix = "pt"
+        rank_key, team, team_points, record = heapq.heappop(heap)
 
         # We need to prepend the position in the rank. Remember to only change the position if it is
         # then next number in our list!
-        if current_points != old_points:
+        if rank_key != old_rank_key:
             current_position = entry + 1
-            old_points = current_points
-        prefix = str(current_position) + "."
+            old_rank_key = rank_key
 
-        # Now join our various string parts to make up the "rank display"
-        strings_to_join = [
-            prefix,
-            heap_item[1] + ",",
-            str(-1 * heap_item[0]),
-            suffix]
+        if details:
+            if record is None:
+                raise ValueError("Details need standings, see \"_determine_standings\"")
+            ranking.append((current_position, team, team_points, record))
+        else:
+            ranking.append((current_position, team, team_points))
 
-        final_string = " ".join(strings_to_join)
+    # Return the final array for response.
+    return ranking
 
-        sorted_array.append(final_string)
 
-    # Return the final array for response.
-    return sorted_array
+def _render_text(ranking):
+    """
+    Render a ranking the way "rank_results.txt" has always looked.
+
+    :param ranking: Iterable of ranking tuples, see "_rank_results".
+
+    :return: A generator yielding strings in the format of "<Rank>. <Team name>, <Points> pt(s)", followed by the
+             team's record (see "_format_record") for detailed rankings.
+    """
+
+    for entry in ranking:
+        rank, team, team_points = entry[:3]
+
+        # For the whole "pts or pt" human readable part, we will need to check what the point is and act accordingly
+        line = "{}. {}, {} {}".format(rank, team, team_points, "pt" if team_points == 1 else "pts")
+        if len(entry) > 3:
+            line += " " + _format_record(entry[3])
+
+        yield line
+
+
+def _csv_field(text):
+    """
+    :param text: String to write as a CSV field.
+
+    :return: The string, quoted (RFC 4180) if it contains a comma or a quote.
+    """
+
+    if ',' in text or '"' in text:
+        return '"' + text.replace('"', '""') + '"'
+    return text
+
+
+def _render_csv(ranking):
+    """
+    Render a ranking as CSV, with a header line.
+
+    :param ranking: Iterable of ranking tuples, see "_rank_results".
+
+    :return: A generator yielding CSV lines: rank, team and points, plus the "RECORD_FIELDS" for detailed rankings.
+    """
+
+    ranking = iter(ranking)
+    first = next(ranking, None)
+    details = first is not None and len(first) > 3
+
+    yield ",".join(RANKING_FIELDS + (RECORD_FIELDS if details else ()))
+    if first is None:
+        return
+
+    for entry in chain((first,), ranking):
+        line = "{},{},{}".format(entry[0], _csv_field(entry[1]), entry[2])
+        if details:
+            record = entry[3]
+            line += ",{},{},{},{},{},{}".format(*[getattr(record, field) for field in RECORD_FIELDS])
+
+        yield line
+
+
+def _render_json_lines(ranking):
+    """
+    Render a ranking as JSON lines: one JSON object per team.
+
+    :param ranking: Iterable of ranking tuples, see "_rank_results".
+
+    :return: A generator yielding lines like '{"rank": 1, "team": "Tarantulas", "points": 6}', plus the
+             "RECORD_FIELDS" for detailed rankings.
+    """
+
+    # Only the team name needs escaping. Everything else is a plain integer. The bare (C) string encoder of "json" does
+    # just that, without the generic "json.dumps" machinery around it for every team.
+    from json.encoder import encode_basestring
+
+    for entry in ranking:
+        line = '{{"rank": {}, "team": {}, "points": {}'.format(entry[0], encode_basestring(entry[1]), entry[2])
+        if len(entry) > 3:
+            record = entry[3]
+            line += "".join(', "{}": {}'.format(field, getattr(record, field)) for field in RECORD_FIELDS)
 
+        yield line + "}"
 
-def _write_file(filename, results):
+
+# Output format name to the function rendering a ranking in it. See "OUTPUT_FORMATS".
+RENDERERS = {
+    'text': _render_text,
+    'csv': _render_csv,
+    'jsonl': _render_json_lines
+}
+
+
+def _sort_results(points, top_n=None, tiebreakers=DEFAULT_TIEBREAKERS, details=False):
+    """
+    Rank the teams (see "_rank_results") and render the ranking as "rank_results.txt" lines.
+
+    :param points:      Dictionary (or TeamRegistry) that contains team names and associated points, or standings.
+    :param top_n:       Optional number of table positions wanted. See "_rank_results".
+    :param tiebreakers: Sequence of "TIEBREAKERS" keys to rank by. See "_rank_results".
+    :param details:     Add every team's wins, draws, losses and goals to its line. Needs "TeamRecord" standings.
+
+    :return:    Array containing strings in the format of "<Rank>. <Team name>, <Points> pt(s)".
+                Array is sorted where entry 0 is the highest scoring team.
+    """
+
+    return list(_render_text(_rank_results(points, top_n=top_n, tiebreakers=tiebreakers, details=details)))
+
+
+def _write_file(filename, results, compression=None):
     """
-    Writes results to a particular filename
+    Writes results to a particular filename. Results are written to a temporary file in the same location first and
+    only then moved over the given filename, so anybody reading that file never sees a half written ranking.
 
     :param filename:    Full file path that will contain league point results.
-    :param results:     Array containing strings to write to file.
+    :param results:     Array (or any iterable) containing strings to write to file.
+    :param compression: Optional compression name, one of "COMPRESSIONS", to compress the file with.
+    """
+
+    temp_name = "{}.{}.tmp".format(filename, os.getpid())
+    results = iter(results)
+
+    try:
+        if compression is None:
+            file_handler = open(temp_name, 'w', WRITE_BUFFER_SIZE, encoding=ENCODING)
+        else:
+            file_handler = _open_file(temp_name, 'w', compression)
+
+        with file_handler:
+            # One join and one write per batch of lines, rather than a format and a write per team.
+            batch = list(islice(results, WRITE_BATCH_LINES))
+            while batch:
+                batch.append("")
+                file_handler.write("\n".join(batch))
+                batch = list(islice(results, WRITE_BATCH_LINES))
+
+        os.replace(temp_name, filename)
+    except Exception:
+        # Never leave our temporary file lying around.
+        if os.path.exists(temp_name):
+            os.remove(temp_name)
+        raise
+
+
+def rank_file(full_path, final_name, stream=False, top_n=None, workers=None, incremental=False,
+              engine=ENGINES[0], cache=None, strong_hash=False, stats=None, compress=None,
+              tiebreakers=DEFAULT_TIEBREAKERS, details=False, matchdays=None, matchday_size=None,
+              output_format=OUTPUT_FORMATS[0], memory_limit=None, spill_dir=None):
+    """
+    Run the full ranking pipeline for a single results file: read, determine points, sort and write. Results are
+    stored to given file name in the same location as the input file. No command-line parsing happens here, so this
+    can be called directly (or from worker processes) for any number of files.
+
+    :param full_path:   Full file path that contains match results. Compressed files (see "COMPRESSIONS") are
+                        recognised and decompressed on the fly.
+    :param final_name:  File name where final results will be stored.
+    :param stream:      Stream results from file in chunks rather than reading them all up front.
+    :param top_n:       Optional number of table positions to write. See "_sort_results".
+    :param workers:     Optional number of worker processes to determine points with. See "_determine_points_sharded".
+    :param incremental: Only read results appended since the previous incremental run. The points and the consumed
+                        input position are kept in a state file next to the written results.
+    :param engine:      Points engine, one of "ENGINES". Applies to the (single process) non incremental run, and
+                        to binary results files (see "rank_binary"), which are detected and loaded automatically.
+    :param cache:       Optional "rank_cache.RankCache". If the results file is unchanged since it was last ranked,
+                        the cached ranking is written and nothing else is done. Not used by incremental runs.
+    :param strong_hash: Identify the results file in the cache by content hash rather than by path, size and time.
+    :param stats:       Optional "rank_stats.PipelineStats" to record stage timings and counters in.
+    :param compress:    Optional compression name, one of "COMPRESSIONS". The results are then written compressed,
+                        with the compression name appended to "final_name" as a suffix.
+    :param tiebreakers: Sequence of "TIEBREAKERS" keys to rank by. See "_sort_results". Goal based tiebreakers (and
+                        "details") need full standings, which are determined in a single process, from the start.
+    :param details:     Add every team's wins, draws, losses and goals to the written ranking.
+    :param matchdays:   Optional (first, last) tuple of matchdays, counting from 1, to rank the points of. For example
+                        (1, 17) for the table as of matchday 17, or (13, 17) for the form over five matchdays. See
+                        "rank_matchday". Ranked on points only, whatever the reader, worker and engine options.
+    :param matchday_size: Number of matches per matchday, see "rank_matchday.MatchdayIndex".
+    :param output_format: Output format, one of "OUTPUT_FORMATS". See "RENDERERS".
+    :param memory_limit: Optional number of bytes the points aggregation may use. Teams are then spilled to disk
+                        buckets and the ranking merged from them, see "rank_spill". The results are streamed, ranked
+                        on points only and never cached - the reader, worker and engine options do not apply.
+    :param spill_dir:   Directory for the spill files. Defaults to the system temporary directory.
+
+    :return: Full file path of the written results.
+    """
+
+    write_file_name = os.path.join(os.path.dirname(full_path), final_name)
+    if compress is not None:
+        write_file_name += "." + compress
+
+    # No stats wanted? Then nothing gets measured - "_no_stage" does nothing at all.
+    stage = stats.stage if stats is not None else _no_stage
+
+    if memory_limit is not None:
+        # A cached ranking is held in memory as a whole. That is exactly what a memory limit rules out.
+        cache = None
+    if incremental:
+        # The incremental state is the cache of an incremental run. A cache hit would skip saving it.
+        cache = None
+
+    if cache is not None:
+        with stage('cache_lookup'):
+            cache_key = cache.key(full_path, strong=strong_hash, top_n=top_n, tiebreakers=tuple(tiebreakers),
+                                  details=details, matchdays=matchdays, matchday_size=matchday_size,
+                                  output_format=output_format)
+            cached_results = cache.get(cache_key)
+
+        if cached_results is not None:
+            # Seen this one before. No reading, no points and no sorting needed.
+            with stage('write_file'):
+                _write_file(write_file_name, cached_results, compress)
+            if stats is not None:
+                stats.count('cache_hit', True)
+                stats.count('output_bytes', os.path.getsize(write_file_name))
+            return write_file_name
+
+    state = None
+    rank_function = _rank_results
+    render = RENDERERS[output_format]
+    lines_read = None
+    standings = _needs_standings(tiebreakers, details)
+    if matchdays is not None and standings:
+        raise ValueError("Matchday rankings only keep points. Goal based tiebreakers and details are not available")
+    if memory_limit is not None and (standings or matchdays is not None):
+        raise ValueError("Spilled aggregation only keeps points. Tiebreakers, details and matchdays are not available")
+
+    if engine == 'numpy':
+        # Optional dependency. Only needed (and imported) when asked for.
+        try:
+            import numpy_engine
+        except ImportError as error:
+            raise ImportError("The numpy engine needs NumPy installed: {}".format(error))
+
+    compression = _compression(full_path)
+
+    if memory_limit is not None:
+        # More teams than fit in memory. Points are added up per bucket of teams on disk, and the sorted buckets are
+        # merged while the ranking is written - at no point are all teams held at once.
+        import rank_spill
+
+        if _is_binary_file(full_path, compression):
+            raise ValueError("Binary results files hold all team names up front. Please rank the text results file")
+
+        match_results = _stream_file(full_path, compression=compression)
+        if stats is not None:
+            match_results = stats.count_lines(match_results)
+
+        with stage('determine_points'):
+            spilled_points = rank_spill.SpilledPoints(match_results, memory_limit, spill_dir)
+
+        with spilled_points:
+            with stage('write_file'):
+                _write_file(write_file_name, render(spilled_points.ranking(top_n)), compress)
+
+            if stats is not None:
+                _count_stats(stats, spilled_points, None, write_file_name)
+
+        return write_file_name
+
+    if matchdays is not None:
+        # Points over some of the matchdays only. Text results are encoded as they are read, binary results already
+        # are. Either way the results are read once and the index answers from its checkpoints.
+        import rank_matchday
+
+        with stage('determine_points'):
+            if _is_binary_file(full_path, compression):
+                import rank_binary
+                names, records = rank_binary.load(full_path, compression)
+                index = rank_matchday.MatchdayIndex(names, records, matchday_size)
+            else:
+                index = rank_matchday.build_index(_stream_file(full_path, compression=compression), matchday_size)
+            points = index.points(*matchdays)
+    elif _is_binary_file(full_path, compression):
+        # Converted results: team IDs and goals are loaded in bulk, there is no text to parse. Every reader and
+        # worker option is about text, so none of them apply here.
+        import rank_binary
+
+        with stage('read_file'):
+            names, records = rank_binary.load(full_path, compression)
+        lines_read = len(records) // 4
+
+        with stage('determine_points'):
+            if standings:
+                points = rank_binary.determine_standings(names, records)
+            elif engine == 'numpy':
+                points = numpy_engine.determine_record_points(names, records)
+                rank_function = numpy_engine.rank_results
+            else:
+                points = rank_binary.determine_points(names, records)
+    elif incremental and compression is None and not standings:
+        # Pick up where the previous run left off.
+        with stage('determine_points'):
+            state_file_name = write_file_name + STATE_SUFFIX
+            points, consumed, state_points = _determine_points_incremental(full_path, state_file_name)
+            state = (state_file_name, consumed, _fingerprint(full_path, consumed), state_points)
+    elif workers and workers > 1 and compression is None and not standings:
+        # Huge file, many cores. Every worker reads (and scores) its own part of the file.
+        with stage('determine_points'):
+            points = _determine_points_sharded(full_path, workers)
+    else:
+        # Either read all results up front, or hand a lazy reader through to the points calculation. Compressed files
+        # are always streamed: decompressed a chunk at a time, straight into the points calculation. There is no
+        # seeking in them either, so shards and incremental runs are out.
+        if stream or compression is not None:
+            match_results = _stream_file(full_path, compression=compression)
+        else:
+            with stage('read_file'):
+                match_results = _read_file(full_path)
+            lines_read = len(match_results)
+
+        if stats is not None and lines_read is None:
+            match_results = stats.count_lines(match_results)
+
+        # Read in our data
+        with stage('determine_points'):
+            if standings:
+                points = _determine_standings(match_results)
+            elif engine == 'compact':
+                points = _determine_team_points(match_results)
+            elif engine == 'numpy':
+                points = numpy_engine.determine_points(match_results)
+                rank_function = numpy_engine.rank_results
+            else:
+                points = _determine_points(match_results)
+
+    # Proceed to sort it.
+    with stage('sort_results'):
+        if tuple(tiebreakers) == DEFAULT_TIEBREAKERS and not details:
+            ranking = rank_function(points, top_n=top_n)
+        else:
+            ranking = _rank_results(points, top_n=top_n, tiebreakers=tiebreakers, details=details)
+
+    # Lines are rendered as they are written. Only the cache needs to hold on to all of them.
+    rendered_results = render(ranking)
+    if cache is not None:
+        rendered_results = list(rendered_results)
+
+    # And write to your file!
+    with stage('write_file'):
+        _write_file(write_file_name, rendered_results, compress)
+
+    if cache is not None:
+        cache.put(cache_key, rendered_results)
+
+    # Only remember what we consumed once the ranking made it to disk.
+    if state:
+        _save_state(*state)
+
+    if stats is not None:
+        _count_stats(stats, points, lines_read, write_file_name)
+
+    return write_file_name
+
+
+def _count_stats(stats, points, lines_read, write_file_name):
     """
-    with open(filename, 'w') as file_handler:
-        for item in results:
-            file_handler.write("{}\n".format(item))
+    Fill in the counters of a finished ranking run.
+
+    :param stats:           "rank_stats.PipelineStats" of the run.
+    :param points:          Dictionary (or TeamRegistry) that contains team names and associated points, or standings
+    :param lines_read:      Number of lines read, if known up front. Otherwise taken from the line counter.
+    :param write_file_name: Full file path of the written results.
+    """
+
+    if lines_read is None:
+        lines_read = stats.counters.get('lines_read')
+
+    stats.count('teams_seen', len(points))
+    stats.count('output_bytes', os.path.getsize(write_file_name))
+
+    # Sharded and incremental runs never see the individual lines, so those counters are unknown there.
+    if lines_read is not None:
+        stats.count('lines_read', lines_read)
+
+        # A decided match hands out 3 points in total, a draw only 2. No need to count draws line by line.
+        stats.count('draws', 3 * lines_read - sum(
+            value.points if isinstance(value, TeamRecord) else value for _, value in points.items()))
 
 
 def calculate(final_name):
@@ -243,7 +1500,7 @@ def calculate(final_name):
     :param final_name: File name where final results will be stored.
     """
 
-    full_path = _get_file_params()
+    full_path, options = _get_file_params()
     file_location = os.path.dirname(full_path)
     file_name = os.path.basename(full_path)
 
@@ -254,17 +1511,43 @@ def calculate(final_name):
     if not file_name or file_name == "":
         raise InputPath("Please specify full file path, not just the file location. Perhaps a trailing slash?")
 
-    match_results = _read_file(full_path)
-
-    # Read in our data
-    points = _determine_points(match_results)
-
-    # Proceed to sort it.
-    sort_results = _sort_results(points)
-
-    # And write to your file!
-    write_file_name = os.path.join(file_location, final_name)
-    _write_file(write_file_name, sort_results)
+    # Stats are opt-in. Only then is anything measured.
+    stats_format = options.pop('stats', None)
+    stats = None
+    if stats_format:
+        import rank_stats
+        stats = rank_stats.PipelineStats()
+
+    # Machine readable output gets a matching extension, "rank_results.csv" rather than "rank_results.txt".
+    output_format = options.get('output_format', OUTPUT_FORMATS[0])
+    if output_format != OUTPUT_FORMATS[0]:
+        final_name = os.path.splitext(final_name)[0] + "." + output_format
+
+    # Follow mode runs until interrupted. Only the options about the written ranking apply to it.
+    follow = options.pop('follow', False)
+    poll_interval = options.pop('poll_interval', FOLLOW_POLL_INTERVAL)
+    debounce = options.pop('debounce', FOLLOW_DEBOUNCE)
+    if follow:
+        import rank_follow
+
+        def report(new_lines, write_file_name):
+            sys.stdout.write("{} new result(s), ranking written to {}\n".format(new_lines, write_file_name))
+            sys.stdout.flush()
+
+        try:
+            rank_follow.follow(full_path, final_name, top_n=options.get('top_n'),
+                               tiebreakers=options.get('tiebreakers', DEFAULT_TIEBREAKERS),
+                               details=options.get('details', False), output_format=output_format,
+                               compress=options.get('compress'), poll_interval=poll_interval, debounce=debounce,
+                               report=report)
+        except KeyboardInterrupt:
+            pass
+        return
+
+    rank_file(full_path, final_name, stats=stats, **options)
+
+    if stats is not None:
+        sys.stderr.write(stats.report(stats_format))
 
     # We are done!
 
@@ -275,6 +1558,15 @@ if __name__ == "__main__":
     # TODO: Maybe make this an input parameter? Wasn't part of the brief...
     final_result_name = "rank_results.txt"
 
-    calculate(final_result_name)
+    # Run as a script, this module is "__main__". The helper modules (rank_binary and friends) import
+    # "calculate_rank": register this very module under that name, so they share its classes (for example
+    # "TeamRecord") rather than loading a second copy of it.
+    sys.modules.setdefault("calculate_rank", sys.modules[__name__])
+
+    try:
+        calculate(final_result_name)
+    except MatchdayRange as error:
+        # Only known once the results are read, so argparse could not tell. Reported the same way though.
+        sys.exit("error: {}".format(error))
 
-    print ("Calculation Process Complete")
+    print("Calculation Process Complete")
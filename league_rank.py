@@ -0,0 +1,197 @@
+# -*- coding: utf-8 -*-
+
+"""
+Python "League Rank" file.
+
+This file will facilitate a command-line application that will calculate the ranking tables of several soccer leagues
+that are interleaved in a single results feed.
+
+
+Input/output
+------------
+Every line of the feed starts with the league the match was played in, followed by a separator (a tab by default)
+and the match result in the usual format:
+
+<pre>
+premier<TAB>Lions 3, Snakes 3
+championship<TAB>Alpha 1, Beta 0
+</pre>
+
+The feed is read once, in chunks. Every match is routed to the points table of its league, with the exact same rules
+as "calculate_rank._determine_points". The rankings are written next to the feed, either one file per league or all
+leagues in one combined file.
+
+"""
+
+import argparse
+import os
+import sys
+from itertools import islice
+
+import calculate_rank
+from calculate_rank import InputPath
+
+
+# Default output names. "{league}" is replaced with the league's name.
+DEFAULT_LEAGUE_NAME = "{league}_rank_results.txt"
+DEFAULT_COMBINED_NAME = "rank_results.txt"
+DEFAULT_SEPARATOR = "\t"
+
+# Number of feed lines routed to their leagues at a time.
+LEAGUE_CHUNK_LINES = 64 * 1024
+
+
+def _determine_league_points(results, separator=DEFAULT_SEPARATOR):
+    """
+    Determine points per league for a feed of interleaved leagues, in a single pass.
+
+    :param results:     An iterable containing all league prefixed team results, as read from file.
+    :param separator:   String between the league and the match result on every line.
+
+    :return: Dictionary of league names to dictionaries of teams and points scored in that league.
+    """
+
+    league_points = {}
+    results = iter(results)
+
+    # Route a chunk of lines to their leagues, then score each league's share in one go. That keeps the per line
+    # work down to a single "partition", and the scoring is "_determine_points" itself.
+    chunk = list(islice(results, LEAGUE_CHUNK_LINES))
+    while chunk:
+        league_results = {}
+        for result in chunk:
+            league, found, result = result.partition(separator)
+            if not found:
+                raise ValueError("Match result without a league: {!r}".format(league))
+            league_chunk = league_results.get(league)
+            if league_chunk is None:
+                league_chunk = league_results[league] = []
+            league_chunk.append(result)
+
+        for league, league_chunk in league_results.items():
+            league_points[league] = calculate_rank._determine_points(league_chunk, league_points.get(league))
+
+        chunk = list(islice(results, LEAGUE_CHUNK_LINES))
+
+    return league_points
+
+
+def _output_name(template, league):
+    """
+    Resolve the output file name for a league.
+
+    :param template:    Output name. The "{league}" token is replaced with the league's name.
+    :param league:      League name.
+
+    :return: Output file name (no directory).
+    """
+
+    # League names come from the feed. They must never point the output somewhere else.
+    if not league or os.sep in league or (os.altsep and os.altsep in league) or league in (os.curdir, os.pardir):
+        raise InputPath("League name {!r} can not be used in a file name".format(league))
+
+    return template.replace("{league}", league)
+
+
+def _combined_lines(rankings):
+    """
+    Lay out several rankings in one file: the league name, its ranking and an empty line, for every league.
+
+    :param rankings: List of (league name, ranking lines) tuples.
+
+    :return: A generator yielding the lines of the combined file.
+    """
+
+    for league, ranking in rankings:
+        yield league
+        for line in ranking:
+            yield line
+        yield ""
+
+
+def calculate_leagues(full_path, final_name=None, combined=False, separator=DEFAULT_SEPARATOR, top_n=None,
+                      compress=None):
+    """
+    Rank every league in a feed of interleaved leagues. The feed is only read once.
+
+    :param full_path:   Full file path of the feed. May be compressed (see "calculate_rank.COMPRESSIONS").
+    :param final_name:  Output name, written next to the feed. Per league it must contain a "{league}" token.
+                        Defaults to "DEFAULT_LEAGUE_NAME", or "DEFAULT_COMBINED_NAME" for a combined file.
+    :param combined:    Write all leagues to a single file rather than one file per league.
+    :param separator:   String between the league and the match result on every line.
+    :param top_n:       Optional number of table positions to write per league. See "calculate_rank._sort_results".
+    :param compress:    Optional compression name for the written files, one of "calculate_rank.COMPRESSIONS".
+
+    :return: List of (league name, full file path of its written results) tuples, sorted by league name.
+    """
+
+    if final_name is None:
+        final_name = DEFAULT_COMBINED_NAME if combined else DEFAULT_LEAGUE_NAME
+    if not combined and "{league}" not in final_name:
+        raise InputPath("Every league would write to {}. Please use a '{{league}}' output name.".format(final_name))
+
+    results = calculate_rank._stream_file(full_path, compression=calculate_rank._compression(full_path))
+    league_points = _determine_league_points(results, separator)
+
+    location = os.path.dirname(full_path)
+    suffix = "." + compress if compress else ""
+    rankings = [(league, calculate_rank._sort_results(league_points[league], top_n=top_n))
+                for league in sorted(league_points)]
+
+    if combined:
+        write_file_name = os.path.join(location, final_name) + suffix
+        calculate_rank._write_file(write_file_name, _combined_lines(rankings), compress)
+        return [(league, write_file_name) for league, _ in rankings]
+
+    # Check every name before writing anything. A bad league name leaves no half written set of rankings behind.
+    written = [(league, os.path.join(location, _output_name(final_name, league)) + suffix) for league, _ in rankings]
+    for (_, write_file_name), (_, ranking) in zip(written, rankings):
+        calculate_rank._write_file(write_file_name, ranking, compress)
+
+    return written
+
+
+def _get_league_params(argv=None):
+    """
+    Get the league parameters from the command line.
+
+    :param argv: Optional argument list. Defaults to the process arguments.
+
+    :return: argparse namespace with all league options.
+    """
+
+    parser = argparse.ArgumentParser(
+        description='This script will calculate rank results for every league in a file of interleaved leagues.')
+
+    parser.add_argument(
+        '-f', '--filename', type=str, required=True, help='Full file location path of the results feed')
+    parser.add_argument(
+        '-c', '--combined', action='store_true', help='Write all leagues to a single file instead of one per league')
+    parser.add_argument(
+        '-o', '--output-name', type=str, default=None,
+        help='Output file name, written next to the feed. "{{league}}" is replaced with the league name. '
+             '(default: {} per league, {} combined)'.format(DEFAULT_LEAGUE_NAME, DEFAULT_COMBINED_NAME))
+    parser.add_argument(
+        '--separator', type=str, default=DEFAULT_SEPARATOR,
+        help='Separator between the league and the match result (default: tab)')
+    parser.add_argument(
+        '-t', '--top-n', type=int, default=None,
+        help='Only write the top N positions of each table (teams tied at position N are all included)')
+    parser.add_argument(
+        '-z', '--compress', choices=sorted(calculate_rank.COMPRESSIONS), default=None,
+        help='Compress the written results. The compression name is added as a suffix')
+
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    args = _get_league_params()
+
+    full_file_path = os.path.abspath(args.filename)
+    league_outputs = calculate_leagues(
+        full_file_path, final_name=args.output_name, combined=args.combined, separator=args.separator,
+        top_n=args.top_n, compress=args.compress)
+
+    for league_name, output in league_outputs:
+        sys.stdout.write("{}: {}\n".format(league_name, output))
+    sys.stdout.write("{} league(s) ranked\n".format(len(league_outputs)))
@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+
+"""
+Python "NumPy Engine" file.
+
+Optional, vectorized alternative to the pure Python points calculation and sorting in "calculate_rank.py". Same rules,
+same inputs and same outputs - only the heavy lifting is done on NumPy arrays:
+
+- Scores are parsed into integer arrays and team names into index arrays.
+- Win/draw/loss points are determined with vectorized comparisons and summed per team with "np.bincount".
+- The ranking is a single "np.lexsort" on (-points, name) rather than a heap.
+
+NumPy is not needed for anything else, so this module is only imported when the "numpy" engine is asked for.
+
+"""
+
+import numpy as np
+
+from calculate_rank import _parse_result, _render_text
+
+
+def _parse_results(results):
+    """
+    Parse match results into team and score arrays.
+
+    :param results: An iterable containing all team results, as read from file.
+
+    :return: Tuple of (team names array, home team index array, home goals array, away team index array,
+             away goals array). Team names are sorted, so a team's index also gives its alphabetical order.
+    """
+
+    home_teams = []
+    away_teams = []
+    home_goals = []
+    away_goals = []
+
+    for result in results:
+        home_team, home_score, away_team, away_score = _parse_result(result)
+        home_teams.append(home_team)
+        home_goals.append(home_score)
+        away_teams.append(away_team)
+        away_goals.append(away_score)
+
+    # One sort of all names gives us both the distinct teams and every match's team indexes.
+    names, team_ids = np.unique(np.array(home_teams + away_teams), return_inverse=True)
+    matches = len(home_teams)
+
+    return (names, team_ids[:matches], np.array(home_goals, dtype=np.int64),
+            team_ids[matches:], np.array(away_goals, dtype=np.int64))
+
+
+def determine_points(results):
+    """
+    Vectorized "_determine_points". See "calculate_rank._determine_points".
+
+    :param results: An iterable containing all team results, as read from file.
+
+    :return: Dictionary object containing available teams and points scored in league.
+    """
+
+    names, home_ids, home_goals, away_ids, away_goals = _parse_results(results)
+    if not len(names):
+        return {}
+
+    return dict(zip(names.tolist(), _team_points(len(names), home_ids, home_goals, away_ids, away_goals).tolist()))
+
+
+def determine_record_points(names, records):
+    """
+    Vectorized "rank_binary.determine_points", for records already loaded with "rank_binary.load".
+
+    :param names:   List of team names. A team's ID is its position in the list.
+    :param records: Flattened array of (home team ID, away team ID, home goals, away goals) records.
+
+    :return: Dictionary object containing available teams and points scored in league.
+    """
+
+    # No copy - NumPy reads the array's buffer as is. Each row is one match.
+    fields = np.frombuffer(records, dtype=records.typecode).reshape(-1, 4).astype(np.int64)
+
+    points = _team_points(len(names), fields[:, 0], fields[:, 2], fields[:, 1], fields[:, 3])
+    return dict(zip(names, points.tolist()))
+
+
+def _team_points(teams, home_ids, home_goals, away_ids, away_goals):
+    """
+    Sum up the points per team.
+
+    :return: Integer array of points, indexed by team ID.
+    """
+
+    # Winning team takes 3. Losing team takes 0. Draws take 1 each
+    draws = home_goals == away_goals
+    home_points = np.where(home_goals > away_goals, 3, draws.astype(np.int64))
+    away_points = np.where(away_goals > home_goals, 3, draws.astype(np.int64))
+
+    return (np.bincount(home_ids, weights=home_points, minlength=teams) +
+            np.bincount(away_ids, weights=away_points, minlength=teams)).astype(np.int64)
+
+
+def rank_results(points, top_n=None):
+    """
+    Vectorized "_rank_results". See "calculate_rank._rank_results".
+
+    :param points: Dictionary (or TeamRegistry) that contains team names and associated points
+    :param top_n:  Optional number of table positions wanted. Teams tied with the last of those are included.
+
+    :return:    List of (rank, team name, points) tuples.
+                List is sorted where entry 0 is the highest scoring team.
+    """
+
+    items = list(points.items())
+    if not items or (top_n is not None and top_n <= 0):
+        return []
+
+    names = np.array([item[0] for item in items])
+    team_points = np.array([item[1] for item in items], dtype=np.int64)
+
+    # Last key is the primary one: most points first, then alphabetical.
+    order = np.lexsort((names, -team_points))
+    names = names[order]
+    team_points = team_points[order]
+
+    # Teams on the same points share the rank of the first team on those points.
+    positions = np.arange(1, len(team_points) + 1)
+    first = np.ones(len(team_points), dtype=bool)
+    first[1:] = team_points[1:] != team_points[:-1]
+    ranks = np.maximum.accumulate(np.where(first, positions, 0))
+
+    count = len(team_points)
+    if top_n is not None and top_n < count:
+        # Everybody tied on points at the cutoff makes the cut.
+        count = int(np.searchsorted(-team_points, -team_points[top_n - 1], side='right'))
+
+    return list(zip(ranks[:count].tolist(), names[:count].tolist(), team_points[:count].tolist()))
+
+
+def sort_results(points, top_n=None):
+    """
+    Vectorized "_sort_results". See "calculate_rank._sort_results".
+
+    :param points: Dictionary (or TeamRegistry) that contains team names and associated points
+    :param top_n:  Optional number of table positions wanted. Teams tied with the last of those are included.
+
+    :return:    Array containing strings in the format of "<Rank>. <Team name>, <Points> pt(s)".
+                Array is sorted where entry 0 is the highest scoring team.
+    """
+
+    return list(_render_text(rank_results(points, top_n)))
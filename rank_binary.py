@@ -0,0 +1,286 @@
+# -*- coding: utf-8 -*-
+
+"""
+Python "Rank Binary" file.
+
+Compact binary format for (archived) match results, plus the converter from text results files and the loader. A
+binary results file needs no text parsing at all: team names are stored once, and every match is a fixed-width record
+of integers that is read into an "array" in a single call.
+
+Layout (all integers little-endian)
+-----------------------------------
+- Header:   magic bytes ("\x89RNK"), format version, record typecode ("H" or "I"), team count and match count.
+- Teams:    byte length of the team names section, then all team names, UTF-8, separated by newlines. A team's ID is
+            its position in this list.
+- Records:  one (home team ID, away team ID, home goals, away goals) record per match, in input order. Each field is
+            an unsigned 16 bit integer ("H"), or 32 bit ("I") for leagues with more than 65535 teams (or goals).
+
+"calculate_rank.rank_file" recognises binary results files by their magic bytes and loads them through this module.
+
+Usage:
+    python rank_binary.py -f /tmp/match_results.txt -o /tmp/match_results.rnk
+
+"""
+
+import argparse
+import os
+import struct
+import sys
+from array import array
+from itertools import islice
+
+from calculate_rank import (BINARY_MAGIC, ENCODING, EmptyResults, TeamRecord, TeamRegistry, _compression, _open_file,
+                            _parse_result, _stream_file)
+
+
+BINARY_VERSION = 1
+HEADER = struct.Struct('<4sBc2xII')
+SECTION = struct.Struct('<I')
+
+# Record field typecodes, smallest first, with the largest value each can hold.
+RECORD_TYPES = (('H', 0xFFFF), ('I', 0xFFFFFFFF))
+
+# Number of results lines encoded into a plain list before it is moved into the record array.
+ENCODE_CHUNK_LINES = 64 * 1024
+
+
+class BinaryFormatError(ValueError):
+    """
+    Exception that is raised if a binary results file is damaged or of an unknown version.
+    """
+
+
+def encode(results):
+    """
+    Give every team an ID and turn match results into records.
+
+    :param results: An iterable containing all team results, as read from file.
+
+    :return: Tuple of (list of team names, array of record fields). Record fields are flattened like those of "load",
+             in the smallest of "RECORD_TYPES" that holds them all.
+    """
+
+    registry = TeamRegistry()
+    ids = registry.ids
+    team_id = registry.team_id
+
+    # Records are kept in an array of the smallest typecode, not as a list of int objects that would take several
+    # times the memory. A chunk of lines is collected in a short list first: adding to a list is quicker than
+    # appending to an array.
+    typecode, maximum = RECORD_TYPES[0]
+    fields = array(typecode)
+    chunk = []
+    results = iter(results)
+
+    while True:
+        for result in islice(results, ENCODE_CHUNK_LINES):
+            home_team, home_goals, away_team, away_goals = _parse_result(result)
+
+            home_id = ids.get(home_team)
+            if home_id is None:
+                home_id = team_id(home_team)
+            away_id = ids.get(away_team)
+            if away_id is None:
+                away_id = team_id(away_team)
+
+            chunk += (home_id, away_id, home_goals, away_goals)
+
+        if not chunk:
+            break
+
+        largest = max(chunk)
+        if largest > maximum:
+            # Widened at most once or twice, to the smallest typecode that holds everything so far.
+            wider = [(code, code_maximum) for code, code_maximum in RECORD_TYPES if largest <= code_maximum]
+            if not wider:
+                raise BinaryFormatError("Results do not fit the binary format: {} is too large".format(largest))
+            typecode, maximum = wider[0]
+            fields = array(typecode, fields)
+
+        try:
+            fields.fromlist(chunk)
+        except OverflowError:
+            raise BinaryFormatError("Results do not fit the binary format: {} is negative".format(min(chunk)))
+        del chunk[:]
+
+    return registry.names, fields
+
+
+def convert(filename, binary_name):
+    """
+    Convert a text results file into a binary results file. The binary file is written to a temporary file first and
+    then moved into place.
+
+    :param filename:    Full file path that contains match results, in text. May be compressed.
+    :param binary_name: Full file path of the binary results file to write.
+
+    :return: Tuple of (number of teams, number of matches).
+    """
+
+    names, records = encode(_stream_file(filename, compression=_compression(filename)))
+
+    if not records:
+        raise EmptyResults("Empty results file given. Exiting Program.")
+
+    # Team IDs and goals share the record typecode, the smallest one that holds all of them. See "encode".
+    typecode = records.typecode
+    if sys.byteorder != 'little':
+        records.byteswap()
+    matches = len(records) // 4
+    team_count = len(names)
+    names = "\n".join(names).encode(ENCODING)
+
+    temp_name = "{}.{}.tmp".format(binary_name, os.getpid())
+    try:
+        with open(temp_name, 'wb') as binary_file:
+            binary_file.write(HEADER.pack(
+                BINARY_MAGIC, BINARY_VERSION, typecode.encode('ascii'), team_count, matches))
+            binary_file.write(SECTION.pack(len(names)))
+            binary_file.write(names)
+            records.tofile(binary_file)
+
+        os.replace(temp_name, binary_name)
+    except Exception:
+        if os.path.exists(temp_name):
+            os.remove(temp_name)
+        raise
+
+    return team_count, matches
+
+
+def load(filename, compression=None):
+    """
+    Load a binary results file.
+
+    :param filename:    Full file path of a binary results file.
+    :param compression: Compression of the file, see "calculate_rank._compression". Decompressed as it is read.
+
+    :return: Tuple of (list of team names, array of records). Records are flattened: the array holds the home team ID,
+             away team ID, home goals and away goals of the first match, then those of the second match and so on.
+    """
+
+    with _open_file(filename, 'rb', compression) as binary_file:
+        header = binary_file.read(HEADER.size)
+        if len(header) < HEADER.size:
+            raise BinaryFormatError("Truncated binary results file: {}".format(filename))
+
+        magic, version, typecode, teams, matches = HEADER.unpack(header)
+        typecode = typecode.decode('ascii')
+        if magic != BINARY_MAGIC or version != BINARY_VERSION or typecode not in dict(RECORD_TYPES):
+            raise BinaryFormatError("Unknown binary results format: {}".format(filename))
+
+        names_size, = SECTION.unpack(binary_file.read(SECTION.size))
+        names = binary_file.read(names_size).decode(ENCODING).split("\n") if teams else []
+
+        records = array(typecode)
+        try:
+            records.fromfile(binary_file, matches * 4)
+        except (EOFError, ValueError):
+            raise BinaryFormatError("Truncated binary results file: {}".format(filename))
+
+    if len(names) != teams:
+        raise BinaryFormatError("Damaged team names section: {}".format(filename))
+    if not records:
+        raise EmptyResults("Empty results file given. Exiting Program.")
+    if sys.byteorder != 'little':
+        records.byteswap()
+
+    return names, records
+
+
+def determine_points(names, records):
+    """
+    Same as "calculate_rank._determine_team_points", for records loaded with "load". No text is parsed and no team
+    name is hashed per match - points are added up straight from the team IDs in the records.
+
+    :param names:   List of team names. A team's ID is its position in the list.
+    :param records: Flattened array of (home team ID, away team ID, home goals, away goals) records.
+
+    :return: TeamRegistry object containing available teams and points scored in league.
+    """
+
+    registry = TeamRegistry()
+    for name in names:
+        registry.team_id(name)
+
+    # Adding up in a list is faster than in the registry's array. The records are walked four fields at a time.
+    points = [0] * len(names)
+    fields = iter(records)
+    for home_id, away_id, home_goals, away_goals in zip(fields, fields, fields, fields):
+        # Winning team takes 3. Losing team takes 0 (and is already registered). Draws take 1 each
+        if home_goals > away_goals:
+            points[home_id] += 3
+        elif away_goals > home_goals:
+            points[away_id] += 3
+        else:
+            points[home_id] += 1
+            points[away_id] += 1
+
+    registry.points = array('l', points)
+    return registry
+
+
+def determine_standings(names, records):
+    """
+    Same as "calculate_rank._determine_standings", for records loaded with "load".
+
+    :param names:   List of team names. A team's ID is its position in the list.
+    :param records: Flattened array of (home team ID, away team ID, home goals, away goals) records.
+
+    :return: Dictionary of team names and their TeamRecord.
+    """
+
+    teams = [TeamRecord() for _ in names]
+    fields = iter(records)
+    for home_id, away_id, home_goals, away_goals in zip(fields, fields, fields, fields):
+        home = teams[home_id]
+        away = teams[away_id]
+
+        home.goals_for += home_goals
+        home.goals_against += away_goals
+        away.goals_for += away_goals
+        away.goals_against += home_goals
+
+        if home_goals > away_goals:
+            home.won += 1
+            away.lost += 1
+        elif away_goals > home_goals:
+            away.won += 1
+            home.lost += 1
+        else:
+            home.drawn += 1
+            away.drawn += 1
+
+    return dict(zip(names, teams))
+
+
+def _get_convert_params(argv=None):
+    """
+    Get the converter parameters from the command line.
+
+    :param argv: Optional argument list. Defaults to the process arguments.
+
+    :return: argparse namespace with all converter options.
+    """
+
+    parser = argparse.ArgumentParser(description='This script will convert a results file to the binary format.')
+
+    parser.add_argument(
+        '-f', '--filename', type=str, required=True, help='Full file location path of the text results file')
+    parser.add_argument(
+        '-o', '--output', type=str, default=None,
+        help='Binary results file to write (default: the input file name with a ".rnk" extension)')
+
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    args = _get_convert_params()
+    output = args.output or os.path.splitext(args.filename)[0] + ".rnk"
+
+    team_count, match_count = convert(args.filename, output)
+    text_size = os.path.getsize(args.filename)
+    binary_size = os.path.getsize(output)
+
+    print("{} matches, {} teams written to {} ({} bytes, {:.0%} of the text file)".format(
+        match_count, team_count, output, binary_size, binary_size / float(text_size)))
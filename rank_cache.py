@@ -0,0 +1,148 @@
+# -*- coding: utf-8 -*-
+
+"""
+Python "Rank Cache" file.
+
+Local cache of rendered rankings, keyed on the input results file. When a results file has not changed since it was
+last ranked, the ranking is taken from the cache and reading, point calculation and sorting are skipped completely.
+
+
+Cache keys
+----------
+By default a results file is identified by its path, size and modification time. That needs a single "stat" and no
+reading at all, but a file rewritten with the exact same size within the file system's timestamp resolution would be
+missed. A "strong" key hashes the full content of the file instead - still far cheaper than ranking it.
+
+Anything else that changes the output (for example "top_n") is part of the key too.
+
+Eviction
+--------
+The cache is bound to a maximum size in bytes. Every hit refreshes an entry's modification time. When storing a new
+entry pushes the cache over its size, the least recently used entries are removed first.
+
+"""
+
+import os
+
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "ranker")
+DEFAULT_CACHE_SIZE = 256 * 1024 * 1024
+HASH_CHUNK_SIZE = 1024 * 1024
+CACHE_SUFFIX = ".rank"
+ENCODING = 'utf-8'
+
+
+class RankCache(object):
+    """
+    Size bound, least recently used cache of rendered rankings in a local directory.
+    """
+
+    def __init__(self, directory=DEFAULT_CACHE_DIR, max_bytes=DEFAULT_CACHE_SIZE):
+        self.directory = directory
+        self.max_bytes = max_bytes
+
+    def key(self, filename, strong=False, **output_options):
+        """
+        Build the cache key for a results file.
+
+        :param filename:        Full file path that contains match results.
+        :param strong:          Hash the file content rather than using its path, size and modification time.
+        :param output_options:  Any other options that change the rendered ranking.
+
+        :return: Hex digest string.
+        """
+
+        # Only imported when the cache is actually used. Keeps the start-up of uncached runs down.
+        import hashlib
+
+        key = hashlib.sha1()
+        stat = os.stat(filename)
+
+        if strong:
+            with open(filename, 'rb') as input_file:
+                chunk = input_file.read(HASH_CHUNK_SIZE)
+                while chunk:
+                    key.update(chunk)
+                    chunk = input_file.read(HASH_CHUNK_SIZE)
+            identity = "content {}".format(stat.st_size)
+        else:
+            identity = "stat {} {} {!r}".format(os.path.abspath(filename), stat.st_size, stat.st_mtime)
+
+        options = " ".join("{}={!r}".format(name, value) for name, value in sorted(output_options.items()))
+        identity = "{} {}".format(identity, options)
+        key.update(identity.encode(ENCODING))
+
+        return key.hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.directory, key + CACHE_SUFFIX)
+
+    def get(self, key):
+        """
+        Get a cached ranking.
+
+        :param key: Cache key, see "key".
+
+        :return: List of ranking lines, or None on a cache miss.
+        """
+
+        path = self._path(key)
+        try:
+            with open(path, encoding=ENCODING) as cache_file:
+                lines = [line.rstrip('\n') for line in cache_file]
+        except OSError:
+            return None
+
+        # Recently used - keep it around for longer.
+        try:
+            os.utime(path, None)
+        except OSError:
+            pass
+
+        return lines
+
+    def put(self, key, lines):
+        """
+        Store a ranking in the cache, then evict least recently used entries if the cache grew too big.
+
+        :param key:     Cache key, see "key".
+        :param lines:   List of ranking lines.
+        """
+
+        if not os.path.isdir(self.directory):
+            os.makedirs(self.directory)
+
+        path = self._path(key)
+        temp_name = "{}.{}.tmp".format(path, os.getpid())
+        with open(temp_name, 'w', encoding=ENCODING) as cache_file:
+            cache_file.write("".join(line + "\n" for line in lines))
+        os.replace(temp_name, path)
+
+        self.evict()
+
+    def evict(self):
+        """
+        Remove least recently used entries until the cache fits in its maximum size.
+        """
+
+        entries = []
+        total = 0
+        for name in os.listdir(self.directory):
+            if not name.endswith(CACHE_SUFFIX):
+                continue
+            try:
+                stat = os.stat(os.path.join(self.directory, name))
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, name))
+            total += stat.st_size
+
+        entries.sort()
+        for _, size, name in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(os.path.join(self.directory, name))
+            except OSError:
+                pass
+            total -= size
@@ -0,0 +1,180 @@
+# -*- coding: utf-8 -*-
+
+"""
+Python "Rank Follow" file.
+
+Follow mode for match days: the results file stays open while lines are appended to it over the afternoon, and the
+ranking is rewritten whenever it changes.
+
+- The file is polled (one "os.stat" per poll). Appended lines are read from where the previous read stopped and only
+  those are folded into the running points table - nothing is read twice.
+- Appends come in bursts. A burst is only ranked once the file has been quiet for the debounce period, so a batch of
+  results triggers a single re-rank. A burst that never settles is still ranked after "DEBOUNCE_LIMIT" periods.
+- The ranking is only rewritten when it changed, atomically (see "calculate_rank._write_file").
+- A half written last line waits for its newline. A truncated, rewritten or replaced file is read again from the start.
+  A missing file (rotated, or in the middle of being replaced) is waited for.
+
+"""
+
+import os
+import time
+
+from calculate_rank import (DEFAULT_TIEBREAKERS, ENCODING, FOLLOW_DEBOUNCE, FOLLOW_POLL_INTERVAL, OUTPUT_FORMATS,
+                            RENDERERS, _compression, _determine_points, _determine_standings, _fingerprint,
+                            _is_binary_file, _needs_standings, _rank_results, _write_file)
+
+
+# A burst of appends that keeps going is ranked after this many debounce periods anyway.
+DEBOUNCE_LIMIT = 5
+
+
+class ResultsTail(object):
+    """
+    Results file that is kept open and read as lines are appended to it.
+    """
+
+    def __init__(self, filename):
+        self.filename = filename
+        self.results_file = None
+        self.last_state = None
+        self._open()
+
+    def _open(self):
+        # Opened before the old file is closed: if the file is missing, the old one is still there to read from.
+        results_file = open(self.filename, 'rb')
+        if self.results_file is not None:
+            self.results_file.close()
+
+        self.results_file = results_file
+        self.offset = 0
+        self.fingerprint = None
+        self.partial = b""
+
+    def state(self):
+        """
+        :return: Tuple that changes whenever the file is appended to, rewritten or replaced. While the file is missing
+                 (rotated, or about to be replaced) it does not change.
+        """
+
+        try:
+            stat = os.stat(self.filename)
+        except FileNotFoundError:
+            return self.last_state
+
+        self.last_state = stat.st_ino, stat.st_size, stat.st_mtime_ns
+        return self.last_state
+
+    def read_lines(self):
+        """
+        Read the lines appended since the previous read.
+
+        :return: Tuple of (list of new, complete, non blank lines, True if the file was truncated, rewritten or replaced
+                 and is read from the start again). Nothing is read while the file is missing.
+        """
+
+        try:
+            path_stat = os.stat(self.filename)
+            file_stat = os.fstat(self.results_file.fileno())
+
+            # Same checks as the incremental run: same file, no shorter than what we consumed, same consumed bytes.
+            reset = ((path_stat.st_ino, path_stat.st_dev) != (file_stat.st_ino, file_stat.st_dev) or
+                     file_stat.st_size < self.offset or
+                     (self.offset and _fingerprint(self.filename, self.offset) != self.fingerprint))
+            if reset:
+                self._open()
+        except FileNotFoundError:
+            # Rotated, or in the middle of being replaced. Read on once it is back.
+            return [], False
+
+        data = self.results_file.read()
+        self.offset += len(data)
+        if data:
+            try:
+                self.fingerprint = _fingerprint(self.filename, self.offset)
+            except FileNotFoundError:
+                # Gone again already. Whatever takes its place is read from the start.
+                self.fingerprint = None
+
+        # Only complete lines count. The rest waits for its newline.
+        data = self.partial + data
+        end = data.rfind(b"\n") + 1
+        self.partial = data[end:]
+
+        return [line for line in data[:end].decode(ENCODING).split("\n") if line], bool(reset)
+
+    def close(self):
+        self.results_file.close()
+
+
+def follow(full_path, final_name, top_n=None, tiebreakers=DEFAULT_TIEBREAKERS, details=False,
+           output_format=OUTPUT_FORMATS[0], compress=None, poll_interval=FOLLOW_POLL_INTERVAL,
+           debounce=FOLLOW_DEBOUNCE, stop=None, report=None):
+    """
+    Follow a results file and keep its ranking up to date, until stopped. The ranking is written straight away, then
+    after every (debounced) burst of appended lines that changes it.
+
+    :param full_path:       Full file path that contains match results. Plain text only.
+    :param final_name:      File name where the ranking will be stored, in the same location as the input file.
+    :param top_n:           Optional number of table positions to write. See "calculate_rank._rank_results".
+    :param tiebreakers:     Sequence of "TIEBREAKERS" keys to rank by. See "calculate_rank._rank_results".
+    :param details:         Add every team's wins, draws, losses and goals to the written ranking.
+    :param output_format:   Output format, one of "OUTPUT_FORMATS".
+    :param compress:        Optional compression name for the written ranking, one of "COMPRESSIONS".
+    :param poll_interval:   Number of seconds between polls of the results file.
+    :param debounce:        Number of seconds the file must be quiet before appended lines are ranked.
+    :param stop:            Optional callable, asked before every poll. Following ends once it returns True. By
+                            default following goes on until interrupted.
+    :param report:          Optional callable, called with the number of new lines and the written file name after
+                            every rewrite of the ranking.
+    """
+
+    if _compression(full_path) is not None or _is_binary_file(full_path):
+        raise ValueError("Only plain text results files can be followed: {}".format(full_path))
+
+    write_file_name = os.path.join(os.path.dirname(full_path), final_name)
+    if compress is not None:
+        write_file_name += "." + compress
+
+    render = RENDERERS[output_format]
+    fold = _determine_standings if _needs_standings(tiebreakers, details) else _determine_points
+
+    tail = ResultsTail(full_path)
+    try:
+        table = {}
+        rendered = None
+        last_state = None
+        burst_start = None
+        last_change = None
+
+        while stop is None or not stop():
+            now = time.monotonic()
+            state = tail.state()
+            if state != last_state:
+                last_state = state
+                last_change = now
+                if burst_start is None:
+                    burst_start = now
+
+            # The very first read is not held back. After that, wait for the burst to settle.
+            if burst_start is not None and (rendered is None or now - last_change >= debounce or
+                                            now - burst_start >= debounce * DEBOUNCE_LIMIT):
+                burst_start = None
+
+                lines, reset = tail.read_lines()
+                if reset:
+                    table = {}
+                if lines:
+                    table = fold(lines, table)
+
+                # Compared as rendered: the ranked records are the live ones, updated in place by the next fold.
+                new_rendered = list(render(_rank_results(table, top_n=top_n, tiebreakers=tiebreakers,
+                                                         details=details)))
+                if new_rendered != rendered:
+                    _write_file(write_file_name, new_rendered, compress)
+                    rendered = new_rendered
+                    if report is not None:
+                        report(len(lines), write_file_name)
+
+            time.sleep(poll_interval)
+    finally:
+        tail.close()
@@ -0,0 +1,264 @@
+# -*- coding: utf-8 -*-
+
+"""
+Python "Rank Index" file.
+
+Order maintaining ranking table for live leagues. Where "calculate_rank._sort_results" orders the complete table
+from scratch, this index keeps the teams ordered on (-points, name) at all times:
+
+- A points change for a team is an O(log T) remove and insert.
+- "Rank of team X", "teams ranked k..m" and the full table are answered straight from the order.
+
+Rank numbering is the same as "_sort_results": teams on the same points share the rank of the first of them (for
+example "3. FC Awesome" and "3. Snakes"), and the next team's rank skips accordingly.
+
+The order is kept in an indexable skip list. Every link also stores how many positions it skips, which is what allows
+both position lookups and "how many teams are ahead of this key" counts in O(log T).
+
+"""
+
+import random
+
+import calculate_rank
+
+
+class _Node(object):
+    """
+    Skip list node. "next[level]" is the following node on that level, "width[level]" the number of positions to it.
+    """
+
+    __slots__ = ('key', 'next', 'width')
+
+    def __init__(self, key, levels):
+        self.key = key
+        self.next = [None] * levels
+        self.width = [1] * levels
+
+
+class _SkipList(object):
+    """
+    Indexable skip list of unique, comparable keys. The head sits at position 0, keys at positions 1 to size.
+    """
+
+    MAX_LEVELS = 32
+
+    def __init__(self):
+        self.size = 0
+        self.head = _Node(None, self.MAX_LEVELS)
+        self._random = random.Random()
+
+    def _find(self, key):
+        # For every level: the last node before "key", and that node's position.
+        chain = [None] * self.MAX_LEVELS
+        positions = [0] * self.MAX_LEVELS
+        node = self.head
+        position = 0
+        for level in reversed(range(self.MAX_LEVELS)):
+            next_node = node.next[level]
+            while next_node is not None and next_node.key < key:
+                position += node.width[level]
+                node = next_node
+                next_node = node.next[level]
+            chain[level] = node
+            positions[level] = position
+        return chain, positions
+
+    def insert(self, key):
+        chain, positions = self._find(key)
+        position = positions[0] + 1
+
+        levels = 1
+        while levels < self.MAX_LEVELS and self._random.random() < 0.5:
+            levels += 1
+
+        node = _Node(key, levels)
+        for level in range(levels):
+            previous = chain[level]
+            node.next[level] = previous.next[level]
+            previous.next[level] = node
+            node.width[level] = previous.width[level] - (position - 1 - positions[level])
+            previous.width[level] = position - positions[level]
+
+        # Higher links now skip over one more node.
+        for level in range(levels, self.MAX_LEVELS):
+            chain[level].width[level] += 1
+
+        self.size += 1
+
+    def remove(self, key):
+        chain, _ = self._find(key)
+        node = chain[0].next[0]
+        if node is None or node.key != key:
+            raise KeyError(key)
+
+        for level in range(self.MAX_LEVELS):
+            previous = chain[level]
+            if previous.next[level] is node:
+                previous.width[level] += node.width[level] - 1
+                previous.next[level] = node.next[level]
+            else:
+                previous.width[level] -= 1
+
+        self.size -= 1
+
+    def count_less(self, key):
+        """
+        :return: Number of keys smaller than "key".
+        """
+        return self._find(key)[1][0]
+
+    def iterate_from(self, index):
+        """
+        :return: Generator of keys, starting at 0-based "index".
+        """
+
+        node = self.head
+        position = 0
+        for level in reversed(range(self.MAX_LEVELS)):
+            while node.next[level] is not None and position + node.width[level] <= index + 1:
+                position += node.width[level]
+                node = node.next[level]
+
+        while node is not None and position <= self.size:
+            if position:
+                yield node.key
+            node = node.next[0]
+            position += 1
+
+
+class RankingIndex(object):
+    """
+    Live ranking table. Keep points up to date through "set_points", "add_points" or "add_results" and query the
+    order at any time.
+    """
+
+    def __init__(self, points=None):
+        """
+        :param points: Optional dictionary (or TeamRegistry) of team names and points to start from.
+        """
+
+        self.points = {}
+        self._order = _SkipList()
+
+        if points is not None:
+            for team, team_points in points.items():
+                self.set_points(team, team_points)
+
+    def __len__(self):
+        return len(self.points)
+
+    def __contains__(self, team):
+        return team in self.points
+
+    def set_points(self, team, points):
+        """
+        Set the points of a team, adding the team if it is new. O(log T).
+
+        :param team:    Team name.
+        :param points:  New points total.
+        """
+
+        old_points = self.points.get(team)
+        if old_points == points:
+            return
+        if old_points is not None:
+            self._order.remove((-old_points, team))
+
+        self.points[team] = points
+        self._order.insert((-points, team))
+
+    def add_points(self, team, points):
+        """
+        Add points to a team, adding the team if it is new. O(log T).
+
+        :param team:    Team name.
+        :param points:  Points to add.
+        """
+
+        self.set_points(team, self.points.get(team, 0) + points)
+
+    def add_results(self, results):
+        """
+        Add match results to the table, scored exactly as "calculate_rank._determine_points" does.
+
+        :param results: An iterable containing team results, in the input file format.
+        """
+
+        for team, points in calculate_rank._determine_points(results).items():
+            self.add_points(team, points)
+
+    def _rank_of_points(self, points):
+        # One more than the number of teams with more points. "" sorts before any team name.
+        return self._order.count_less((-points, "")) + 1
+
+    def rank(self, team):
+        """
+        Get the rank of a team. O(log T).
+
+        :param team: Team name.
+
+        :return: Rank number, shared with every team on the same points.
+        """
+
+        return self._rank_of_points(self.points[team])
+
+    def ranking(self, first=1, last=None):
+        """
+        Get the teams in table positions "first" to "last" (1-based, inclusive).
+
+        :param first:   First table position wanted.
+        :param last:    Last table position wanted. Defaults to the end of the table.
+
+        :return: List of (rank, team name, points) tuples.
+        """
+
+        first = max(first, 1)
+        if last is None or last > len(self.points):
+            last = len(self.points)
+
+        entries = []
+        position = first
+        rank = None
+        previous_points = None
+        for negative_points, team in self._order.iterate_from(first - 1):
+            if position > last:
+                break
+
+            points = -negative_points
+            if rank is None:
+                # The first team we see may share its rank with teams before "first".
+                rank = self._rank_of_points(points)
+            elif points != previous_points:
+                rank = position
+
+            entries.append((rank, team, points))
+            previous_points = points
+            position += 1
+
+        return entries
+
+    def top(self, top_n):
+        """
+        Get the top "top_n" table positions, plus any teams tied on points with the last of those.
+
+        :param top_n: Number of table positions wanted.
+
+        :return: List of (rank, team name, points) tuples.
+        """
+
+        if top_n <= 0 or not self.points:
+            return []
+
+        last_points = -next(self._order.iterate_from(min(top_n, len(self.points)) - 1))[0]
+
+        # Everybody with at least the points at the cutoff.
+        return self.ranking(1, self._order.count_less((1 - last_points, "")))
+
+    def lines(self, first=1, last=None):
+        """
+        Same as "ranking", rendered the way "calculate_rank._render_text" renders the table.
+
+        :return: List of strings in the format of "<Rank>. <Team name>, <Points> pt(s)".
+        """
+
+        return list(calculate_rank._render_text(self.ranking(first, last)))
@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+
+"""
+Python "Rank Matchday" file.
+
+Rankings as of any matchday, or over any window of matchdays, from a single pass over the results. The index keeps the
+cumulative points of every team at the end of every matchday (a prefix sum over match order):
+
+- "As of matchday d" is the checkpoint of matchday d.
+- "Matchdays a to b" is the checkpoint of matchday b minus that of matchday a - 1.
+
+Either is answered in O(T) without touching the results again, however many queries are asked.
+
+Matchdays
+---------
+Results files do not record matchdays. Matches are taken in file order, a fixed number of them per matchday. By
+default that is one full round: every team playing once, or half the number of teams.
+
+"""
+
+from array import array
+
+import calculate_rank
+import rank_binary
+
+
+class MatchdayIndex(object):
+    """
+    Cumulative points per team at every matchday checkpoint.
+    """
+
+    def __init__(self, names, records, matchday_size=None):
+        """
+        :param names:           List of team names. A team's ID is its position in the list.
+        :param records:         Flattened (home team ID, away team ID, home goals, away goals) records, in match order.
+                                See "rank_binary.load" and "rank_binary.encode".
+        :param matchday_size:   Number of matches per matchday. Defaults to a full round, half the number of teams.
+        """
+
+        if matchday_size is None:
+            matchday_size = len(names) // 2
+        if matchday_size < 1:
+            raise ValueError("A matchday needs at least one match, not {}".format(matchday_size))
+
+        self.names = names
+        self.matchday_size = matchday_size
+        self.matches = len(records) // 4
+
+        # Checkpoint 0 is the start of the season: nobody has any points. Every later checkpoint is a copy of the
+        # running totals, taken as the last match of its matchday is added.
+        totals = array('l', [0]) * len(names)
+        self.checkpoints = [array('l', totals)]
+
+        # Matchday on which every team played its first match. Until then, a team is not part of the table.
+        self.first_matchday = array('l', [0]) * len(names)
+
+        fields = iter(records)
+        matchday_matches = 0
+        for home_id, away_id, home_goals, away_goals in zip(fields, fields, fields, fields):
+            # Winning team takes 3. Losing team takes 0. Draws take 1 each
+            if home_goals > away_goals:
+                totals[home_id] += 3
+            elif away_goals > home_goals:
+                totals[away_id] += 3
+            else:
+                totals[home_id] += 1
+                totals[away_id] += 1
+
+            if not self.first_matchday[home_id]:
+                self.first_matchday[home_id] = len(self.checkpoints)
+            if not self.first_matchday[away_id]:
+                self.first_matchday[away_id] = len(self.checkpoints)
+
+            matchday_matches += 1
+            if matchday_matches == matchday_size:
+                self.checkpoints.append(array('l', totals))
+                matchday_matches = 0
+
+        # A last, short matchday still counts.
+        if matchday_matches:
+            self.checkpoints.append(array('l', totals))
+
+    @property
+    def matchdays(self):
+        return len(self.checkpoints) - 1
+
+    def points(self, first=1, last=None):
+        """
+        Points scored by every team from matchday "first" up to and including matchday "last".
+
+        :param first:   First matchday, counting from 1.
+        :param last:    Last matchday. Defaults to the latest one. Matchdays not played yet are left out.
+
+        :return: Dictionary of team names and points. Teams that did not play before the end of the window are not
+                 included.
+
+        :raises calculate_rank.MatchdayRange: If there are no such matchdays, or none of them was played yet.
+        """
+
+        if first < 1 or (last is not None and first > last):
+            raise calculate_rank.MatchdayRange("No matchdays {} to {}".format(first, last))
+        if first > self.matchdays:
+            raise calculate_rank.MatchdayRange(
+                "No matchday {} in {} matchday(s) of results".format(first, self.matchdays))
+        last = self.matchdays if last is None else min(last, self.matchdays)
+
+        end = self.checkpoints[last]
+        start = self.checkpoints[first - 1]
+        first_matchday = self.first_matchday
+
+        return {name: end[team] - start[team]
+                for team, name in enumerate(self.names) if first_matchday[team] <= last}
+
+    def as_of(self, matchday):
+        """
+        :param matchday: Matchday, counting from 1.
+
+        :return: Dictionary of team names and points at the end of the given matchday.
+        """
+
+        return self.points(1, matchday)
+
+    def ranking(self, first=1, last=None, top_n=None):
+        """
+        :param first:   First matchday, see "points".
+        :param last:    Last matchday, see "points".
+        :param top_n:   Optional number of table positions wanted. See "calculate_rank._rank_results".
+
+        :return: List of (rank, team name, points) tuples over the given matchdays. See "calculate_rank.RENDERERS"
+                 to render them.
+        """
+
+        return calculate_rank._rank_results(self.points(first, last), top_n=top_n)
+
+
+def build_index(results, matchday_size=None):
+    """
+    Build a matchday index straight from match results, in a single pass.
+
+    :param results:         An iterable containing all team results, as read from file.
+    :param matchday_size:   Number of matches per matchday, see "MatchdayIndex".
+
+    :return: MatchdayIndex object.
+    """
+
+    names, fields = rank_binary.encode(results)
+    if not fields:
+        raise calculate_rank.EmptyResults("Empty results file given. Exiting Program.")
+
+    return MatchdayIndex(names, fields, matchday_size)
@@ -0,0 +1,312 @@
+# -*- coding: utf-8 -*-
+
+"""
+Python "Rank Server" file.
+
+This file will facilitate a long running ranking service. League tables are kept in memory, match results can be
+posted to it and the current ranking is served straight from memory - no interpreter start-up, imports or file parsing
+per request.
+
+
+HTTP API
+--------
+GET  /leagues                           List of leagues, one per line.
+GET  /leagues/<league>/ranking          Current ranking, in the same format as "rank_results.txt".
+GET  /leagues/<league>/ranking?top_n=N  Only the top N positions (teams tied at position N are all included).
+POST /leagues/<league>/results          Match result lines (same format as the input files) to add to the league.
+                                        The league is created on its first results.
+
+Concurrency
+-----------
+Every request is handled on its own thread. Writes to a league are applied one at a time under that league's lock,
+after which the ranking is rendered once and swapped in as a whole. Readers never take a lock - they simply serve the
+last rendered ranking, so they are never held up (or shown a half applied update) by a write in progress.
+
+The standard library's threaded HTTP server is used rather than asyncio: asyncio comes without an HTTP server, and a
+request here is either a lock free read of ready made bytes or a short write under a per league lock - there is no
+waiting on I/O for an event loop to overlap.
+
+Posted results are checked strictly (see "RESULT_PATTERN") and a post body may be no larger than "MAX_BODY_SIZE".
+
+"""
+
+import argparse
+import bisect
+import os
+import re
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, unquote, urlparse
+
+import calculate_rank
+from rank_index import RankingIndex
+
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8080
+ENCODING = 'utf-8'
+
+# Largest post body accepted, in bytes. Anything bigger is refused with a 413 before it is read.
+MAX_BODY_SIZE = 1024 * 1024
+
+# A posted match result, for example "Tarantulas 1, FC Awesome 0". Exactly what "calculate_rank._parse_result" splits
+# a line into - a team name (no ", " in it, no leading or trailing space), a space and a score, twice - with plain
+# digits for scores. "int" alone would also take " 1", "1_0" or "-1".
+_TEAM_PATTERN = r"\S(?:(?:(?!, ).)*\S)?"
+RESULT_PATTERN = re.compile(r"({team}) ([0-9]+), ({team}) ([0-9]+)".format(team=_TEAM_PATTERN))
+
+
+def _check_result(result):
+    """
+    Strictly check a posted match result line. The file readers trust their input, posted results are not trusted.
+
+    :param result: A single match result string, for example "Tarantulas 1, FC Awesome 0".
+
+    :raises ValueError: If the line is not exactly two named teams with their scores.
+    """
+
+    if RESULT_PATTERN.fullmatch(result) is None:
+        raise ValueError("Badly formed match result: {!r}".format(result))
+
+
+class League(object):
+    """
+    In memory points table of a single league, plus its last rendered ranking.
+    """
+
+    def __init__(self, name):
+        self.name = name
+        self.index = RankingIndex()
+        self.lock = threading.Lock()
+
+        # Tuple of (full ranking body, ranking lines, rank of each line). Replaced as a whole on every update.
+        self.snapshot = (b"", [], [])
+
+    def add_results(self, results):
+        """
+        Add match results to the league and re-render its ranking.
+
+        :param results: List of match result strings.
+        """
+
+        # Points are additive: determine the points for the new matches only, then add them to the table.
+        new_points = calculate_rank._determine_points(results)
+
+        with self.lock:
+            # Only the teams that played move in the index. The table is then read off in order, no sorting needed.
+            for team, points in new_points.items():
+                self.index.add_points(team, points)
+
+            ranking = self.index.ranking()
+            lines = list(calculate_rank._render_text(ranking))
+            ranks = [rank for rank, _, _ in ranking]
+            self.snapshot = ("".join(line + "\n" for line in lines).encode(ENCODING), lines, ranks)
+
+    def ranking(self, top_n=None):
+        """
+        Get the current ranking.
+
+        :param top_n: Optional number of table positions wanted. See "calculate_rank._sort_results".
+
+        :return: Ranking body, in bytes, as it would be written to file.
+        """
+
+        body, lines, ranks = self.snapshot
+        if top_n is None or top_n >= len(lines):
+            return body
+        if top_n <= 0:
+            return b""
+
+        # Everybody sharing the rank at the cutoff makes the cut.
+        count = bisect.bisect_right(ranks, ranks[top_n - 1])
+        return "".join(line + "\n" for line in lines[:count]).encode(ENCODING)
+
+
+class RankingService(object):
+    """
+    All leagues known to the server.
+    """
+
+    def __init__(self):
+        self.leagues = {}
+        self.lock = threading.Lock()
+
+    def league(self, name, create=False):
+        """
+        Get a league by name.
+
+        :param name:    League name.
+        :param create:  Create the league if it does not exist yet.
+
+        :return: League object, or None if not found (and not created).
+        """
+
+        league = self.leagues.get(name)
+        if league is None and create:
+            with self.lock:
+                league = self.leagues.get(name)
+                if league is None:
+                    league = self.leagues[name] = League(name)
+        return league
+
+    def load_file(self, name, filename):
+        """
+        Load a results file into a league.
+
+        :param name:        League name.
+        :param filename:    Full file path that contains match results.
+        """
+
+        self.league(name, create=True).add_results(calculate_rank._read_file(filename))
+
+
+class _RequestHandler(BaseHTTPRequestHandler):
+    """
+    HTTP front end for a "RankingService". The service is attached to the server object.
+    """
+
+    protocol_version = "HTTP/1.1"
+
+    def _send(self, status, body=b""):
+        self.send_response(status)
+        self.send_header("Content-Type", "text/plain; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _route(self):
+        # Returns the path parts after "/leagues", plus the query parameters.
+        url = urlparse(self.path)
+        parts = [part for part in url.path.split("/") if part]
+        if not parts or parts[0] != "leagues":
+            return None, parse_qs(url.query)
+        return [unquote(part) for part in parts[1:]], parse_qs(url.query)
+
+    def do_GET(self):
+        parts, query = self._route()
+        service = self.server.service
+
+        if parts == []:
+            self._send(200, "".join(name + "\n" for name in sorted(service.leagues)).encode(ENCODING))
+            return
+
+        if parts is None or len(parts) != 2 or parts[1] != "ranking":
+            self._send(404, b"Not found\n")
+            return
+
+        league = service.league(parts[0])
+        if league is None:
+            self._send(404, b"Unknown league\n")
+            return
+
+        try:
+            top_n = int(query["top_n"][0]) if "top_n" in query else None
+        except ValueError:
+            self._send(400, b"top_n must be a number\n")
+            return
+
+        self._send(200, league.ranking(top_n))
+
+    def do_POST(self):
+        parts, _ = self._route()
+        if parts is None or len(parts) != 2 or parts[1] != "results":
+            self._send(404, b"Not found\n")
+            return
+
+        try:
+            length = int(self.headers.get("Content-Length") or 0)
+            if length < 0:
+                raise ValueError("Negative Content-Length: {}".format(length))
+        except ValueError:
+            self.close_connection = True
+            self._send(400, b"Bad Content-Length\n")
+            return
+
+        if length > self.server.max_body_size:
+            # The body is never read, so the connection cannot be used for another request.
+            self.close_connection = True
+            self._send(413, "Request body larger than {} bytes\n".format(self.server.max_body_size).encode(ENCODING))
+            return
+
+        try:
+            body = self.rfile.read(length).decode(ENCODING)
+        except UnicodeDecodeError:
+            self._send(400, b"Request body is not UTF-8\n")
+            return
+        results = [line for line in body.splitlines() if line.strip()]
+
+        # Check every line before applying any of them. A bad post changes nothing.
+        try:
+            for result in results:
+                _check_result(result)
+        except ValueError:
+            self._send(400, b"Badly formed match result\n")
+            return
+
+        self.server.service.league(parts[0], create=True).add_results(results)
+        self._send(200, "{} result(s) added\n".format(len(results)).encode(ENCODING))
+
+    def log_message(self, format, *args):
+        # Keep request logging off the hot path unless asked for.
+        if self.server.verbose:
+            BaseHTTPRequestHandler.log_message(self, format, *args)
+
+
+class RankingServer(ThreadingHTTPServer):
+    """
+    Threaded HTTP server for a "RankingService".
+    """
+
+    daemon_threads = True
+    allow_reuse_address = True
+    max_body_size = MAX_BODY_SIZE
+
+    def __init__(self, address, service=None, verbose=False):
+        ThreadingHTTPServer.__init__(self, address, _RequestHandler)
+        self.service = service if service is not None else RankingService()
+        self.verbose = verbose
+
+
+def _get_server_params(argv=None):
+    """
+    Get the server parameters from the command line.
+
+    :param argv: Optional argument list. Defaults to the process arguments.
+
+    :return: argparse namespace with all server options.
+    """
+
+    parser = argparse.ArgumentParser(description='This script will serve league rankings from memory over HTTP.')
+
+    parser.add_argument(
+        '--host', type=str, default=DEFAULT_HOST, help='Address to listen on (default: {})'.format(DEFAULT_HOST))
+    parser.add_argument(
+        '-p', '--port', type=int, default=DEFAULT_PORT, help='Port to listen on (default: {})'.format(DEFAULT_PORT))
+    parser.add_argument(
+        '-l', '--league', action='append', default=[], metavar='NAME=FILE',
+        help='Preload a league from a results file. Can be given more than once.')
+    parser.add_argument(
+        '-v', '--verbose', action='store_true', help='Log every request')
+
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    args = _get_server_params()
+
+    ranking_service = RankingService()
+    for league_arg in args.league:
+        league_name, _, league_file = league_arg.partition("=")
+        ranking_service.load_file(league_name, os.path.abspath(league_file))
+
+    server = RankingServer((args.host, args.port), ranking_service, verbose=args.verbose)
+    sys.stdout.write("Serving rankings on http://{}:{}/leagues\n".format(*server.server_address[:2]))
+    sys.stdout.flush()
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
@@ -0,0 +1,267 @@
+# -*- coding: utf-8 -*-
+
+"""
+Python "Rank Spill" file.
+
+Points aggregation for results with more distinct teams than fit in memory at once. Nothing is ever held for all teams:
+
+1. Partition:   points are added up in a bounded dictionary, exactly as "calculate_rank._determine_points" does.
+                Whenever it is full, its partial points are appended to on-disk buckets, by hash of the team name.
+2. Aggregate:   every bucket is added up and sorted on its own into a sorted run file. Every team lives in exactly one
+                bucket, so its points are final there. A bucket that is still too big is partitioned again.
+3. Merge:       the sorted runs are k-way merged ("heapq.merge") into the final order, and ranked as they stream by.
+
+The ranking is identical to the in-memory one (points, then name), and is produced lazily, a team at a time, so it can
+be rendered straight into the output file.
+
+"""
+
+import heapq
+import os
+import shutil
+import tempfile
+from itertools import chain, islice
+
+from calculate_rank import ENCODING, EmptyResults, _determine_points
+
+
+# Rough peak memory per team while a bucket is added up and sorted: the dictionary entry, the name and the sort tuple.
+TEAM_BYTES = 256
+
+# Every partitioning level splits into this many buckets, on the next "SPILL_HASH_BITS" bits of the name's hash.
+SPILL_HASH_BITS = 4
+SPILL_FANOUT = 1 << SPILL_HASH_BITS
+MAX_SPILL_LEVELS = 64 // SPILL_HASH_BITS
+
+# Never merge more run files than this at once. More runs are merged in passes.
+MAX_MERGE_RUNS = 64
+
+# Number of results lines added to the partial points at a time. Also capped by the memory limit.
+SPILL_CHUNK_LINES = 64 * 1024
+
+
+def _read_run(filename):
+    """
+    :param filename: Full file path of a sorted run, or a bucket.
+
+    :return: A generator yielding (negated points, team name) tuples, in file order.
+    """
+
+    with open(filename, encoding=ENCODING) as run_file:
+        for line in run_file:
+            points, team = line.rstrip('\n').split('\t', 1)
+            yield -int(points), team
+
+
+class SpilledPoints(object):
+    """
+    Points table that lives on disk, as sorted runs. Use as a context manager (or call "close") to remove the files.
+    """
+
+    def __init__(self, results, memory_limit, directory=None):
+        """
+        Determine the points for all results. The results are read once.
+
+        :param results:         An iterable containing all team results, as read from file.
+        :param memory_limit:    Number of bytes the points aggregation may use. See "TEAM_BYTES".
+        :param directory:       Directory for the spill files. Defaults to the system temporary directory.
+        """
+
+        self.max_teams = max(memory_limit // TEAM_BYTES, 4)
+        self.directory = tempfile.mkdtemp(prefix="ranker-spill-", dir=directory)
+        self.teams = 0
+        self.runs = []
+        self._files = 0
+
+        try:
+            for bucket_name, lines in self._spill(self._partial_points(results), 0):
+                self._aggregate(bucket_name, lines, 1)
+            self.runs = self._merge_runs(self.runs)
+        except Exception:
+            self.close()
+            raise
+
+    def _file_name(self, kind):
+        self._files += 1
+        return os.path.join(self.directory, "{}-{}".format(kind, self._files))
+
+    def _spill(self, points, level):
+        """
+        Write (points, team) pairs to a new set of buckets.
+
+        :param points:  Iterable of (team name, points) tuples.
+        :param level:   Partitioning level. Picks the hash bits the buckets are chosen by.
+
+        :return: List of (bucket file name, number of lines) tuples, one per bucket.
+        """
+
+        shift = level * SPILL_HASH_BITS
+        mask = SPILL_FANOUT - 1
+        names = [self._file_name("bucket") for _ in range(SPILL_FANOUT)]
+        counts = [0] * SPILL_FANOUT
+
+        bucket_files = []
+        try:
+            for name in names:
+                bucket_files.append(open(name, 'w', encoding=ENCODING))
+            writers = [bucket_file.write for bucket_file in bucket_files]
+
+            for team, points in points:
+                bucket = (hash(team) >> shift) & mask
+                writers[bucket]("{}\t{}\n".format(points, team))
+                counts[bucket] += 1
+        finally:
+            for bucket_file in bucket_files:
+                bucket_file.close()
+
+        return list(zip(names, counts))
+
+    def _partial_points(self, results):
+        """
+        Add up points in a bounded dictionary. Whenever it fills up, its partial points are handed on and it starts
+        over empty.
+
+        :param results: An iterable containing all team results, as read from file.
+
+        :return: A generator yielding (team name, points) tuples. A team comes by once for every time it was handed on.
+        """
+
+        # A chunk adds at most two teams per line. Hand on early enough that the dictionary never outgrows the limit.
+        chunk_lines = max(min(SPILL_CHUNK_LINES, self.max_teams // 4), 1)
+        spill_teams = self.max_teams - 2 * chunk_lines
+
+        results = iter(results)
+        chunk = list(islice(results, chunk_lines))
+        if not chunk:
+            raise EmptyResults("Empty results file given. Exiting Program.")
+
+        points = {}
+        while chunk:
+            points = _determine_points(chunk, points)
+            if len(points) > spill_teams:
+                yield from points.items()
+                points = {}
+            chunk = list(islice(results, chunk_lines))
+
+        yield from points.items()
+
+    def _aggregate(self, bucket_name, lines, level):
+        """
+        Add up the points of a bucket and write them as a sorted run. A bucket with more teams than fit in memory is
+        partitioned again, on the next bits of the hash, as soon as that shows.
+
+        :param bucket_name: Full file path of the bucket.
+        :param lines:       Number of lines in the bucket.
+        :param level:       Partitioning level to split an oversized bucket on.
+        """
+
+        if not lines:
+            os.remove(bucket_name)
+            return
+
+        points = {}
+        get_points = points.get
+        bucket = _read_run(bucket_name)
+        for negated_points, team in bucket:
+            points[team] = get_points(team, 0) - negated_points
+
+            if len(points) > self.max_teams and level < MAX_SPILL_LEVELS:
+                # Too many teams after all. Split what is added up so far, plus the rest of the bucket.
+                sub_buckets = self._spill(
+                    chain(points.items(), ((team, -negated_points) for negated_points, team in bucket)), level)
+                del points
+                os.remove(bucket_name)
+                for sub_bucket_name, sub_lines in sub_buckets:
+                    self._aggregate(sub_bucket_name, sub_lines, level + 1)
+                return
+        os.remove(bucket_name)
+
+        # Sorted on (-points, name): the very same order "calculate_rank._rank_results" ranks in.
+        entries = [(-team_points, team) for team, team_points in points.items()]
+        del points
+        entries.sort()
+
+        self.teams += len(entries)
+        run_name = self._file_name("run")
+        with open(run_name, 'w', encoding=ENCODING) as run_file:
+            run_file.writelines("{}\t{}\n".format(-negated_points, team) for negated_points, team in entries)
+        self.runs.append(run_name)
+
+    def _merge_runs(self, runs):
+        """
+        Merge runs in passes until no more than "MAX_MERGE_RUNS" are left, so the final merge never has too many
+        files open.
+
+        :param runs: List of sorted run file names.
+
+        :return: List of sorted run file names.
+        """
+
+        while len(runs) > MAX_MERGE_RUNS:
+            merged = []
+            for first in range(0, len(runs), MAX_MERGE_RUNS):
+                group = runs[first:first + MAX_MERGE_RUNS]
+                run_name = self._file_name("run")
+                with open(run_name, 'w', encoding=ENCODING) as run_file:
+                    run_file.writelines("{}\t{}\n".format(-negated_points, team)
+                                        for negated_points, team in heapq.merge(*[_read_run(run) for run in group]))
+                for run in group:
+                    os.remove(run)
+                merged.append(run_name)
+            runs = merged
+
+        return runs
+
+    def ranking(self, top_n=None):
+        """
+        Rank all teams, merging the sorted runs as the ranking is consumed.
+
+        :param top_n: Optional number of table positions wanted. See "calculate_rank._rank_results".
+
+        :return: A generator yielding (rank, team name, points) tuples, highest ranked team first - exactly what
+                 "calculate_rank._rank_results" returns for the same points.
+        """
+
+        if top_n is not None and top_n <= 0:
+            return
+
+        readers = [_read_run(run) for run in self.runs]
+        try:
+            current_position = 0
+            old_points = None
+            for position, (negated_points, team) in enumerate(heapq.merge(*readers), 1):
+                if negated_points != old_points:
+                    # Everybody tied on points at the cutoff makes the cut. Nobody after them.
+                    if top_n is not None and position > top_n:
+                        break
+                    current_position = position
+                    old_points = negated_points
+
+                yield current_position, team, -negated_points
+        finally:
+            for reader in readers:
+                reader.close()
+
+    def items(self):
+        """
+        :return: A generator yielding (team name, points) tuples for every team, in ranking order.
+        """
+
+        for _, team, points in self.ranking():
+            yield team, points
+
+    def __len__(self):
+        return self.teams
+
+    def close(self):
+        """
+        Remove all spill files.
+        """
+
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
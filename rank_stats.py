@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+
+"""
+Python "Rank Stats" file.
+
+Opt-in instrumentation for the ranking pipeline. Hand a "PipelineStats" object to "calculate_rank.rank_file" (or use
+the "--stats" command-line flag) to find out where the time of a run goes:
+
+- Wall clock and CPU time per stage ("read_file", "determine_points", "sort_results", "write_file").
+- Counters: lines read, teams seen, draws and output bytes.
+
+Without a stats object nothing is measured or counted at all. Note that lazy readers (streaming, sharded and
+incremental runs) read while points are being determined, so their reading time is part of "determine_points".
+CPU time is that of the ranking process only, so worker processes of a sharded run are not included.
+
+"""
+
+import time
+from contextlib import contextmanager
+
+
+class PipelineStats(object):
+    """
+    Stage timings and counters of a single ranking run.
+    """
+
+    def __init__(self, callback=None):
+        """
+        :param callback:    Optional hook, called as "callback(stage name, wall seconds, cpu seconds)" as soon as
+                            each stage finishes. Handy for pushing timings into a metrics system.
+        """
+
+        self.callback = callback
+        self.stages = []
+        self.counters = {}
+
+    @contextmanager
+    def stage(self, name):
+        """
+        Time the enclosed block as pipeline stage "name".
+        """
+
+        wall_start = time.time()
+        cpu_start = time.process_time()
+        try:
+            yield self
+        finally:
+            wall = time.time() - wall_start
+            cpu = time.process_time() - cpu_start
+            self.stages.append((name, wall, cpu))
+            if self.callback is not None:
+                self.callback(name, wall, cpu)
+
+    def count(self, name, value):
+        """
+        Set counter "name".
+        """
+        self.counters[name] = value
+
+    def count_lines(self, results):
+        """
+        Count lines as they pass through, for lazy readers whose length is not known up front.
+
+        :param results: An iterable containing team results.
+
+        :return: Generator yielding the same results.
+        """
+
+        lines = 0
+        try:
+            for result in results:
+                lines += 1
+                yield result
+        finally:
+            self.counters['lines_read'] = lines
+
+    def as_dict(self):
+        """
+        :return: Dictionary of "stages" (name to wall and cpu seconds, in run order) and "counters".
+        """
+
+        return {
+            'stages': [{'stage': name, 'wall': wall, 'cpu': cpu} for name, wall, cpu in self.stages],
+            'counters': dict(self.counters)
+        }
+
+    def report(self, output_format='text'):
+        """
+        Render the stats.
+
+        :param output_format: "text" for a human readable table, "json" for machine consumption.
+
+        :return: Report string, ending in a newline.
+        """
+
+        if output_format == 'json':
+            import json
+
+            return json.dumps(self.as_dict(), sort_keys=True) + "\n"
+
+        lines = ["{:<18}{:>12}{:>12}".format("stage", "wall (s)", "cpu (s)")]
+        for name, wall, cpu in self.stages:
+            lines.append("{:<18}{:>12.4f}{:>12.4f}".format(name, wall, cpu))
+        lines.append("{:<18}{:>12.4f}{:>12.4f}".format(
+            "total", sum(stage[1] for stage in self.stages), sum(stage[2] for stage in self.stages)))
+        for name in sorted(self.counters):
+            lines.append("{}: {}".format(name, self.counters[name]))
+
+        return "\n".join(lines) + "\n"
@@ -0,0 +1,104 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+import calculate_rank
+
+
+class TestDeterminePointsIncremental(unittest.TestCase):
+    """
+    Test class to run unit tests on _determine_points_incremental function.
+    """
+
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.source_file_full = os.path.join(self.test_dir, "test_file.txt")
+        self.state_file_full = os.path.join(self.test_dir, "rank_results.txt.state")
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def _run(self):
+        # Determine points and save the state, exactly as "rank_file" would.
+        points, consumed, state_points = calculate_rank._determine_points_incremental(self.source_file_full,
+                                                                                     self.state_file_full)
+        calculate_rank._save_state(
+            self.state_file_full, consumed, calculate_rank._fingerprint(self.source_file_full, consumed), state_points)
+        return points
+
+    def _write(self, data, mode='w'):
+        with open(self.source_file_full, mode) as file_handler:
+            file_handler.write(data)
+
+    def test__determine_points_incremental(self):
+
+        # First run has no state. Everything is read, but only consumed up to the last newline. The last line has none
+        # yet: it may still be being written. This one is not even a complete result, so it is not ranked either.
+        self._write('Lions 3, Snakes 3\nTarantulas 1, FC')
+        self.assertEqual(self._run(), {'Lions': 1, 'Snakes': 1})
+        self.assertEqual(calculate_rank._load_state(self.state_file_full)[0], len('Lions 3, Snakes 3\n'))
+
+        # The line is completed, and more results are appended. All of them are added to the saved points.
+        self._write(' Awesome 0\nLions 1, FC Awesome 1\nTarantulas 3, Snakes 1\nLions 4, Grouches 0\n', mode='a')
+        self.assertEqual(self._run(), {'Tarantulas': 6, 'FC Awesome': 1, 'Lions': 5, 'Snakes': 1, 'Grouches': 0})
+        self.assertEqual(calculate_rank._load_state(self.state_file_full)[0], os.path.getsize(self.source_file_full))
+
+        # Nothing new. Same points.
+        self.assertEqual(self._run(), {'Tarantulas': 6, 'FC Awesome': 1, 'Lions': 5, 'Snakes': 1, 'Grouches': 0})
+
+        # The saved points are really used: tamper with them and the (bogus) total shows up on the next append.
+        offset, fingerprint, points = calculate_rank._load_state(self.state_file_full)
+        points['Lions'] = 100
+        calculate_rank._save_state(self.state_file_full, offset, fingerprint, points)
+        self._write('Lions 0, Grouches 1\n', mode='a')
+        self.assertEqual(self._run()['Lions'], 100)
+
+        # Rewritten file (same length as before, different content) falls back to a full rebuild.
+        with open(self.source_file_full) as file_handler:
+            data = file_handler.read()
+        self._write(data.replace('Lions', 'Tigers'))
+        self.assertEqual(self._run(), {'Tarantulas': 6, 'FC Awesome': 1, 'Tigers': 5, 'Snakes': 1, 'Grouches': 3})
+
+        # Truncated file falls back to a full rebuild too.
+        self._write('Alpha 10, Zeta 9\n')
+        self.assertEqual(self._run(), {'Alpha': 3, 'Zeta': 0})
+
+        # Unreadable state is simply ignored.
+        with open(self.state_file_full, 'w') as file_handler:
+            file_handler.write('junk')
+        self.assertEqual(self._run(), {'Alpha': 3, 'Zeta': 0})
+
+        # A last line without its newline that parses is ranked, like a full run would. It is not consumed though: once
+        # the score turns out to be half written, the completed line replaces it.
+        self._write('Zeta 3, Alpha 1', mode='a')
+        self.assertEqual(self._run(), {'Alpha': 3, 'Zeta': 3})
+        self.assertEqual(calculate_rank._load_state(self.state_file_full)[0], len('Alpha 10, Zeta 9\n'))
+        self._write('0\n', mode='a')
+        self.assertEqual(self._run(), {'Alpha': 6, 'Zeta': 0})
+
+    def test_no_trailing_newline(self):
+
+        # Same ranking as a full run, whether or not the file ends on a newline.
+        self._write('Lions 3, Snakes 3\nTarantulas 1, FC Awesome 0')
+        self.assertEqual(self._run(), {'Lions': 1, 'Snakes': 1, 'Tarantulas': 3, 'FC Awesome': 0})
+        self.assertEqual(self._run(), {'Lions': 1, 'Snakes': 1, 'Tarantulas': 3, 'FC Awesome': 0})
+
+        os.remove(self.state_file_full)
+        self._write('Lions 3, Snakes 3')
+        self.assertEqual(self._run(), {'Lions': 1, 'Snakes': 1})
+        self.assertEqual(calculate_rank._load_state(self.state_file_full)[0], 0)
+
+        # Nothing but a line that is no result: fails just like a full run.
+        self._write('Lions 3, Snakes')
+        self.assertRaises(ValueError, self._run)
+        self._write('\n')
+        self.assertRaises(calculate_rank.EmptyResults, self._run)
+
+        # End to end: the written ranking is that of a full run.
+        self._write('Lions 3, Snakes 3\nTarantulas 1, FC Awesome 0')
+        for incremental in (False, True, True):
+            output = calculate_rank.rank_file(self.source_file_full, "rank_results.txt", incremental=incremental)
+            with open(output) as file_handler:
+                self.assertEqual(file_handler.read(),
+                                 '1. Tarantulas, 3 pts\n2. Lions, 1 pt\n2. Snakes, 1 pt\n4. FC Awesome, 0 pts\n')
@@ -0,0 +1,56 @@
+import os
+import random
+import shutil
+import tempfile
+import unittest
+
+import calculate_rank
+from calculate_rank import EmptyResults
+
+
+class TestDeterminePointsSharded(unittest.TestCase):
+    """
+    Test class to run unit tests on _determine_points_sharded function.
+    """
+
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.source_file_full = os.path.join(self.test_dir, "test_file.txt")
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def test__determine_points_sharded(self):
+
+        # Build a league with odd team names and multi-digit scores. No trailing newline on the last line, to make
+        # sure that one does not get lost at the end of the last shard.
+        generator = random.Random(7)
+        names = ['Alpha', 'FC Awesome', 'I wish I could WIN 1', 'N0T 1nV4l1d', 'Zeta']
+        lines = []
+        for _ in range(500):
+            home, away = generator.sample(names, 2)
+            lines.append('{} {}, {} {}'.format(home, generator.randint(0, 12), away, generator.randint(0, 12)))
+
+        with open(self.source_file_full, 'w') as file_handler:
+            file_handler.write('\n'.join(lines))
+
+        expected_result = calculate_rank._determine_points(lines)
+
+        # Shards must cover every line exactly once, however the file is cut up.
+        for shards in (1, 2, 7, 64, 10000):
+            offsets = calculate_rank._shard_offsets(self.source_file_full, shards)
+            shard_lines = []
+            for start, end in offsets:
+                shard_lines.extend(calculate_rank._read_shard(self.source_file_full, start, end))
+            self.assertEqual(shard_lines, lines, "Shards did not cover the file for {} shard(s)".format(shards))
+
+        # Tiny shards to force the process pool, and one worker to run in-process. Same outcome as the serial path.
+        for workers in (1, 3):
+            result = calculate_rank._determine_points_sharded(self.source_file_full, workers, min_shard_size=256)
+            self.assertEqual(result, expected_result,
+                             "Sharded points did not match serial points with {} worker(s)".format(workers))
+
+        # Now simulate an empty file.
+        open(self.source_file_full, 'w').close()
+        with self.assertRaises(EmptyResults):
+            calculate_rank._determine_points_sharded(self.source_file_full, 2)
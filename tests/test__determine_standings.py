@@ -0,0 +1,68 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+import calculate_rank
+import rank_binary
+from calculate_rank import TeamRecord
+
+
+class TestDetermineStandings(unittest.TestCase):
+    """
+    Test class to run unit tests on _determine_standings function.
+    """
+
+    results = [
+        'Lions 3, Snakes 3',
+        'Tarantulas 1, FC Awesome 0',
+        'Lions 1, FC Awesome 1',
+        'Tarantulas 3, Snakes 1',
+        'Lions 4, Grouches 0'
+    ]
+
+    def test__determine_standings(self):
+
+        expected_result = {
+            'Lions': TeamRecord(won=1, drawn=2, lost=0, goals_for=8, goals_against=4),
+            'Snakes': TeamRecord(won=0, drawn=1, lost=1, goals_for=4, goals_against=6),
+            'Tarantulas': TeamRecord(won=2, drawn=0, lost=0, goals_for=4, goals_against=1),
+            'FC Awesome': TeamRecord(won=0, drawn=1, lost=1, goals_for=1, goals_against=2),
+            'Grouches': TeamRecord(won=0, drawn=0, lost=1, goals_for=0, goals_against=4)
+        }
+
+        result = calculate_rank._determine_standings(self.results)
+        self.assertEqual(result, expected_result)
+
+        # Same single pass, same points as the points table.
+        self.assertEqual(dict((team, record.points) for team, record in result.items()),
+                         calculate_rank._determine_points(self.results))
+        self.assertEqual(result['Lions'].goal_difference, 4)
+        self.assertEqual(result['Grouches'].goal_difference, -4)
+
+    def test_rank_file(self):
+
+        test_dir = tempfile.mkdtemp()
+        try:
+            source_file_full = os.path.join(test_dir, "test_file.txt")
+            binary_file_full = os.path.join(test_dir, "test_file.rnk")
+            with open(source_file_full, 'w') as file_handler:
+                file_handler.write("".join(result + "\n" for result in self.results))
+            rank_binary.convert(source_file_full, binary_file_full)
+
+            # Text and binary results give the same standings, and sharded runs fall back to a single pass.
+            expected_result = "".join(line + "\n" for line in calculate_rank._sort_results(
+                calculate_rank._determine_standings(self.results), tiebreakers=('points', 'goals_for', 'name'),
+                details=True))
+            for full_path, options in ((source_file_full, {}), (source_file_full, {'workers': 2}),
+                                       (binary_file_full, {})):
+                output = calculate_rank.rank_file(full_path, "rank_results.txt", details=True,
+                                                  tiebreakers=('points', 'goals_for', 'name'), **options)
+                with open(output) as file_handler:
+                    self.assertEqual(file_handler.read(), expected_result)
+
+            self.assertEqual(expected_result.splitlines()[:2], [
+                '1. Tarantulas, 6 pts (W 2, D 0, L 0, GF 4, GA 1, GD +3)',
+                '2. Lions, 5 pts (W 1, D 2, L 0, GF 8, GA 4, GD +4)'])
+        finally:
+            shutil.rmtree(test_dir)
@@ -0,0 +1,49 @@
+import unittest
+import calculate_rank
+
+
+class TestDetermineTeamPoints(unittest.TestCase):
+    """
+    Test class to run unit tests on _determine_team_points function and the TeamRegistry it fills.
+    """
+
+    def test__determine_team_points(self):
+
+        # The compact engine must agree with the dictionary engine on every scenario. Ranking straight off the
+        # registry must agree too - names are only resolved at that point.
+        test_cases = [
+            ['Alpha 1, Zeta 0'],
+            ['Alpha 0, Zeta 1'],
+            ['Alpha 0, Zeta 0', 'Alpha 0, Zeta 0'],
+            ['Alpha 5, Zeta 2', 'Zeta 4, Gamma 1', 'Gamma 4, Alpha 0'],
+            ['I wish I could WIN 1 0, N0T 1nV4l1d 3', 'Help Us 1, Wingzz 23', 'I wish I could WIN 1 1, Help Us 1'],
+            ['Alpha 10, Zeta 9', 'Alpha 2, Zeta 12', 'Alpha 10, Zeta 10'],
+            [
+                'Lions 3, Snakes 3',
+                'Tarantulas 1, FC Awesome 0',
+                'Lions 1, FC Awesome 1',
+                'Tarantulas 3, Snakes 1',
+                'Lions 4, Grouches 0'
+            ]
+        ]
+
+        for test in test_cases:
+            expected_result = calculate_rank._determine_points(test)
+            result = calculate_rank._determine_team_points(test)
+
+            self.assertEqual(dict(result.items()), expected_result,
+                             "Compact points did not match. Expected: {}, Returned: {}".format(
+                                 expected_result, dict(result.items())))
+            self.assertEqual(len(result), len(expected_result))
+            for key, value in expected_result.items():
+                self.assertIn(key, result)
+                self.assertEqual(result[key], value)
+
+            self.assertEqual(calculate_rank._sort_results(result), calculate_rank._sort_results(expected_result))
+
+        # Names get dense IDs in order of appearance, and adding to an existing registry keeps them.
+        registry = calculate_rank._determine_team_points(['Lions 3, Snakes 3'])
+        calculate_rank._determine_team_points(['Tarantulas 1, Lions 0'], registry=registry)
+        self.assertEqual(registry.names, ['Lions', 'Snakes', 'Tarantulas'])
+        self.assertEqual(list(registry.points), [1, 1, 3])
+        self.assertEqual(registry.team_id('Snakes'), 1)
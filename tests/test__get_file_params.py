@@ -0,0 +1,62 @@
+from unittest.mock import patch
+import unittest
+
+import calculate_rank
+
+
+class TestGetFileParams(unittest.TestCase):
+    """
+    Test class to run unit tests on _get_file_params function, and its argparse free fast path.
+    """
+
+    def _params(self, argv):
+        with patch('sys.argv', ['calculate_rank.py'] + argv):
+            full_path, options = calculate_rank._get_file_params()
+
+        # The cache is an object. Compare what it is set up with instead.
+        cache = options.pop('cache')
+        options['cache'] = (cache.directory, cache.max_bytes) if cache is not None else None
+        return full_path, options
+
+    def test__get_simple_params(self):
+
+        test_cases = [
+            (['-f', '/tmp/test_file.txt'], '/tmp/test_file.txt'),
+            (['--filename', '/tmp/test_file.txt'], '/tmp/test_file.txt'),
+            (['--filename=/tmp/test_file.txt'], '/tmp/test_file.txt'),
+            (['-f', '/tmp/test_file.txt', '-s'], None),
+            (['-f', '-s'], None),
+            (['--filename='], None),
+            (['-h'], None),
+            ([], None)
+        ]
+
+        for argv, expected_result in test_cases:
+            self.assertEqual(calculate_rank._get_simple_params(argv), expected_result,
+                             "Unexpected fast path result for {}".format(argv))
+
+    def test__get_file_params(self):
+
+        # The fast path must give exactly what argparse gives for the same file and all defaults.
+        fast = self._params(['-f', '/tmp/test_file.txt'])
+        full = self._params(['-f', '/tmp/test_file.txt', '--engine', 'python'])
+        self.assertEqual(fast, full)
+
+        # And argparse still handles everything else.
+        full_path, options = self._params(['-f', '/tmp/test_file.txt', '-t', '3', '--no-cache', '--stats', 'json'])
+        self.assertEqual(full_path, '/tmp/test_file.txt')
+        self.assertEqual(options['top_n'], 3)
+        self.assertIsNone(options['cache'])
+        self.assertEqual(options['stats'], 'json')
+
+        # Matchday rankings, as of a matchday or over a window of them.
+        _, options = self._params(['-f', '/tmp/test_file.txt', '--as-of', '17'])
+        self.assertEqual(options['matchdays'], (1, 17))
+        _, options = self._params(['-f', '/tmp/test_file.txt', '--window', '13:17', '--matchday-size', '10'])
+        self.assertEqual((options['matchdays'], options['matchday_size']), ((13, 17), 10))
+
+        with patch('sys.stderr'):
+            for argv in (['--window', '17:13'], ['--window', '13'], ['--as-of', '0'],
+                         ['--as-of', '1', '--window', '1:2'], ['--top-n', '0'], ['-t', '-3'], ['-t', 'x'],
+                         ['--workers', '0'], ['--cache-size', '-1'], ['--matchday-size', '0']):
+                self.assertRaises(SystemExit, self._params, ['-f', '/tmp/test_file.txt'] + argv)
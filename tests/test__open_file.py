@@ -0,0 +1,80 @@
+import bz2
+import gzip
+import lzma
+import os
+import shutil
+import tempfile
+import unittest
+
+import calculate_rank
+import rank_binary
+
+
+class TestOpenFile(unittest.TestCase):
+    """
+    Test class to run unit tests on compressed file support: _compression and _open_file.
+    """
+
+    results = 'Lions 3, Snakes 3\nTarantulas 1, FC Awesome 0\nLions 1, FC Awesome 1\nTarantulas 3, Snakes 1\n' \
+              'Lions 4, Grouches 0\n'
+    expected_result = '1. Tarantulas, 6 pts\n2. Lions, 5 pts\n3. FC Awesome, 1 pt\n3. Snakes, 1 pt\n' \
+                      '5. Grouches, 0 pts\n'
+    openers = {'gz': gzip.open, 'bz2': bz2.open, 'xz': lzma.open}
+
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.source_file_full = os.path.join(self.test_dir, "test_file.txt")
+        with open(self.source_file_full, 'w') as file_handler:
+            file_handler.write(self.results)
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def test__compression(self):
+
+        self.assertIsNone(calculate_rank._compression(self.source_file_full))
+        self.assertIsNone(calculate_rank._compression(os.path.join(self.test_dir, "missing.txt")))
+
+        for compression, opener in self.openers.items():
+            # Detected from the content, not the name.
+            compressed_file_full = os.path.join(self.test_dir, "test_file_" + compression)
+            with opener(compressed_file_full, 'wt') as file_handler:
+                file_handler.write(self.results)
+
+            self.assertEqual(calculate_rank._compression(compressed_file_full), compression)
+            self.assertEqual(list(calculate_rank._stream_file(compressed_file_full, compression=compression)),
+                             self.results.splitlines())
+
+    def test__open_file(self):
+
+        # Every compression writes what it reads back.
+        for compression in calculate_rank.COMPRESSIONS:
+            compressed_file_full = os.path.join(self.test_dir, "test_file.txt." + compression)
+            with calculate_rank._open_file(compressed_file_full, 'w', compression) as file_handler:
+                file_handler.write(self.results)
+            with self.openers[compression](compressed_file_full, 'rt') as file_handler:
+                self.assertEqual(file_handler.read(), self.results)
+            with calculate_rank._open_file(compressed_file_full, 'r', compression) as file_handler:
+                self.assertEqual(file_handler.read(), self.results)
+
+    def test_rank_file(self):
+
+        # Compressed in, compressed out. Text and binary results files alike.
+        binary_file_full = os.path.join(self.test_dir, "test_file.rnk")
+        rank_binary.convert(self.source_file_full, binary_file_full)
+
+        for source_file_full in (self.source_file_full, binary_file_full):
+            with open(source_file_full, 'rb') as file_handler:
+                data = file_handler.read()
+
+            for compression, opener in self.openers.items():
+                compressed_file_full = source_file_full + "." + compression
+                with opener(compressed_file_full, 'wb') as file_handler:
+                    file_handler.write(data)
+
+                # Options that need to seek in the file are ignored for compressed input.
+                output = calculate_rank.rank_file(compressed_file_full, "rank_results.txt", workers=2,
+                                                  compress=compression)
+                self.assertEqual(output, os.path.join(self.test_dir, "rank_results.txt." + compression))
+                with opener(output, 'rt') as file_handler:
+                    self.assertEqual(file_handler.read(), self.expected_result)
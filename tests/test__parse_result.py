@@ -0,0 +1,54 @@
+import unittest
+import calculate_rank
+
+
+class TestParseResult(unittest.TestCase):
+    """
+    Test class to run unit tests on _parse_result function.
+    """
+
+    def test__parse_result(self):
+
+        # The parser assumes well-formed input. Team names can contain spaces (and numbers!), scores are the last
+        # "word" of each side of the comma.
+
+        test_cases = [
+            # Scenario: Simple single word names.
+            {
+                'input': 'Lions 3, Snakes 3',
+                'result': ('Lions', 3, 'Snakes', 3)
+            },
+
+            # Scenario: Names with spaces.
+            {
+                'input': 'Tarantulas 1, FC Awesome 0',
+                'result': ('Tarantulas', 1, 'FC Awesome', 0)
+            },
+
+            # Scenario: Names containing numbers, multi-digit scores.
+            {
+                'input': 'I wish I could WIN 1 10, N0T 1nV4l1d 9',
+                'result': ('I wish I could WIN 1', 10, 'N0T 1nV4l1d', 9)
+            }
+        ]
+
+        for test in test_cases:
+            result = calculate_rank._parse_result(test['input'])
+
+            self.assertEqual(result, test['result'],
+                             "Parsed result did not match expectations. Expected: {}, Returned: {}".format(
+                                 test['result'], result
+                             ))
+
+    def test__parse_match(self):
+
+        # Match records carry the same (typed) fields as the plain tuple.
+        result = calculate_rank._parse_match('Tarantulas 1, FC Awesome 0')
+
+        self.assertEqual(result, calculate_rank.MatchResult('Tarantulas', 1, 'FC Awesome', 0))
+        self.assertEqual((result.home_team, result.home_goals, result.away_team, result.away_goals),
+                         calculate_rank._parse_result('Tarantulas 1, FC Awesome 0'))
+        self.assertFalse(hasattr(result, '__dict__'), "Match records should not carry a per instance dictionary.")
+
+        # Badly formed lines are refused.
+        self.assertRaises(ValueError, calculate_rank._parse_match, 'Tarantulas, FC Awesome')
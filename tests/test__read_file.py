@@ -1,4 +1,6 @@
-from mock import call, patch, MagicMock
+from functools import reduce
+from unittest.mock import patch, MagicMock
+import io
 import re
 import unittest
 
@@ -30,7 +32,7 @@ class TestReadFile(unittest.TestCase):
 
         # Patch the open action. We will now see if our various scenarios work. Code coverage is key.
         with patch('calculate_rank.open', create=True) as open_mock:
-            open_mock.return_value = MagicMock(spec=file)
+            open_mock.return_value = MagicMock(spec=io.TextIOWrapper)
             handle = open_mock.return_value.__enter__.return_value
             handle.__iter__.return_value = iter(splitkeepsep(valid_data, "\n"))
 
@@ -47,7 +49,7 @@ class TestReadFile(unittest.TestCase):
             try:
                 calculate_rank._read_file(source_file_full)
                 self.assertFalse(True, "Exceptions were not hit. This is a failure.")
-            except EmptyResults, error:
+            except EmptyResults as error:
                 self.assertEqual(
                     str(error),
                     expected_exception,
@@ -55,7 +57,7 @@ class TestReadFile(unittest.TestCase):
                         expected_exception,
                         str(error)
                     ))
-            except Exception, error:
+            except Exception as error:
                 self.assertFalse(True, "Exception returned that we did not expect. Error was {}".format(
                     error
                 ))
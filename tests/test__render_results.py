@@ -0,0 +1,89 @@
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+import calculate_rank
+
+
+class TestRenderResults(unittest.TestCase):
+    """
+    Test class to run unit tests on _rank_results and the ranking renderers.
+    """
+
+    results = [
+        'Lions 3, Snakes 3',
+        'Tarantulas 1, FC Awesome 0',
+        'Lions 1, FC Awesome 1',
+        'Tarantulas 3, Snakes 1',
+        'Lions 4, Grouches 0'
+    ]
+    ranking = [(1, 'Tarantulas', 6), (2, 'Lions', 5), (3, 'FC Awesome', 1), (3, 'Snakes', 1), (5, 'Grouches', 0)]
+
+    def test__rank_results(self):
+
+        points = calculate_rank._determine_points(self.results)
+        self.assertEqual(calculate_rank._rank_results(points), self.ranking)
+        self.assertEqual(calculate_rank._rank_results(points, top_n=3), self.ranking[:4])
+
+        # Details carry the team's record along.
+        standings = calculate_rank._determine_standings(self.results)
+        ranking = calculate_rank._rank_results(standings, top_n=1, details=True)
+        record = calculate_rank.TeamRecord(won=2, goals_for=4, goals_against=1)
+        self.assertEqual(ranking, [(1, 'Tarantulas', 6, record)])
+        self.assertRaises(ValueError, calculate_rank._rank_results, points, details=True)
+
+    def test__render_text(self):
+
+        self.assertEqual(list(calculate_rank._render_text(self.ranking)),
+                         calculate_rank._sort_results(calculate_rank._determine_points(self.results)))
+
+    def test__render_csv(self):
+
+        self.assertEqual(list(calculate_rank._render_csv(self.ranking[:2] + [(3, 'FC "Awesome", Jr', 1)])), [
+            'rank,team,points',
+            '1,Tarantulas,6',
+            '2,Lions,5',
+            '3,"FC ""Awesome"", Jr",1'
+        ])
+        self.assertEqual(list(calculate_rank._render_csv([])), ['rank,team,points'])
+
+        ranking = calculate_rank._rank_results(calculate_rank._determine_standings(self.results), details=True)
+        self.assertEqual(list(calculate_rank._render_csv(ranking))[:2], [
+            'rank,team,points,won,drawn,lost,goals_for,goals_against,goal_difference',
+            '1,Tarantulas,6,2,0,0,4,1,3'
+        ])
+
+    def test__render_json_lines(self):
+
+        ranking = self.ranking[:1] + [(2, 'Müller "FC"', 5)]
+        lines = list(calculate_rank._render_json_lines(ranking))
+        self.assertEqual(lines[0], '{"rank": 1, "team": "Tarantulas", "points": 6}')
+        self.assertEqual([json.loads(line) for line in lines], [
+            {'rank': 1, 'team': 'Tarantulas', 'points': 6},
+            {'rank': 2, 'team': 'Müller "FC"', 'points': 5}
+        ])
+
+        ranking = calculate_rank._rank_results(calculate_rank._determine_standings(self.results), details=True)
+        self.assertEqual(json.loads(next(calculate_rank._render_json_lines(ranking))), {
+            'rank': 1, 'team': 'Tarantulas', 'points': 6, 'won': 2, 'drawn': 0, 'lost': 0, 'goals_for': 4,
+            'goals_against': 1, 'goal_difference': 3
+        })
+
+    def test_rank_file(self):
+
+        test_dir = tempfile.mkdtemp()
+        try:
+            source_file_full = os.path.join(test_dir, "test_file.txt")
+            with open(source_file_full, 'w') as file_handler:
+                file_handler.write("".join(result + "\n" for result in self.results))
+
+            # Every format, straight from the ranking into the file.
+            for output_format, renderer in calculate_rank.RENDERERS.items():
+                output = calculate_rank.rank_file(source_file_full, "rank_results." + output_format,
+                                                  output_format=output_format)
+                with open(output, encoding='utf-8') as file_handler:
+                    self.assertEqual(file_handler.read(), "".join(line + "\n" for line in renderer(self.ranking)))
+        finally:
+            shutil.rmtree(test_dir)
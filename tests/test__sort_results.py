@@ -7,6 +7,9 @@ class TestSortResults(unittest.TestCase):
     Test class to run unit tests on _sort_results function.
     """
 
+    # Function under test. Other engines re-run these scenarios by overriding this.
+    sort_results = staticmethod(calculate_rank._sort_results)
+
     def test__sort_results(self):
 
         # Run scenarios for sorting against function. Since we are testing an internal function, it is assumed that
@@ -100,7 +103,7 @@ class TestSortResults(unittest.TestCase):
         ]
 
         for test in test_cases:
-            result = calculate_rank._sort_results(test['input'])
+            result = self.sort_results(test['input'])
 
             # The returned value is an array of strings. The strings must match exactly, and the array entries
             # must match exactly (since it is now ordered).
@@ -113,3 +116,103 @@ class TestSortResults(unittest.TestCase):
                                      count, value, test['result'][count]
                                  ))
 
+    def test__sort_results_top_n(self):
+
+        # Run scenarios for the partial "top N" ranking. Teams that tie with the last team in the cut share its rank,
+        # so they must all be returned.
+        points = {'Tarantulas': 6, 'FC Awesome': 1, 'Lions': 5, 'Snakes': 1, 'Grouches': 0}
+
+        test_cases = [
+            # Scenario: Only the leader.
+            {
+                'top_n': 1,
+                'result': ['1. Tarantulas, 6 pts']
+            },
+
+            # Scenario: Cut falls on a tie. Both teams on the third rank are returned.
+            {
+                'top_n': 3,
+                'result': ['1. Tarantulas, 6 pts', '2. Lions, 5 pts', '3. FC Awesome, 1 pt', '3. Snakes, 1 pt']
+            },
+
+            # Scenario: Cut is larger than the table. Full table is returned.
+            {
+                'top_n': 10,
+                'result': self.sort_results(points)
+            },
+
+            # Scenario: Nothing wanted.
+            {
+                'top_n': 0,
+                'result': []
+            }
+        ]
+
+        for test in test_cases:
+            result = self.sort_results(points, top_n=test['top_n'])
+
+            self.assertEqual(result, test['result'],
+                             "Returned result did not match expectations for top {}. "
+                             "Expected: {}, Returned: {}".format(test['top_n'], test['result'], result))
+
+
+class TestSortResultsTiebreakers(unittest.TestCase):
+    """
+    Test class to run unit tests on _sort_results tiebreakers, which need standings rather than points.
+    """
+
+    def test__sort_results_tiebreakers(self):
+
+        # Alpha and Zeta are level on points. Zeta has the better goal difference, Alpha scored more.
+        standings = calculate_rank._determine_standings([
+            'Alpha 4, Beta 3',
+            'Zeta 2, Beta 0',
+            'Alpha 3, Zeta 3',
+            'Beta 1, Gamma 1'
+        ])
+
+        test_cases = [
+            # Scenario: Default. Points, then alphabetical - the points table gives the very same ranking.
+            {
+                'tiebreakers': calculate_rank.DEFAULT_TIEBREAKERS,
+                'result': ['1. Alpha, 4 pts', '1. Zeta, 4 pts', '3. Beta, 1 pt', '3. Gamma, 1 pt']
+            },
+
+            # Scenario: Goal difference breaks the tie at the top, not at the bottom (Beta -3, Gamma 0).
+            {
+                'tiebreakers': ('points', 'goal_difference', 'name'),
+                'result': ['1. Zeta, 4 pts', '2. Alpha, 4 pts', '3. Gamma, 1 pt', '4. Beta, 1 pt']
+            },
+
+            # Scenario: Goals scored first.
+            {
+                'tiebreakers': ('points', 'goals_for', 'name'),
+                'result': ['1. Alpha, 4 pts', '2. Zeta, 4 pts', '3. Beta, 1 pt', '4. Gamma, 1 pt']
+            },
+
+            # Scenario: Without the name, teams equal on everything share the rank.
+            {
+                'tiebreakers': ('points',),
+                'result': ['1. Alpha, 4 pts', '1. Zeta, 4 pts', '3. Beta, 1 pt', '3. Gamma, 1 pt']
+            }
+        ]
+
+        for test in test_cases:
+            result = calculate_rank._sort_results(standings, tiebreakers=test['tiebreakers'])
+            self.assertEqual(result, test['result'],
+                             "Returned result did not match expectations for {}. Expected: {}, Returned: {}".format(
+                                 test['tiebreakers'], test['result'], result))
+
+        self.assertEqual(calculate_rank._sort_results(standings),
+                         calculate_rank._sort_results(calculate_rank._determine_points([
+                             'Alpha 4, Beta 3', 'Zeta 2, Beta 0', 'Alpha 3, Zeta 3', 'Beta 1, Gamma 1'])))
+
+        # Top N cuts on the full tiebreak, details are added at the end of the line.
+        self.assertEqual(
+            calculate_rank._sort_results(standings, top_n=1, tiebreakers=('points', 'goal_difference', 'name'),
+                                         details=True),
+            ['1. Zeta, 4 pts (W 1, D 1, L 0, GF 5, GA 3, GD +2)'])
+
+        # A points table can not be ranked by goals.
+        self.assertRaises(ValueError, calculate_rank._sort_results, {'Alpha': 3}, tiebreakers=('goal_difference',))
+        self.assertRaises(ValueError, calculate_rank._sort_results, standings, tiebreakers=('wins',))
@@ -0,0 +1,61 @@
+import os
+import shutil
+import tempfile
+import types
+import unittest
+
+import calculate_rank
+from calculate_rank import EmptyResults
+
+
+class TestStreamFile(unittest.TestCase):
+    """
+    Test class to run unit tests on _stream_file function.
+    """
+
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.source_file_full = os.path.join(self.test_dir, "test_file.txt")
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def test__stream_file(self):
+
+        # Same data as the "_read_file" tests. We use a tiny chunk size so that more than one chunk is read.
+        valid_data = 'FIRST_LINE\nSECOND_LINE\nTHIRD_LINE'
+        expected_result = ['FIRST_LINE', 'SECOND_LINE', 'THIRD_LINE']
+        expected_exception = "Empty results file given. Exiting Program."
+
+        with open(self.source_file_full, 'w') as file_handler:
+            file_handler.write(valid_data)
+
+        result = calculate_rank._stream_file(self.source_file_full, chunk_size=4)
+
+        # Nothing may be read before we start iterating. That is the whole point...
+        self.assertIsInstance(result, types.GeneratorType, "Streaming reader did not return a generator.")
+        self.assertEqual(
+            list(result), expected_result,
+            " Expected result was {}, returned result was {}".format(expected_result, result)
+        )
+
+        # The points calculation must take the stream directly.
+        with open(self.source_file_full, 'w') as file_handler:
+            file_handler.write('Lions 3, Snakes 3\nTarantulas 1, FC Awesome 0\n')
+
+        points = calculate_rank._determine_points(calculate_rank._stream_file(self.source_file_full, chunk_size=4))
+        self.assertEqual(points, {'Lions': 1, 'Snakes': 1, 'Tarantulas': 3, 'FC Awesome': 0})
+
+        # Now simulate an empty file. The exception is raised as soon as the stream is consumed.
+        open(self.source_file_full, 'w').close()
+
+        with self.assertRaises(EmptyResults) as context:
+            list(calculate_rank._stream_file(self.source_file_full))
+
+        self.assertEqual(
+            str(context.exception),
+            expected_exception,
+            "Incorrect exception error returned. Expected: {}, Returned: {}".format(
+                expected_exception,
+                str(context.exception)
+            ))
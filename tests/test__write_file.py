@@ -1,4 +1,7 @@
-from mock import call, patch, mock_open
+from unittest.mock import call, patch, mock_open
+import os
+import shutil
+import tempfile
 import unittest
 
 import calculate_rank
@@ -20,29 +23,59 @@ class TestWriteFile(unittest.TestCase):
         # Since this is an internal function (supposed to be) we don't check for bad input.
         # Of course this is python... nothing is internal....
         destination_file_full = "/tmp/test_result_file.txt"
+        temp_file_full = "/tmp/test_result_file.txt.{}.tmp".format(os.getpid())
         write_data = ["1. TEAM A, 6", "2. TEAM B, 3", "3. TEAM C, 0"]
 
         open_mock = mock_open()
         # Patch the open action. We will now see if our various scenarios work. Code coverage is key.
-        with patch('calculate_rank.open', open_mock):
+        with patch('calculate_rank.open', open_mock, create=True), \
+                patch('calculate_rank.os.replace') as replace_mock:
             calculate_rank._write_file(destination_file_full, write_data)
 
-        # Now check that we are writing to the right location...
-        open_mock.assert_called_once_with(destination_file_full, 'w')
+        # Now check that we are writing to a temporary file in the right location, and only then move it into place.
+        open_mock.assert_called_once_with(
+            temp_file_full, 'w', calculate_rank.WRITE_BUFFER_SIZE, encoding=calculate_rank.ENCODING)
+        replace_mock.assert_called_once_with(temp_file_full, destination_file_full)
 
-        # Also check that we are calling the write in the correct way. Order of calls are important. Exact data too.
+        # Also check that we are calling the write in the correct way. Lines are written in one go. Exact data too.
         # And remember that we are appending \n. Also good to check.
         handle = open_mock()
-        handle_mocks = handle.write.mock_calls
-        for position, data in enumerate(write_data):
-            expected_call = call(
-                data + '\n'
+        expected_call = call("".join(data + '\n' for data in write_data))
+        self.assertEqual(
+            handle.write.mock_calls, [expected_call],
+            "Mock called with different values. Expected: {}, Called: {}".format(
+                expected_call, handle.write.mock_calls
             )
+        )
 
-            self.assertEqual(
-                handle_mocks[position], expected_call,
-                "Mock called with different values. Expected: {}, Called: {}".format(
-                    expected_call, handle_mocks[position]
-                )
-            )
+    def test__write_file_replace(self):
+        """
+        Test the write against a real directory: large batches, the final content and no temporary files left.
+        """
+
+        test_dir = tempfile.mkdtemp()
+        try:
+            destination_file_full = os.path.join(test_dir, "rank_results.txt")
+            with open(destination_file_full, 'w') as file_handler:
+                file_handler.write("old ranking\n")
+
+            write_data = ["{}. TEAM {}, 0 pts".format(position, position) for position in range(1, 10001)]
+            calculate_rank._write_file(destination_file_full, iter(write_data))
+
+            with open(destination_file_full) as file_handler:
+                self.assertEqual(file_handler.read(), "".join(data + '\n' for data in write_data))
+            self.assertEqual(os.listdir(test_dir), ["rank_results.txt"])
+
+            # A failing write leaves the old ranking alone, and cleans up after itself.
+            def broken_results():
+                yield "1. TEAM A, 3 pts"
+                raise RuntimeError("Broken")
+
+            with self.assertRaises(RuntimeError):
+                calculate_rank._write_file(destination_file_full, broken_results())
 
+            with open(destination_file_full) as file_handler:
+                self.assertEqual(file_handler.read(), "".join(data + '\n' for data in write_data))
+            self.assertEqual(os.listdir(test_dir), ["rank_results.txt"])
+        finally:
+            shutil.rmtree(test_dir)
@@ -0,0 +1,72 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+import batch_rank
+from calculate_rank import InputPath
+
+
+class TestBatchRank(unittest.TestCase):
+    """
+    Test class to run unit tests on the batch ranking entry point.
+    """
+
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def _write(self, *parts):
+        # Last part is the content, everything before it is the path below our test directory.
+        full_path = os.path.join(self.test_dir, *parts[:-1])
+        if not os.path.isdir(os.path.dirname(full_path)):
+            os.makedirs(os.path.dirname(full_path))
+        with open(full_path, 'w') as file_handler:
+            file_handler.write(parts[-1])
+        return full_path
+
+    def _read(self, *parts):
+        with open(os.path.join(self.test_dir, *parts)) as file_handler:
+            return file_handler.read()
+
+    def test_calculate_batch(self):
+
+        # Two good leagues, one in each directory, and one empty (bad) file. The bad file must be reported without
+        # stopping the others.
+        good_one = self._write('league_a', 'results.txt', 'Lions 3, Snakes 3\nTarantulas 1, FC Awesome 0\n')
+        good_two = self._write('league_b', 'results.txt', 'Alpha 10, Zeta 9\n')
+        bad = self._write('league_c', 'results.txt', '')
+
+        for workers in (1, 2):
+            results = batch_rank.calculate_batch(
+                [os.path.join(self.test_dir, '*', '*.txt')], workers=workers)
+
+            self.assertEqual([entry[0] for entry in results], sorted([good_one, good_two, bad]))
+            errors = dict((entry[0], entry[2]) for entry in results)
+            self.assertIsNone(errors[good_one])
+            self.assertIsNone(errors[good_two])
+            self.assertEqual(errors[bad], "EmptyResults: Empty results file given. Exiting Program.")
+
+            self.assertEqual(self._read('league_a', 'rank_results.txt'),
+                             '1. Tarantulas, 3 pts\n2. Lions, 1 pt\n2. Snakes, 1 pt\n4. FC Awesome, 0 pts\n')
+            self.assertEqual(self._read('league_b', 'rank_results.txt'), '1. Alpha, 3 pts\n2. Zeta, 0 pts\n')
+            self.assertFalse(os.path.exists(os.path.join(self.test_dir, 'league_c', 'rank_results.txt')))
+
+    def test_calculate_batch_directory(self):
+
+        # Directory scans must not pick up our own outputs. Several inputs per directory need a "{stem}" name.
+        self._write('league', 'one.txt', 'Alpha 1, Zeta 0\n')
+        self._write('league', 'two.txt', 'Alpha 0, Zeta 1\n')
+        league_dir = os.path.join(self.test_dir, 'league')
+
+        with self.assertRaises(InputPath):
+            batch_rank.calculate_batch([league_dir], workers=1)
+
+        for _ in range(2):
+            results = batch_rank.calculate_batch([league_dir], final_name='{stem}_rank.txt', workers=1)
+            self.assertEqual(len(results), 2)
+
+        self.assertEqual(self._read('league', 'one_rank.txt'), '1. Alpha, 3 pts\n2. Zeta, 0 pts\n')
+        self.assertEqual(self._read('league', 'two_rank.txt'), '1. Zeta, 3 pts\n2. Alpha, 0 pts\n')
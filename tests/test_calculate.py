@@ -1,4 +1,4 @@
-from mock import call, patch
+from unittest.mock import patch
 import unittest
 
 import calculate_rank
@@ -28,20 +28,27 @@ class TestCalculate(unittest.TestCase):
             "C-Team": 1
         }
 
+        rank_results_return = [
+            (1, "A-Team", 6),
+            (2, "B-Team", 1),
+            (2, "C-Team", 1)
+        ]
+
+        # The ranking is rendered on its way into the file.
         sort_results_return = [
-            "1. A - Team, 6 pts",
-            "2. B - Team, 1 pt",
-            "2. C - Team, 1 pt"
+            "1. A-Team, 6 pts",
+            "2. B-Team, 1 pt",
+            "2. C-Team, 1 pt"
         ]
 
         source_file_full = "/tmp/test_file.txt"
         destination_filename = "test_results.txt"
         dest_file_full = "/tmp/test_results.txt"
 
-        with patch('calculate_rank._get_file_params', return_value=source_file_full) as gfp_mock, \
+        with patch('calculate_rank._get_file_params', return_value=(source_file_full, {})) as gfp_mock, \
                 patch('calculate_rank._read_file', return_value=read_file_return) as rf_mock, \
                 patch('calculate_rank._determine_points', return_value=determine_points_return) as dp_mock, \
-                patch('calculate_rank._sort_results', return_value=sort_results_return) as sr_mock, \
+                patch('calculate_rank._rank_results', return_value=rank_results_return) as rr_mock, \
                 patch('calculate_rank._write_file') as wf_mock:
 
             # Now we are finally able to call that function without actually calling anything. only test the function
@@ -50,10 +57,23 @@ class TestCalculate(unittest.TestCase):
 
         # Now check that certain functions are called with the correct variables. The only real thing to check is that
         # our "write file" function is called with the "destination filename" we gave the calculate function.
-        expected_call = [call(
-            dest_file_full, sort_results_return
-        )]
-        wf_mock.assert_has_calls(expected_call)
+        destination, written, compression = wf_mock.call_args[0]
+        self.assertEqual((destination, list(written), compression), (dest_file_full, sort_results_return, None))
+
+        # In streaming mode the lazy reader must be used instead of reading the whole file up front.
+        with patch('calculate_rank._get_file_params', return_value=(source_file_full, {'stream': True})), \
+                patch('calculate_rank._read_file') as rf_mock, \
+                patch('calculate_rank._stream_file', return_value=iter(read_file_return)) as stream_mock, \
+                patch('calculate_rank._determine_points', return_value=determine_points_return) as dp_mock, \
+                patch('calculate_rank._rank_results', return_value=rank_results_return), \
+                patch('calculate_rank._write_file') as wf_mock:
+
+            calculate_rank.calculate(destination_filename)
+
+        stream_mock.assert_called_once_with(source_file_full, compression=None)
+        self.assertFalse(rf_mock.called, "Full file read was used in streaming mode.")
+        destination, written, compression = wf_mock.call_args[0]
+        self.assertEqual((destination, list(written), compression), (dest_file_full, sort_results_return, None))
 
         # The next few tests are for our Exceptions. We wont patch out everything again since the asserts take place
         # before that. We will fake the return of the "get file params" function to test the asserts. This ties
@@ -61,8 +81,8 @@ class TestCalculate(unittest.TestCase):
         # does absolutely nothing else but return the given input filename
 
         source_file_full_returns = [
-            "test_file.txt",
-            "tmp/"
+            ("test_file.txt", {}),
+            ("tmp/", {})
         ]
 
         # Now set it up with a side-effect to return different values on each call.
@@ -73,7 +93,7 @@ class TestCalculate(unittest.TestCase):
             try:
                 calculate_rank.calculate(destination_filename)
                 self.assertFalse(True, "Exception was not hit. This is unexpected.")
-            except InputPath, error:
+            except InputPath as error:
                 self.assertEqual(
                     str(error),
                     first_exception,
@@ -81,7 +101,7 @@ class TestCalculate(unittest.TestCase):
                         first_exception,
                         str(error)
                     ))
-            except Exception, error:
+            except Exception as error:
                 self.assertFalse(True, "Exception returned that we did not expect. Error was {}".format(
                     error
                 ))
@@ -89,7 +109,7 @@ class TestCalculate(unittest.TestCase):
             try:
                 calculate_rank.calculate(destination_filename)
                 self.assertFalse(True, "Exception was not hit. This is unexpected.")
-            except InputPath, error:
+            except InputPath as error:
                 self.assertEqual(
                     str(error),
                     second_exception,
@@ -97,7 +117,7 @@ class TestCalculate(unittest.TestCase):
                         second_exception,
                         str(error)
                     ))
-            except Exception, error:
+            except Exception as error:
                 self.assertFalse(True, "Exception returned that we did not expect. Error was {}".format(
                     error
                 ))
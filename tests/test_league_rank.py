@@ -0,0 +1,85 @@
+from unittest.mock import patch
+import os
+import shutil
+import tempfile
+import unittest
+
+import calculate_rank
+import league_rank
+from calculate_rank import InputPath
+
+
+class TestLeagueRank(unittest.TestCase):
+    """
+    Test class to run unit tests on the multi-league ranking entry point.
+    """
+
+    premier = [
+        'Lions 3, Snakes 3',
+        'Tarantulas 1, FC Awesome 0',
+        'Lions 1, FC Awesome 1',
+        'Tarantulas 3, Snakes 1',
+        'Lions 4, Grouches 0'
+    ]
+    championship = [
+        'Alpha 10, Zeta 9',
+        'Zeta 2, Alpha 2'
+    ]
+
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.source_file_full = os.path.join(self.test_dir, "feed.txt")
+
+        # Interleave the two leagues, one match at a time.
+        lines = ["premier\t" + result for result in self.premier]
+        for position, result in enumerate(self.championship):
+            lines.insert(position * 2 + 1, "championship\t" + result)
+        self._write(lines)
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def _write(self, lines):
+        with open(self.source_file_full, 'w') as file_handler:
+            file_handler.write("".join(line + "\n" for line in lines))
+
+    def _read(self, name):
+        with open(os.path.join(self.test_dir, name)) as file_handler:
+            return file_handler.read()
+
+    def test__determine_league_points(self):
+
+        expected_result = {
+            'premier': calculate_rank._determine_points(self.premier),
+            'championship': calculate_rank._determine_points(self.championship)
+        }
+
+        # However the feed is chunked, every league must get exactly its own points.
+        for chunk_lines in (1, 2, 1000):
+            with patch('league_rank.LEAGUE_CHUNK_LINES', chunk_lines):
+                results = calculate_rank._stream_file(self.source_file_full)
+                self.assertEqual(league_rank._determine_league_points(results), expected_result)
+
+        self.assertRaises(ValueError, league_rank._determine_league_points, ['Lions 3, Snakes 3'])
+
+    def test_calculate_leagues(self):
+
+        written = league_rank.calculate_leagues(self.source_file_full)
+        self.assertEqual(written, [
+            ('championship', os.path.join(self.test_dir, 'championship_rank_results.txt')),
+            ('premier', os.path.join(self.test_dir, 'premier_rank_results.txt'))
+        ])
+        self.assertEqual(self._read('championship_rank_results.txt'), "1. Alpha, 4 pts\n2. Zeta, 1 pt\n")
+        self.assertEqual(self._read('premier_rank_results.txt'),
+                         "".join(line + "\n" for line in calculate_rank._sort_results(
+                             calculate_rank._determine_points(self.premier))))
+
+        # All leagues in one file.
+        league_rank.calculate_leagues(self.source_file_full, combined=True, top_n=1)
+        self.assertEqual(self._read('rank_results.txt'),
+                         "championship\n1. Alpha, 4 pts\n\npremier\n1. Tarantulas, 6 pts\n\n")
+
+        # Leagues must not share an output file, or write outside of the feed's directory.
+        self.assertRaises(InputPath, league_rank.calculate_leagues, self.source_file_full, "rank_results.txt")
+        self._write(["../premier\tLions 3, Snakes 3"])
+        self.assertRaises(InputPath, league_rank.calculate_leagues, self.source_file_full)
@@ -0,0 +1,31 @@
+import unittest
+
+try:
+    import numpy_engine
+except ImportError:
+    numpy_engine = None
+
+import test__determine_points
+import test__sort_results
+
+
+# The NumPy engine is optional. The parity tests only run when NumPy is installed.
+requires_numpy = unittest.skipIf(numpy_engine is None, "NumPy is not installed")
+
+
+@requires_numpy
+class TestNumpyDeterminePoints(test__determine_points.TestDeterminePoints):
+    """
+    Run all _determine_points scenarios against the NumPy engine.
+    """
+
+    determine_points = staticmethod(numpy_engine.determine_points if numpy_engine else None)
+
+
+@requires_numpy
+class TestNumpySortResults(test__sort_results.TestSortResults):
+    """
+    Run all _sort_results scenarios against the NumPy engine.
+    """
+
+    sort_results = staticmethod(numpy_engine.sort_results if numpy_engine else None)
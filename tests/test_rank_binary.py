@@ -0,0 +1,134 @@
+from unittest.mock import patch
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+
+import calculate_rank
+import rank_binary
+
+try:
+    import numpy_engine
+except ImportError:
+    numpy_engine = None
+
+
+class TestRankBinary(unittest.TestCase):
+    """
+    Test class to run unit tests on the binary results format.
+    """
+
+    results = [
+        'Lions 3, Snakes 3',
+        'Tarantulas 1, FC Awesome 0',
+        'Lions 1, FC Awesome 1',
+        'Tarantulas 3, Snakes 1',
+        'Lions 4, Grouches 0'
+    ]
+
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.source_file_full = os.path.join(self.test_dir, "test_file.txt")
+        self.binary_file_full = os.path.join(self.test_dir, "test_file.rnk")
+        self._write_results(self.results)
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def _write_results(self, results):
+        with open(self.source_file_full, 'w') as file_handler:
+            file_handler.write("".join(result + "\n" for result in results))
+
+    def test_convert_load(self):
+
+        self.assertEqual(rank_binary.convert(self.source_file_full, self.binary_file_full), (5, 5))
+
+        names, records = rank_binary.load(self.binary_file_full)
+        self.assertEqual(names, ['Lions', 'Snakes', 'Tarantulas', 'FC Awesome', 'Grouches'])
+        self.assertEqual(records.typecode, 'H')
+        self.assertEqual(records.tolist(), [0, 1, 3, 3, 2, 3, 1, 0, 0, 3, 1, 1, 2, 1, 3, 1, 0, 4, 4, 0])
+
+        # Only the binary file is recognised as such.
+        self.assertTrue(calculate_rank._is_binary_file(self.binary_file_full))
+        self.assertFalse(calculate_rank._is_binary_file(self.source_file_full))
+
+        # Too large for 16 bits: the records are widened.
+        self._write_results(['Lions 70000, Snakes 3'])
+        rank_binary.convert(self.source_file_full, self.binary_file_full)
+        names, records = rank_binary.load(self.binary_file_full)
+        self.assertEqual(records.typecode, 'I')
+        self.assertEqual(records.tolist(), [0, 1, 70000, 3])
+
+        # Also when only a later chunk of lines needs it.
+        with patch('rank_binary.ENCODE_CHUNK_LINES', 1):
+            names, records = rank_binary.encode(['Lions 1, Snakes 3', 'Snakes 70000, Lions 2'])
+        self.assertEqual(records.typecode, 'I')
+        self.assertEqual(records.tolist(), [0, 1, 1, 3, 1, 0, 70000, 2])
+
+        for results in (['Lions -1, Snakes 3'], ['Lions 1, Snakes 5000000000']):
+            self.assertRaises(rank_binary.BinaryFormatError, rank_binary.encode, results)
+        self._write_results([])
+        self.assertRaises(calculate_rank.EmptyResults, rank_binary.convert, self.source_file_full,
+                          self.binary_file_full)
+
+    def test_determine_points(self):
+
+        rank_binary.convert(self.source_file_full, self.binary_file_full)
+        expected_result = calculate_rank._determine_points(self.results)
+
+        result = rank_binary.determine_points(*rank_binary.load(self.binary_file_full))
+        self.assertEqual(dict(result.items()), expected_result)
+
+        if numpy_engine is not None:
+            result = numpy_engine.determine_record_points(*rank_binary.load(self.binary_file_full))
+            self.assertEqual(result, expected_result)
+
+    def test_rank_file(self):
+
+        # The ranking of a binary file must be exactly that of its text file, whatever the engine.
+        calculate_rank.rank_file(self.source_file_full, "text_results.txt")
+        with open(os.path.join(self.test_dir, "text_results.txt")) as file_handler:
+            expected_result = file_handler.read()
+
+        rank_binary.convert(self.source_file_full, self.binary_file_full)
+        engines = calculate_rank.ENGINES if numpy_engine is not None else ('python', 'compact')
+        for engine in engines:
+            output = calculate_rank.rank_file(self.binary_file_full, "binary_results.txt", engine=engine)
+            with open(output) as file_handler:
+                self.assertEqual(file_handler.read(), expected_result, "Ranking differs for engine " + engine)
+
+    def test_command_line(self):
+
+        # Run as a script, "calculate_rank" is "__main__". The ranking must still take the records built by
+        # "rank_binary" for what they are.
+        script = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "calculate_rank.py")
+        rank_binary.convert(self.source_file_full, self.binary_file_full)
+
+        expected_results = {
+            '--details': '1. Tarantulas, 6 pts (W 2, D 0, L 0, GF 4, GA 1, GD +3)\n'
+                         '2. Lions, 5 pts (W 1, D 2, L 0, GF 8, GA 4, GD +4)\n'
+                         '3. FC Awesome, 1 pt (W 0, D 1, L 1, GF 1, GA 2, GD -1)\n'
+                         '3. Snakes, 1 pt (W 0, D 1, L 1, GF 4, GA 6, GD -2)\n'
+                         '5. Grouches, 0 pts (W 0, D 0, L 1, GF 0, GA 4, GD -4)\n',
+            '--tiebreak=points,goal_difference': '1. Tarantulas, 6 pts\n2. Lions, 5 pts\n3. FC Awesome, 1 pt\n'
+                                                 '4. Snakes, 1 pt\n5. Grouches, 0 pts\n'
+        }
+        for option, expected_result in expected_results.items():
+            subprocess.run([sys.executable, script, "-f", self.binary_file_full, "--no-cache", option], check=True,
+                           stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+            with open(os.path.join(self.test_dir, "rank_results.txt")) as file_handler:
+                self.assertEqual(file_handler.read(), expected_result, "Ranking differs for " + option)
+
+    def test_damaged(self):
+
+        rank_binary.convert(self.source_file_full, self.binary_file_full)
+        with open(self.binary_file_full, 'rb') as file_handler:
+            data = file_handler.read()
+
+        # Truncated records, truncated header.
+        for size in (len(data) - 1, 6):
+            with open(self.binary_file_full, 'wb') as file_handler:
+                file_handler.write(data[:size])
+            self.assertRaises(rank_binary.BinaryFormatError, rank_binary.load, self.binary_file_full)
@@ -0,0 +1,99 @@
+from unittest.mock import patch
+import os
+import shutil
+import tempfile
+import unittest
+
+import calculate_rank
+import rank_cache
+
+
+class TestRankCache(unittest.TestCase):
+    """
+    Test class to run unit tests on the ranking cache.
+    """
+
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.cache_dir = os.path.join(self.test_dir, "cache")
+        self.source_file_full = os.path.join(self.test_dir, "test_file.txt")
+        with open(self.source_file_full, 'w') as file_handler:
+            file_handler.write('Lions 3, Snakes 3\nTarantulas 1, FC Awesome 0\n')
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def test_key(self):
+
+        cache = rank_cache.RankCache(self.cache_dir)
+
+        for strong in (False, True):
+            key = cache.key(self.source_file_full, strong=strong, top_n=None)
+            self.assertEqual(key, cache.key(self.source_file_full, strong=strong, top_n=None))
+            self.assertNotEqual(key, cache.key(self.source_file_full, strong=strong, top_n=3))
+
+        # Same size, same modified time, other content: only the strong key notices.
+        os.utime(self.source_file_full, (1000000, 1000000))
+        weak_key = cache.key(self.source_file_full)
+        strong_key = cache.key(self.source_file_full, strong=True)
+        with open(self.source_file_full, 'w') as file_handler:
+            file_handler.write('Lions 3, Snakes 4\nTarantulas 1, FC Awesome 0\n')
+        os.utime(self.source_file_full, (1000000, 1000000))
+
+        self.assertEqual(weak_key, cache.key(self.source_file_full))
+        self.assertNotEqual(strong_key, cache.key(self.source_file_full, strong=True))
+
+    def test_get_put_evict(self):
+
+        # Room for two entries of this size, not three.
+        lines = ['1. Tarantulas, 3 pts', '2. FC Awesome, 0 pts']
+        entry_size = len("".join(line + "\n" for line in lines))
+        cache = rank_cache.RankCache(self.cache_dir, max_bytes=entry_size * 2)
+
+        self.assertIsNone(cache.get('first'))
+        cache.put('first', lines)
+        cache.put('second', lines)
+        self.assertEqual(cache.get('first'), lines)
+
+        # "first" was used last, so "second" is the one to go.
+        path = os.path.join(self.cache_dir, 'second' + rank_cache.CACHE_SUFFIX)
+        os.utime(path, (1, 1))
+        cache.put('third', lines)
+
+        self.assertEqual(cache.get('first'), lines)
+        self.assertIsNone(cache.get('second'))
+        self.assertEqual(cache.get('third'), lines)
+
+    def test_rank_file_cached(self):
+
+        # First run ranks and fills the cache. Second run must not read or rank anything.
+        cache = rank_cache.RankCache(self.cache_dir)
+        output = calculate_rank.rank_file(self.source_file_full, "rank_results.txt", cache=cache)
+        with open(output) as file_handler:
+            expected_result = file_handler.read()
+        os.remove(output)
+
+        with patch('calculate_rank._read_file') as rf_mock, \
+                patch('calculate_rank._determine_points') as dp_mock, \
+                patch('calculate_rank._rank_results') as rr_mock:
+            calculate_rank.rank_file(self.source_file_full, "rank_results.txt", cache=cache)
+
+        self.assertFalse(rf_mock.called or dp_mock.called or rr_mock.called, "Cached ranking was not used.")
+        with open(output) as file_handler:
+            self.assertEqual(file_handler.read(), expected_result)
+
+    def test_rank_file_incremental(self):
+
+        # Incremental runs keep their state up to date, also when the results file is already in the cache.
+        cache = rank_cache.RankCache(self.cache_dir)
+        calculate_rank.rank_file(self.source_file_full, "rank_results.txt", cache=cache)
+        state_file_full = os.path.join(self.test_dir, "rank_results.txt" + calculate_rank.STATE_SUFFIX)
+
+        for _ in range(2):
+            os.remove(os.path.join(self.test_dir, "rank_results.txt"))
+            output = calculate_rank.rank_file(self.source_file_full, "rank_results.txt", cache=cache, incremental=True)
+            self.assertEqual(calculate_rank._load_state(state_file_full)[0], os.path.getsize(self.source_file_full))
+
+        with open(output) as file_handler:
+            self.assertEqual(file_handler.read(),
+                             '1. Tarantulas, 3 pts\n2. Lions, 1 pt\n2. Snakes, 1 pt\n4. FC Awesome, 0 pts\n')
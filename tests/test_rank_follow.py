@@ -0,0 +1,186 @@
+from unittest.mock import patch
+import os
+import shutil
+import tempfile
+import unittest
+
+import calculate_rank
+import rank_follow
+
+
+class FakeTime(object):
+    """
+    Clock that only moves when slept on, so debouncing can be tested without waiting.
+    """
+
+    def __init__(self):
+        self.now = 0.0
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+class TestRankFollow(unittest.TestCase):
+    """
+    Test class to run unit tests on the follow mode.
+    """
+
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.source_file_full = os.path.join(self.test_dir, "test_file.txt")
+        self.output_full = os.path.join(self.test_dir, "rank_results.txt")
+        self._append("Lions 3, Snakes 3\n")
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def _append(self, text, mode='a'):
+        with open(self.source_file_full, mode) as file_handler:
+            file_handler.write(text)
+
+    def _read(self):
+        with open(self.output_full) as file_handler:
+            return file_handler.read()
+
+    def test_results_tail(self):
+
+        tail = rank_follow.ResultsTail(self.source_file_full)
+        try:
+            self.assertEqual(tail.read_lines(), (['Lions 3, Snakes 3'], False))
+            self.assertEqual(tail.read_lines(), ([], False))
+
+            # A half written line waits for its newline.
+            self._append("Tarantulas 1, FC")
+            self.assertEqual(tail.read_lines(), ([], False))
+            self._append(" Awesome 0\n\nLions 1, FC Awesome 1\n")
+            self.assertEqual(tail.read_lines(), (['Tarantulas 1, FC Awesome 0', 'Lions 1, FC Awesome 1'], False))
+
+            # Truncated, then rewritten with different content: read from the start again.
+            self._append("Alpha 1, Beta 0\n", 'w')
+            self.assertEqual(tail.read_lines(), (['Alpha 1, Beta 0'], True))
+            self._append("Alpha 2, Beta 0\nAlpha 3, Beta 0\n", 'w')
+            self.assertEqual(tail.read_lines(), (['Alpha 2, Beta 0', 'Alpha 3, Beta 0'], True))
+
+            # Replaced by another file.
+            replacement = os.path.join(self.test_dir, "replacement.txt")
+            with open(replacement, 'w') as file_handler:
+                file_handler.write("Zeta 1, Beta 0\n")
+            os.replace(replacement, self.source_file_full)
+            self.assertEqual(tail.read_lines(), (['Zeta 1, Beta 0'], True))
+
+            # Missing for a while (rotated): nothing changes until it is back.
+            state = tail.state()
+            os.remove(self.source_file_full)
+            self.assertEqual(tail.state(), state)
+            self.assertEqual(tail.read_lines(), ([], False))
+            self._append("Alpha 1, Beta 1\n", 'w')
+            self.assertEqual(tail.read_lines(), (['Alpha 1, Beta 1'], True))
+        finally:
+            tail.close()
+
+    def test_follow(self):
+
+        fake_time = FakeTime()
+        polls = []
+        written = []
+
+        # One poll a second, two quiet seconds before a burst is ranked.
+        appends = {
+            2: "Tarantulas 1, FC Awesome 0\n",
+            3: "Lions 1, FC Awesome 1\n",       # Same burst.
+            4: "Tarantulas 3, Snakes 1\n",      # Same burst.
+            10: "Lions 4, Grouches",            # Half a line: nothing to rank yet.
+            15: " 0\n",
+        }
+
+        def stop():
+            polls.append(fake_time.now)
+            if len(polls) in appends:
+                self._append(appends[len(polls)])
+            return len(polls) > 25
+
+        def report(new_lines, write_file_name):
+            written.append((len(polls), new_lines, self._read()))
+
+        with patch('rank_follow.time', fake_time):
+            rank_follow.follow(self.source_file_full, "rank_results.txt", poll_interval=1.0, debounce=2.0, stop=stop,
+                               report=report)
+
+        # Written straight away, then once per settled burst.
+        self.assertEqual(written, [
+            (1, 1, "1. Lions, 1 pt\n1. Snakes, 1 pt\n"),
+            (6, 3, "1. Tarantulas, 6 pts\n2. Lions, 2 pts\n3. FC Awesome, 1 pt\n3. Snakes, 1 pt\n"),
+            (17, 1, "1. Tarantulas, 6 pts\n2. Lions, 5 pts\n3. FC Awesome, 1 pt\n3. Snakes, 1 pt\n"
+                    "5. Grouches, 0 pts\n")
+        ])
+
+    def test_follow_unchanged(self):
+
+        self._append("Lions 2, Snakes 0\n")
+        fake_time = FakeTime()
+        polls = []
+        written = []
+
+        def stop():
+            polls.append(fake_time.now)
+            if len(polls) == 2:
+                # Well below the top of the table.
+                self._append("Alpha 0, Beta 0\n")
+            return len(polls) > 10
+
+        with patch('rank_follow.time', fake_time):
+            rank_follow.follow(self.source_file_full, "rank_results.txt", top_n=1, poll_interval=1.0, debounce=2.0,
+                               stop=stop, report=lambda new_lines, name: written.append(new_lines))
+
+        # The top of the table did not change, so it was not written again.
+        self.assertEqual(written, [2])
+        self.assertEqual(self._read(), "1. Lions, 4 pts\n")
+
+        calculate_rank._write_file(self.source_file_full + ".gz", ["Lions 3, Snakes 3"], 'gz')
+        self.assertRaises(ValueError, rank_follow.follow, self.source_file_full + ".gz", "rank_results.txt")
+
+    def test_follow_details(self):
+
+        self._append("Lions 2, Snakes 0\nLions 1, Beta 0\n")
+        fake_time = FakeTime()
+        polls = []
+        written = []
+
+        def stop():
+            polls.append(fake_time.now)
+            if len(polls) == 2:
+                # The leader keeps the top spot, but its record changes.
+                self._append("Lions 0, Alpha 1\n")
+            return len(polls) > 10
+
+        with patch('rank_follow.time', fake_time):
+            rank_follow.follow(self.source_file_full, "rank_results.txt", top_n=1, details=True, poll_interval=1.0,
+                               debounce=2.0, stop=stop, report=lambda new_lines, name: written.append(new_lines))
+
+        self.assertEqual(written, [3, 1])
+        self.assertEqual(self._read(), "1. Lions, 7 pts (W 2, D 1, L 1, GF 6, GA 4, GD +2)\n")
+
+    def test_follow_rotated(self):
+
+        fake_time = FakeTime()
+        polls = []
+        written = []
+
+        def stop():
+            polls.append(fake_time.now)
+            if len(polls) == 2:
+                os.rename(self.source_file_full, self.source_file_full + ".1")
+            elif len(polls) == 6:
+                self._append("Alpha 1, Beta 0\n", 'w')
+            return len(polls) > 12
+
+        with patch('rank_follow.time', fake_time):
+            rank_follow.follow(self.source_file_full, "rank_results.txt", poll_interval=1.0, debounce=2.0, stop=stop,
+                               report=lambda new_lines, name: written.append(new_lines))
+
+        # Still following once the file is back, which is read from the start.
+        self.assertEqual(written, [1, 1])
+        self.assertEqual(self._read(), "1. Alpha, 3 pts\n2. Beta, 0 pts\n")
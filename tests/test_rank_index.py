@@ -0,0 +1,73 @@
+import random
+import unittest
+
+import calculate_rank
+import rank_index
+
+
+class TestRankIndex(unittest.TestCase):
+    """
+    Test class to run unit tests on the order maintaining RankingIndex.
+    """
+
+    def test_ranking_index(self):
+
+        # Sample input (from brief), one match at a time.
+        index = rank_index.RankingIndex()
+        for result in ['Lions 3, Snakes 3', 'Tarantulas 1, FC Awesome 0', 'Lions 1, FC Awesome 1',
+                       'Tarantulas 3, Snakes 1', 'Lions 4, Grouches 0']:
+            index.add_results([result])
+
+        self.assertEqual(index.lines(), [
+            '1. Tarantulas, 6 pts',
+            '2. Lions, 5 pts',
+            '3. FC Awesome, 1 pt',
+            '3. Snakes, 1 pt',
+            '5. Grouches, 0 pts'
+        ])
+
+        self.assertEqual(index.rank('Tarantulas'), 1)
+        self.assertEqual(index.rank('Snakes'), 3)
+        self.assertEqual(index.rank('Grouches'), 5)
+
+        # Slices keep the shared rank of teams tied with teams before the slice.
+        self.assertEqual(index.ranking(4, 5), [(3, 'Snakes', 1), (5, 'Grouches', 0)])
+        self.assertEqual(index.ranking(5, 10), [(5, 'Grouches', 0)])
+        self.assertEqual(index.ranking(6, 10), [])
+        self.assertEqual(index.top(3), index.ranking(1, 4))
+        self.assertEqual(index.top(0), [])
+
+        # Points change. Snakes move up.
+        index.add_points('Snakes', 5)
+        self.assertEqual(index.lines(1, 3), ['1. Snakes, 6 pts', '1. Tarantulas, 6 pts', '3. Lions, 5 pts'])
+        self.assertEqual(index.rank('Tarantulas'), 1)
+
+    def test_ranking_index_random(self):
+
+        # Many random updates. The index must agree with a full sort after every single one.
+        generator = random.Random(11)
+        names = ['Team {}'.format(number) for number in range(60)]
+        points = {}
+        index = rank_index.RankingIndex()
+
+        for _ in range(600):
+            team = generator.choice(names)
+            if generator.random() < 0.8:
+                index.add_points(team, generator.choice((0, 1, 3)))
+            else:
+                index.set_points(team, generator.randint(0, 20))
+            points[team] = index.points[team]
+
+            expected_lines = calculate_rank._sort_results(points)
+            self.assertEqual(index.lines(), expected_lines)
+
+            top_n = generator.randint(1, len(points))
+            self.assertEqual(index.lines(*[1, len(index.top(top_n))]),
+                             calculate_rank._sort_results(points, top_n=top_n))
+
+            for team_name in generator.sample(sorted(points), min(3, len(points))):
+                expected_rank = [line for line in expected_lines if line.split('. ', 1)[1].startswith(team_name + ',')]
+                self.assertEqual(index.rank(team_name), int(expected_rank[0].split('.')[0]))
+
+        # Built straight from a points dictionary too.
+        self.assertEqual(rank_index.RankingIndex(points).lines(), calculate_rank._sort_results(points))
@@ -0,0 +1,86 @@
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+
+import calculate_rank
+import rank_binary
+import rank_matchday
+
+
+class TestRankMatchday(unittest.TestCase):
+    """
+    Test class to run unit tests on the matchday index.
+    """
+
+    results = [
+        'Lions 3, Snakes 3',
+        'Tarantulas 1, FC Awesome 0',
+        'Lions 1, FC Awesome 1',
+        'Tarantulas 3, Snakes 1',
+        'Lions 4, Grouches 0'
+    ]
+
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.source_file_full = os.path.join(self.test_dir, "test_file.txt")
+        with open(self.source_file_full, 'w') as file_handler:
+            file_handler.write("".join(result + "\n" for result in self.results))
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def test_points(self):
+
+        # Five teams: two matches per matchday, the last matchday is short.
+        index = rank_matchday.build_index(self.results)
+        self.assertEqual((index.matchday_size, index.matchdays), (2, 3))
+
+        # Every window must match the points of exactly its matches, parsed from scratch.
+        for first in range(1, 4):
+            for last in range(first, 4):
+                matches = self.results[(first - 1) * 2:last * 2]
+                expected_result = calculate_rank._determine_points(matches)
+                played = calculate_rank._determine_points(self.results[:last * 2])
+                expected_result.update((team, 0) for team in played if team not in expected_result)
+                self.assertEqual(index.points(first, last), expected_result,
+                                 "Unexpected points for matchdays {} to {}".format(first, last))
+
+        # Grouches only play on matchday 3.
+        self.assertEqual(index.as_of(2), {'Lions': 2, 'Snakes': 1, 'Tarantulas': 6, 'FC Awesome': 1})
+        self.assertEqual(index.as_of(99), calculate_rank._determine_points(self.results))
+        self.assertEqual(index.ranking(2, 3, top_n=1), [(1, 'Lions', 4)])
+
+        self.assertRaises(ValueError, index.points, 0, 2)
+        self.assertRaises(ValueError, index.points, 3, 2)
+        self.assertRaises(calculate_rank.MatchdayRange, index.points, 4, 9)
+        self.assertRaises(ValueError, rank_matchday.build_index, self.results, 0)
+        self.assertRaises(calculate_rank.EmptyResults, rank_matchday.build_index, [])
+
+    def test_rank_file(self):
+
+        binary_file_full = os.path.join(self.test_dir, "test_file.rnk")
+        rank_binary.convert(self.source_file_full, binary_file_full)
+
+        # Text and binary results files alike. Snakes played on matchday 1 - still in the table, without points.
+        for source_file_full in (self.source_file_full, binary_file_full):
+            output = calculate_rank.rank_file(source_file_full, "rank_results.txt", matchdays=(2, 3), matchday_size=1)
+            with open(output) as file_handler:
+                self.assertEqual(file_handler.read(),
+                                 "1. Tarantulas, 3 pts\n2. FC Awesome, 1 pt\n2. Lions, 1 pt\n4. Snakes, 0 pts\n")
+
+        self.assertRaises(ValueError, calculate_rank.rank_file, self.source_file_full, "rank_results.txt",
+                          matchdays=(1, 2), details=True)
+        self.assertRaises(calculate_rank.MatchdayRange, calculate_rank.rank_file, self.source_file_full,
+                          "rank_results.txt", matchdays=(5, 9))
+
+    def test_command_line(self):
+
+        # Matchdays past the end of the results are an input error, reported without a traceback.
+        script = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "calculate_rank.py")
+        process = subprocess.run([sys.executable, script, "-f", self.source_file_full, "--no-cache", "--window", "5:9"],
+                                 stdout=subprocess.PIPE, stderr=subprocess.PIPE, universal_newlines=True)
+        self.assertEqual(process.returncode, 1)
+        self.assertEqual(process.stderr, "error: No matchday 5 in 3 matchday(s) of results\n")
@@ -0,0 +1,80 @@
+from http.client import HTTPConnection
+import threading
+import unittest
+
+import rank_server
+
+
+class TestRankServer(unittest.TestCase):
+    """
+    Test class to run unit tests on the ranking server.
+    """
+
+    def test_league(self):
+
+        # Results are added in batches. The ranking must match what the file based pipeline would write.
+        league = rank_server.League("Premier")
+        league.add_results(['Lions 3, Snakes 3', 'Tarantulas 1, FC Awesome 0'])
+        league.add_results(['Lions 1, FC Awesome 1', 'Tarantulas 3, Snakes 1', 'Lions 4, Grouches 0'])
+
+        self.assertEqual(
+            league.ranking(),
+            b'1. Tarantulas, 6 pts\n2. Lions, 5 pts\n3. FC Awesome, 1 pt\n3. Snakes, 1 pt\n5. Grouches, 0 pts\n')
+
+        # Top N includes every team tied at the cutoff.
+        self.assertEqual(league.ranking(1), b'1. Tarantulas, 6 pts\n')
+        self.assertEqual(league.ranking(3),
+                         b'1. Tarantulas, 6 pts\n2. Lions, 5 pts\n3. FC Awesome, 1 pt\n3. Snakes, 1 pt\n')
+        self.assertEqual(league.ranking(0), b'')
+
+    def test_server(self):
+
+        # Full round trip over HTTP, on any free port.
+        server = rank_server.RankingServer(("127.0.0.1", 0))
+        thread = threading.Thread(target=server.serve_forever)
+        thread.daemon = True
+        thread.start()
+
+        def request(method, path, body=None, headers={}):
+            connection = HTTPConnection("127.0.0.1", server.server_address[1], timeout=5)
+            try:
+                connection.request(method, path, body, headers)
+                response = connection.getresponse()
+                return response.status, response.read()
+            finally:
+                connection.close()
+
+        try:
+            self.assertEqual(request("GET", "/leagues/Premier/ranking")[0], 404)
+
+            self.assertEqual(request("POST", "/leagues/Premier/results", "Alpha 10, Zeta 9\nAlpha 2, Zeta 12\n"),
+                             (200, b'2 result(s) added\n'))
+            self.assertEqual(request("GET", "/leagues/Premier/ranking"), (200, b'1. Alpha, 3 pts\n1. Zeta, 3 pts\n'))
+            self.assertEqual(request("GET", "/leagues/Premier/ranking?top_n=1"),
+                             (200, b'1. Alpha, 3 pts\n1. Zeta, 3 pts\n'))
+
+            # A badly formed post changes nothing.
+            self.assertEqual(request("POST", "/leagues/Premier/results", "Alpha 1, Zeta 0\nnonsense\n")[0], 400)
+            self.assertEqual(request("GET", "/leagues/Premier/ranking"), (200, b'1. Alpha, 3 pts\n1. Zeta, 3 pts\n'))
+
+            for result in ("3, Zeta 4", "Alpha 1, Zeta 0, Extra 2", "Alpha 1_0, Zeta 0", "Alpha  1, Zeta 0",
+                           "Alpha 1, Zeta -1"):
+                self.assertEqual(request("POST", "/leagues/Premier/results", result + "\n")[0], 400,
+                                 "Accepted {!r}".format(result))
+            self.assertEqual(request("POST", "/leagues/Premier/results", b"Alpha 1, Z\xffta 0\n")[0], 400)
+            self.assertEqual(request("POST", "/leagues/Premier/results", "", {"Content-Length": "x"})[0], 400)
+            server.max_body_size = 64
+            self.assertEqual(request("POST", "/leagues/Premier/results", "Alpha 1, Zeta 0\n" * 5)[0], 413)
+            server.max_body_size = rank_server.MAX_BODY_SIZE
+            self.assertEqual(request("GET", "/leagues/Premier/ranking"), (200, b'1. Alpha, 3 pts\n1. Zeta, 3 pts\n'))
+
+            # League names are URL encoded in the path.
+            self.assertEqual(request("POST", "/leagues/Premier%20League/results", "Alpha 1, Zeta 0\n")[0], 200)
+            self.assertEqual(request("GET", "/leagues/Premier%20League/ranking"),
+                             (200, b'1. Alpha, 3 pts\n2. Zeta, 0 pts\n'))
+
+            self.assertEqual(request("GET", "/leagues"), (200, b'Premier\nPremier League\n'))
+            self.assertEqual(request("GET", "/leagues/Premier/ranking?top_n=x")[0], 400)
+        finally:
+            server.shutdown()
+            server.server_close()
@@ -0,0 +1,67 @@
+from unittest.mock import patch
+import os
+import random
+import shutil
+import tempfile
+import unittest
+
+import calculate_rank
+import rank_spill
+
+
+class TestRankSpill(unittest.TestCase):
+    """
+    Test class to run unit tests on the spill to disk points aggregation.
+    """
+
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.source_file_full = os.path.join(self.test_dir, "test_file.txt")
+
+        # Plenty of teams, plenty of ties.
+        generator = random.Random(7)
+        teams = ["Team {}".format(team) for team in range(300)]
+        self.results = ["{} {}, {} {}".format(home, generator.randint(0, 3), away, generator.randint(0, 3))
+                        for home, away in (generator.sample(teams, 2) for _ in range(2000))]
+        with open(self.source_file_full, 'w') as file_handler:
+            file_handler.write("".join(result + "\n" for result in self.results))
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def test_ranking(self):
+
+        points = calculate_rank._determine_points(self.results)
+
+        # Room for 20 teams: every bucket overflows and is partitioned again. Two runs per merge: several passes.
+        with patch('rank_spill.MAX_MERGE_RUNS', 2):
+            with rank_spill.SpilledPoints(self.results, 20 * rank_spill.TEAM_BYTES, self.test_dir) as spilled:
+                self.assertEqual(len(spilled), len(points))
+                self.assertLessEqual(len(spilled.runs), 2)
+                for top_n in (None, 0, 1, 7, 1000):
+                    self.assertEqual(list(spilled.ranking(top_n)), calculate_rank._rank_results(points, top_n=top_n),
+                                     "Unexpected ranking for top {}".format(top_n))
+                self.assertEqual(dict(spilled.items()), points)
+
+        # Nothing is left behind.
+        self.assertEqual(os.listdir(self.test_dir), ["test_file.txt"])
+
+        # All teams fit: a single spill, same ranking.
+        with rank_spill.SpilledPoints(iter(self.results), 1024 * 1024) as spilled:
+            self.assertEqual(list(spilled.ranking()), calculate_rank._rank_results(points))
+
+        self.assertRaises(calculate_rank.EmptyResults, rank_spill.SpilledPoints, [], 1024)
+
+    def test_rank_file(self):
+
+        calculate_rank.rank_file(self.source_file_full, "expected_results.txt")
+        with open(os.path.join(self.test_dir, "expected_results.txt")) as file_handler:
+            expected_result = file_handler.read()
+
+        output = calculate_rank.rank_file(self.source_file_full, "rank_results.txt",
+                                          memory_limit=20 * rank_spill.TEAM_BYTES)
+        with open(output) as file_handler:
+            self.assertEqual(file_handler.read(), expected_result)
+
+        self.assertRaises(ValueError, calculate_rank.rank_file, self.source_file_full, "rank_results.txt",
+                          memory_limit=1024, details=True)
@@ -0,0 +1,55 @@
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+import calculate_rank
+import rank_stats
+
+
+class TestRankStats(unittest.TestCase):
+    """
+    Test class to run unit tests on the pipeline instrumentation.
+    """
+
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.source_file_full = os.path.join(self.test_dir, "test_file.txt")
+        with open(self.source_file_full, 'w') as file_handler:
+            file_handler.write('Lions 3, Snakes 3\nTarantulas 1, FC Awesome 0\nLions 1, FC Awesome 1\n'
+                               'Tarantulas 3, Snakes 1\nLions 4, Grouches 0\n')
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def test_pipeline_stats(self):
+
+        # Every stage is timed and reported to the hook. Counters are the same whichever reader is used.
+        expected_counters = {'lines_read': 5, 'teams_seen': 5, 'draws': 2, 'output_bytes': 92}
+
+        for options, expected_stages in (
+                ({}, ['read_file', 'determine_points', 'sort_results', 'write_file']),
+                ({'stream': True}, ['determine_points', 'sort_results', 'write_file']),
+                ({'stream': True, 'engine': 'compact'}, ['determine_points', 'sort_results', 'write_file'])):
+            hooked = []
+            stats = rank_stats.PipelineStats(callback=lambda name, wall, cpu: hooked.append(name))
+            calculate_rank.rank_file(self.source_file_full, "rank_results.txt", stats=stats, **options)
+
+            self.assertEqual([stage[0] for stage in stats.stages], expected_stages)
+            self.assertEqual(hooked, expected_stages)
+            self.assertEqual(stats.counters, expected_counters)
+
+        # Both report formats.
+        report = json.loads(stats.report('json'))
+        self.assertEqual(report['counters'], expected_counters)
+        self.assertEqual([stage['stage'] for stage in report['stages']], expected_stages)
+
+        text = stats.report()
+        self.assertTrue(text.startswith('stage'))
+        self.assertIn('draws: 2\n', text)
+
+        # Sharded runs do not know their line count. Only what is known is reported.
+        stats = rank_stats.PipelineStats()
+        calculate_rank.rank_file(self.source_file_full, "rank_results.txt", stats=stats, workers=2)
+        self.assertEqual(stats.counters, {'teams_seen': 5, 'output_bytes': 92})